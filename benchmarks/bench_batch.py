@@ -0,0 +1,44 @@
+"""
+Batch parsing throughput benchmark.
+
+Writes a corpus of synthetic models to a temporary directory and parses it
+with `parse_many` for an increasing number of worker processes.
+
+    PYTHONPATH=src python benchmarks/bench_batch.py [files] [vars_per_file]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from py_nusmv_parser import parse_many
+
+from bench_parse_scaling import make_model
+
+
+def main(files=200, n_vars=500):
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(files):
+            path = os.path.join(tmp, f"model_{i}.smv")
+            with open(path, "w") as f:
+                f.write(make_model(n_vars))
+            paths.append(path)
+
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            results = list(parse_many(paths, workers=workers))
+            elapsed = time.perf_counter() - start
+            assert all(r.error is None for r in results)
+            baseline = baseline or elapsed
+            print(
+                f"{workers:>3} workers  {elapsed:7.2f}s  {files / elapsed:8.1f} files/s"
+                f"  speedup {baseline / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
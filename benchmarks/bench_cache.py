@@ -0,0 +1,43 @@
+"""
+AST cache benchmark.
+
+Compares a fresh parse with a cache hit on the same source, and reports the
+size of the cached entry.
+
+    PYTHONPATH=src python benchmarks/bench_cache.py [vars]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.cache import ASTCache
+
+from bench_parse_scaling import make_model
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_vars=5_000):
+    source = make_model(n_vars)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ASTCache(tmp)
+        cache.parse_string(source)
+        parse = best_of(lambda: parse_nusmv_string(source))
+        hit = best_of(lambda: cache.parse_string(source))
+        size = os.path.getsize(cache._path(cache.key(source)))
+    print(f"source {len(source):>10} bytes  cache entry {size:>10} bytes")
+    print(f"parse  {parse * 1000:9.2f} ms")
+    print(f"hit    {hit * 1000:9.2f} ms  ({parse / hit:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,46 @@
+"""
+Binary codec versus JSON benchmark.
+
+Compares the size and encode/decode time of `codec.dumps`/`codec.loads`
+with the JSON path (`to_dict` + `json.dumps`, `json.loads` + `from_dict`).
+
+    PYTHONPATH=src python benchmarks/bench_codec.py [vars]
+"""
+
+import json
+import sys
+import zlib
+
+from py_nusmv_parser import codec, parse_nusmv_string
+from py_nusmv_parser.models import from_dict
+
+from bench_parse_scaling import make_model
+from bench_serialize import best_of
+
+
+def main(n_vars=20_000):
+    module = parse_nusmv_string(make_model(n_vars))
+    binary = codec.dumps(module)
+    text = json.dumps(module.to_dict()).encode()
+    assert codec.loads(binary).to_dict() == from_dict(json.loads(text)).to_dict()
+
+    rows = [
+        (
+            "json",
+            text,
+            lambda: json.dumps(module.to_dict()).encode(),
+            lambda: from_dict(json.loads(text)),
+        ),
+        ("codec", binary, lambda: codec.dumps(module), lambda: codec.loads(binary)),
+    ]
+    for name, data, encode, decode in rows:
+        print(
+            f"{name:>6}  {len(data) / 1024:9.1f} KiB"
+            f"  zlib {len(zlib.compress(data, 1)) / 1024:8.1f} KiB"
+            f"  encode {best_of(encode) * 1000:7.1f} ms"
+            f"  decode {best_of(decode) * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,78 @@
+"""
+Compiled expression benchmark.
+
+Evaluates a guard for a list of random states with a naive tree-walking
+interpreter and with the function from `compile_expr`, and reports the
+states per second of both and the time to compile.
+
+    PYTHONPATH=src python benchmarks/bench_compiled.py [states]
+"""
+
+import random
+import sys
+import time
+
+from bench_serialize import best_of
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.compiled import compile_expr
+
+SOURCE = """
+MODULE main
+ASSIGN
+    next(a) := case
+                   a = ready & b = busy & c : busy;
+                   a = busy & d + 1 = 3 : done;
+                   b = done & c = FALSE : ready;
+                   TRUE : a;
+               esac;
+"""
+
+LAYOUT = {"a": 0, "b": 1, "c": 2, "d": 3}
+
+NAMES = {name: name for name in ("ready", "busy", "done")}
+
+_OPS = {"&": lambda x, y: x and y, "=": lambda x, y: x == y, "+": lambda x, y: x + y}
+
+
+def interpret(expr, state):
+    match type(expr).__name__:
+        case "BinaryOperator":
+            left = interpret(expr.left, state)
+            return _OPS[expr.operator](left, interpret(expr.right, state))
+        case "Identifier":
+            position = LAYOUT.get(expr.name)
+            return expr.name if position is None else state[position]
+        case "Const":
+            return expr.value
+        case "CaseExpr":
+            for item in expr.case_body:
+                if interpret(item.condition, state):
+                    return interpret(item.expr, state)
+    raise NotImplementedError(expr)
+
+
+def main(n_states=200_000):
+    expr = parse_nusmv_string(SOURCE).body[0].assigns_list[0].expr
+    rng = random.Random(0)
+    names = list(NAMES)
+    states = [
+        (rng.choice(names), rng.choice(names), rng.random() < 0.5, rng.randrange(4))
+        for _ in range(n_states)
+    ]
+
+    start = time.perf_counter()
+    fn = compile_expr(expr, LAYOUT, NAMES)
+    compile_time = time.perf_counter() - start
+
+    expected = [interpret(expr, s) for s in states]
+    assert [fn(s) for s in states] == expected
+    naive = best_of(lambda: [interpret(expr, s) for s in states], 3)
+    compiled = best_of(lambda: [fn(s) for s in states], 3)
+    print(f"compile: {compile_time * 1e3:.2f} ms")
+    print(f"interpreter: {n_states / naive:,.0f} states/s")
+    print(f"compiled: {n_states / compiled:,.0f} states/s ({naive / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,49 @@
+"""
+Common-subexpression extraction benchmark.
+
+Generates a model where every variable repeats its guard across its
+`case` and a derived check, and reports the extraction time, the number
+of defines created and the size of the SMV text before and after.
+
+    PYTHONPATH=src python benchmarks/bench_cse.py [vars]
+"""
+
+import sys
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.cse import extract_common_subexpressions
+
+
+def make_model(n: int) -> str:
+    lines = ["MODULE main", "VAR"]
+    lines += [f"    v{i} : {{ready, busy}};" for i in range(n)]
+    lines.append("ASSIGN")
+    for i in range(n):
+        j, k = (i + 1) % n, (i + 2) % n
+        guard = f"v{j} = busy & v{k} = ready & v{i} = ready"
+        lines.append(
+            f"    next(v{i}) := case {guard} : busy;"
+            f" v{j} = busy & v{k} = ready : ready; TRUE : v{i}; esac;"
+        )
+        lines.append(f"    c{i} := ({guard}) = (v{j} = busy & v{k} = ready);")
+        lines.append(f"    d{i} := ({guard}) = (v{i} = ready);")
+    return "\n".join(lines)
+
+
+def main(n_vars=5_000):
+    module = parse_nusmv_string(make_model(n_vars))
+    before = len(module.unparse())
+    start = time.perf_counter()
+    result = extract_common_subexpressions(module, min_size=5)
+    elapsed = time.perf_counter() - start
+    after = len(result.unparse())
+    defines = len(result.symbols) - len(module.symbols)
+    print(
+        f"extracted {defines} defines in {elapsed:.2f}s: {before} -> {after} chars"
+        f" ({after / before:.0%})"
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
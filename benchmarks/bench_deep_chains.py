@@ -0,0 +1,37 @@
+"""
+Deep expression benchmark.
+
+Parses, unparses and serializes `ASSIGN x := v0 & v1 & ... ;` with up to
+100k operands, which used to overflow the Python stack.
+
+    PYTHONPATH=src python benchmarks/bench_deep_chains.py [operands ...]
+"""
+
+import sys
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(sizes=(1_000, 10_000, 100_000)):
+    for n in sizes:
+        source = (
+            "MODULE main ASSIGN x := " + " & ".join(f"v{i}" for i in range(n)) + ";"
+        )
+        module, parse = timed(lambda: parse_nusmv_string(source))
+        _, unparse = timed(module.unparse)
+        _, to_dict = timed(module.to_dict)
+        print(
+            f"{n:>8} operands  parse {parse:6.2f}s  unparse {unparse:6.2f}s"
+            f"  to_dict {to_dict:6.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or (1_000, 10_000, 100_000))
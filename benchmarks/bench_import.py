@@ -0,0 +1,42 @@
+"""
+Cold-start benchmark.
+
+Measures, in fresh interpreters, how long `import py_nusmv_parser` takes and
+how long the first `parse_nusmv_string` call takes (which builds the lexer
+and loads the LALR tables).
+
+    PYTHONPATH=src python benchmarks/bench_import.py [runs]
+"""
+import json
+import statistics
+import subprocess
+import sys
+
+SNIPPET = """
+import json, time
+t0 = time.perf_counter()
+import py_nusmv_parser
+t1 = time.perf_counter()
+py_nusmv_parser.parse_nusmv_string("MODULE main VAR a : boolean;")
+t2 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "first_parse": t2 - t1}))
+"""
+
+
+def main(runs=10):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", SNIPPET], capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(out.strip().splitlines()[-1]))
+    for key in ("import", "first_parse"):
+        values = [s[key] * 1000 for s in samples]
+        print(
+            f"{key:>12}: median {statistics.median(values):7.2f} ms"
+            f"  min {min(values):7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,48 @@
+"""
+Incremental re-parse latency benchmark.
+
+Builds a model with many small VAR/ASSIGN sections and compares a full
+re-parse with `IncrementalParse.edit` for a one-character edit.
+
+    PYTHONPATH=src python benchmarks/bench_incremental.py [sections]
+"""
+import sys
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.incremental import parse_incremental
+
+
+def make_model(sections: int) -> str:
+    lines = ["MODULE main"]
+    for s in range(sections):
+        lines.append("VAR")
+        lines += [f"    v{s}_{i} : {{ready, busy}};" for i in range(10)]
+        lines.append("ASSIGN")
+        lines += [f"    init(v{s}_{i}) := ready;" for i in range(10)]
+    return "\n".join(lines)
+
+
+def main(sizes=(100, 1_000, 5_000)):
+    for sections in sizes:
+        source = make_model(sections)
+        result = parse_incremental(source)
+
+        start = time.perf_counter()
+        parse_nusmv_string(source)
+        full = time.perf_counter() - start
+
+        offset = source.index(f"v{sections // 2}_3 :")
+        start = time.perf_counter()
+        for i in range(20):
+            result = result.edit(offset + 1, 0, "x")
+        incremental = (time.perf_counter() - start) / 20
+
+        print(
+            f"{len(source):>10} chars  full {full * 1000:9.2f} ms"
+            f"  incremental {incremental * 1000:7.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or (100, 1_000, 5_000))
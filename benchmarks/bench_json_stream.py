@@ -0,0 +1,40 @@
+"""
+Streaming JSON export benchmark.
+
+Compares `json.dumps(module.to_dict())` written to a file with
+`module.to_json(stream)`: wall time and peak memory allocated while
+producing the text.
+
+    PYTHONPATH=src python benchmarks/bench_json_stream.py [vars]
+"""
+
+import json
+import os
+import sys
+
+from py_nusmv_parser import parse_nusmv_string
+
+from bench_memory import make_reuse_model
+from bench_unparse_stream import measure
+
+
+def main(n_vars=5_000):
+    module = parse_nusmv_string(make_reuse_model(n_vars))
+    size = len(json.dumps(module.to_dict(), indent=2))
+    with open(os.devnull, "w") as devnull:
+        for label, fn in (
+            (
+                "json.dumps",
+                lambda: devnull.write(json.dumps(module.to_dict(), indent=2)),
+            ),
+            ("to_json", lambda: module.to_json(devnull, indent=2)),
+        ):
+            elapsed, peak = measure(fn)
+            print(
+                f"{label:>10}: {elapsed:6.2f}s  peak {peak / 2**20:7.2f} MiB"
+                f"  (output {size / 2**20:.2f} MiB)"
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,116 @@
+"""
+AST memory benchmark.
+
+Reports the memory held by a parsed tree, in bytes per node, for the slotted
+model classes and for an equivalent tree of plain `__dict__`-backed objects
+(the layout the model classes had before they were slotted).
+
+It then parses a model with heavy name reuse with and without interning and
+reports the memory retained by each tree and the parse time.
+
+    PYTHONPATH=src python benchmarks/bench_memory.py [vars]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.models import BasicSemantic, get_fields
+
+from bench_parse_scaling import make_model
+
+_dict_classes = {}
+
+
+def make_dict_backed(cls):
+    if cls not in _dict_classes:
+        _dict_classes[cls] = type(cls.__name__, (), {})
+    return _dict_classes[cls]()
+
+
+def make_slotted(cls):
+    return cls.__new__(cls)
+
+
+def clone(obj, make_node):
+    """
+    Copy the nodes and lists of a tree, sharing the leaf values, so that both
+    layouts are measured on exactly the same data.
+    """
+    if isinstance(obj, BasicSemantic):
+        node = make_node(type(obj))
+        for field in get_fields(type(obj)):
+            setattr(node, field, clone(getattr(obj, field), make_node))
+        return node
+    elif isinstance(obj, list):
+        return [clone(i, make_node) for i in obj]
+    else:
+        return obj
+
+
+def count_nodes(obj):
+    count, stack = 0, [obj]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, BasicSemantic):
+            count += 1
+            stack.extend(getattr(obj, f) for f in get_fields(type(obj)))
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return count
+
+
+def retained(fn):
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main(n_vars=20_000):
+    source = make_model(n_vars)
+    parse_nusmv_string("MODULE main VAR a : boolean;")  # build the parser
+    module = parse_nusmv_string(source)
+    _, slotted = retained(lambda: clone(module, make_slotted))
+    _, dict_backed = retained(lambda: clone(module, make_dict_backed))
+    nodes = count_nodes(module)
+    print(f"{nodes} nodes")
+    for label, size in (("__dict__ nodes", dict_backed), ("slotted nodes", slotted)):
+        print(f"{label:>15}: {size / nodes:7.1f} bytes/node  {size >> 20} MiB")
+
+
+def make_reuse_model(n_vars: int) -> str:
+    lines = ["MODULE main", "VAR"]
+    lines += [f"    v{i} : {{ready, busy, idle}};" for i in range(n_vars)]
+    lines.append("ASSIGN")
+    for i in range(n_vars):
+        lines.append(f"    next(v{i}) := case")
+        for j in range(10):
+            lines.append(f"        v{j} = ready & v{j + 1} = busy : idle;")
+        lines.append("        TRUE : ready;")
+        lines.append("    esac;")
+    return "\n".join(lines)
+
+
+def main_interning(n_vars=2_000):
+    source = make_reuse_model(n_vars)
+    for label, kwargs in (
+        ("plain", {}),
+        ("intern", {"intern": True}),
+        ("hash_cons", {"hash_cons": True}),
+    ):
+        _, size = retained(lambda: parse_nusmv_string(source, **kwargs))
+        start = time.perf_counter()
+        parse_nusmv_string(source, **kwargs)
+        elapsed = time.perf_counter() - start
+        print(f"{label:>15}: {size >> 20:4} MiB retained  parse {elapsed:6.2f}s")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
+    main_interning()
@@ -0,0 +1,51 @@
+"""
+Parse-time scaling benchmark.
+
+Parses synthetic models with 1k .. 200k VAR declarations (plus one ASSIGN
+line per variable) and reports the time per declaration and the fitted
+log-log slope. A slope close to 1.0 means parsing is linear in model size.
+
+    PYTHONPATH=src python benchmarks/bench_parse_scaling.py
+"""
+import math
+import sys
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+
+SIZES = [1_000, 5_000, 20_000, 50_000, 100_000, 200_000]
+
+
+def make_model(n: int) -> str:
+    lines = ["MODULE main", "VAR"]
+    for i in range(n):
+        lines.append(f"    v{i} : {{ready, busy, idle}};")
+    lines.append("ASSIGN")
+    for i in range(n):
+        lines.append(f"    init(v{i}) := ready;")
+    return "\n".join(lines)
+
+
+def main(sizes=SIZES):
+    points = []
+    for n in sizes:
+        source = make_model(n)
+        start = time.perf_counter()
+        module = parse_nusmv_string(source)
+        elapsed = time.perf_counter() - start
+        assert len(module.body[0].var_list) == n
+        points.append((n, elapsed))
+        print(f"{n:>8} decls  {elapsed:8.3f}s  {elapsed / n * 1e6:7.2f} us/decl")
+
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    slope = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum(
+        (x - mx) ** 2 for x in xs
+    )
+    print(f"log-log slope: {slope:.2f} (1.0 == linear)")
+    return slope
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,61 @@
+"""
+Reachability benchmark.
+
+Explores a model of independent counters with a free boolean input, whose
+reachable states are all 4**n counter values times the two inputs, and
+reports states per second and the memory of the visited set, with the
+bitmap and with a set of packed integers.
+
+    PYTHONPATH=src python benchmarks/bench_reachability.py [counters] [workers]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser import reachability
+from py_nusmv_parser.reachability import reachable
+
+
+def make_model(n: int) -> str:
+    lines = ["MODULE main", "VAR", "    tick : boolean;"]
+    lines += [f"    c{i} : {{0, 1, 2, 3}};" for i in range(n)]
+    lines.append("ASSIGN")
+    for i in range(n):
+        lines.append(f"    init(c{i}) := 0;")
+        lines.append(
+            f"    next(c{i}) := case tick : c{i}; c{i} = 3 : {{0, 1}};"
+            f" TRUE : c{i} + 1; esac;"
+        )
+    return "\n".join(lines)
+
+
+def run(module, workers):
+    start = time.perf_counter()
+    result = reachable(module, ["c0 = c0"], workers=workers)
+    elapsed = time.perf_counter() - start
+    # Traced separately, tracing slows the search down several times.
+    tracemalloc.start()
+    reachable(module, workers=workers)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(n=7, workers=1):
+    module = parse_nusmv_string(make_model(n))
+    expected = 2 * 4**n
+    for label, bitmap_bits in (("bitmap", 27), ("set", 0)):
+        reachability._BITMAP_BITS = bitmap_bits
+        result, elapsed, peak = run(module, workers)
+        assert result.states == expected and not result.violations, result
+        print(
+            f"{label:6} {result.states} states, depth {result.depth}:"
+            f" {elapsed:.2f} s, {result.states / elapsed:,.0f} states/s,"
+            f" peak {peak / 2**20:.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,44 @@
+"""
+Dict serialization round-trip benchmark.
+
+Compares the generic iterative walker (`to_dict_handler`) with the compiled
+per-class serializers behind `to_dict()`, and times `from_dict()` on the
+result.
+
+    PYTHONPATH=src python benchmarks/bench_serialize.py [vars]
+"""
+
+import sys
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.models import from_dict, to_dict_handler
+
+from bench_parse_scaling import make_model
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_vars=20_000):
+    module = parse_nusmv_string(make_model(n_vars))
+    data = module.to_dict()
+    assert to_dict_handler(module) == data
+    assert from_dict(data).to_dict() == data
+
+    generic = best_of(lambda: to_dict_handler(module))
+    compiled = best_of(module.to_dict)
+    load = best_of(lambda: from_dict(data))
+    print(f"to_dict_handler     {generic * 1000:8.1f} ms")
+    print(f"to_dict (compiled)  {compiled * 1000:8.1f} ms  {generic / compiled:5.2f}x")
+    print(f"from_dict           {load * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,54 @@
+"""
+Simplifier benchmark.
+
+Generates a model in the style of our generators (guards starting with
+`TRUE &`, `x = x` checks, constant offsets and unreachable `case`
+branches) and reports the simplification time and the size of the SMV
+text before and after.
+
+    PYTHONPATH=src python benchmarks/bench_simplify.py [vars]
+"""
+
+import sys
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.simplify import simplify
+
+
+def make_model(n: int) -> str:
+    lines = ["MODULE main", "VAR"]
+    lines += [f"    v{i} : {{ready, busy}};" for i in range(n)]
+    lines.append("ASSIGN")
+    for i in range(n):
+        j = (i + 1) % n
+        lines.append(
+            f"    init(v{i}) := case TRUE & v{j} = v{j} : ready; TRUE : busy; esac;"
+        )
+        lines.append(
+            f"    next(v{i}) := case"
+            f" FALSE : busy;"
+            f" TRUE & v{j} = busy & v{j} = busy : busy;"
+            f" TRUE : ready;"
+            f" v{i} = ready : busy;"
+            f" esac;"
+        )
+        lines.append(f"    c{i} := 1 + 2 + k{i} + 3;")
+    return "\n".join(lines)
+
+
+def main(n_vars=5_000):
+    module = parse_nusmv_string(make_model(n_vars))
+    before = len(module.unparse())
+    start = time.perf_counter()
+    result = simplify(module)
+    elapsed = time.perf_counter() - start
+    after = len(result.unparse())
+    print(
+        f"simplified in {elapsed:.2f}s: {before} -> {after} chars"
+        f" ({after / before:.0%})"
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,54 @@
+"""
+Simulation benchmark.
+
+Simulates a chain of handshaking components and streams the trace to a
+temporary file, and reports the run-steps per second and the trace size.
+
+    PYTHONPATH=src python benchmarks/bench_simulation.py [components] [runs] [steps]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.simulation import Simulator
+
+
+def make_model(n: int) -> str:
+    lines = ["MODULE main", "VAR"]
+    lines += [f"    s{i} : {{idle, wait, work}};" for i in range(n)]
+    lines += [f"    go{i} : boolean;" for i in range(n)]
+    lines.append("ASSIGN")
+    for i in range(n):
+        prev = f"s{i - 1}" if i else "work"
+        lines.append(f"    init(s{i}) := idle;")
+        lines.append(
+            f"    next(s{i}) := case"
+            f" s{i} = idle & go{i} : wait;"
+            f" s{i} = wait & {prev} = work : work;"
+            f" s{i} = work : {{idle, work}};"
+            f" TRUE : s{i};"
+            f" esac;"
+        )
+    return "\n".join(lines)
+
+
+def main(n=10, runs=100_000, steps=100):
+    sim = Simulator(parse_nusmv_string(make_model(n)), runs=runs, seed=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trace.bin")
+        start = time.perf_counter()
+        sim.write_trace(path, steps)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+    print(
+        f"{n} components x {runs} runs x {steps} steps in {elapsed:.2f}s:"
+        f" {runs * steps / elapsed / 1e6:.1f}M run-steps/s,"
+        f" {size / 2**20:.0f} MiB trace"
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,44 @@
+"""
+Cone-of-influence slicing benchmark.
+
+Builds a model of independent chains of variables, each reading the
+previous one, and slices it down to the last variable of one chain.
+Reports the slicing time and how much of the model is left.
+
+    PYTHONPATH=src python benchmarks/bench_slicing.py [chains] [length]
+"""
+
+import sys
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.slicing import slice_module
+
+
+def make_model(chains: int, length: int) -> str:
+    lines = ["MODULE main", "VAR"]
+    for c in range(chains):
+        lines += [f"    c{c}_{i} : boolean;" for i in range(length)]
+    lines.append("ASSIGN")
+    for c in range(chains):
+        lines.append(f"    next(c{c}_0) := c{c}_0 = FALSE;")
+        lines += [
+            f"    next(c{c}_{i}) := c{c}_{i - 1} & c{c}_{i};" for i in range(1, length)
+        ]
+    return "\n".join(lines)
+
+
+def main(chains=200, length=50):
+    module = parse_nusmv_string(make_model(chains, length))
+    start = time.perf_counter()
+    sliced = slice_module(module, [f"c{chains - 1}_{length - 1}"])
+    elapsed = time.perf_counter() - start
+    before, after = len(module.unparse()), len(sliced.unparse())
+    print(
+        f"sliced in {elapsed * 1000:.1f} ms: {len(module.symbols)} -> "
+        f"{len(sliced.symbols)} variables, {before} -> {after} chars"
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
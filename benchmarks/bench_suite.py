@@ -0,0 +1,179 @@
+"""
+Benchmark suite over synthetic models.
+
+For each model shape, measures the throughput of lexing,
+`parse_nusmv_string`, `unparse` and `to_dict`, and the peak memory each
+of them allocates. Results are written as JSON together with the commit
+they were measured on, and `--compare` prints the ratio of the times of an
+earlier results file to these.
+
+    PYTHONPATH=src python benchmarks/bench_suite.py [--output PATH] [--compare OLD]
+    PYTHONPATH=src python benchmarks/bench_suite.py --vars 5000 --depth 3
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.lexer import get_lexer
+from py_nusmv_parser.synthetic import generate_model
+from py_nusmv_parser.visitor import walk
+
+SHAPES = {
+    "baseline": dict(variables=2_000, enum_width=4, case_branches=3, depth=1),
+    "wide_enums": dict(variables=2_000, enum_width=64, case_branches=3, depth=1),
+    "many_branches": dict(variables=500, enum_width=4, case_branches=24, depth=1),
+    "deep": dict(variables=300, enum_width=4, case_branches=3, depth=6),
+}
+
+PHASES = ("lex", "parse", "unparse", "to_dict")
+
+
+def lex(source: str) -> int:
+    lexer = get_lexer().clone()
+    lexer.input(source)
+    count = 0
+    while lexer.token():
+        count += 1
+    return count
+
+
+def git_commit() -> dict:
+    def git(*args):
+        return subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+
+    try:
+        return {
+            "commit": git("rev-parse", "HEAD"),
+            "dirty": bool(git("status", "-uno", "--porcelain")),
+        }
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def measure(fn, repeat: int) -> tuple[float, int]:
+    # The best time of `repeat` runs, then the peak memory of one traced run.
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_shape(shape: dict, repeat: int) -> dict:
+    source = generate_model(**shape)
+    module = parse_nusmv_string(source)
+    size = len(source.encode())
+    phases = {
+        "lex": lambda: lex(source),
+        "parse": lambda: parse_nusmv_string(source),
+        "unparse": module.unparse,
+        "to_dict": module.to_dict,
+    }
+    result = {
+        "shape": shape,
+        "bytes": size,
+        "lines": source.count("\n"),
+        "tokens": lex(source),
+        "nodes": sum(1 for _ in walk(module)),
+        "phases": {},
+    }
+    for phase in PHASES:
+        seconds, peak = measure(phases[phase], repeat)
+        result["phases"][phase] = {
+            "seconds": seconds,
+            "mb_per_s": size / seconds / 1e6,
+            "peak_mib": peak / 2**20,
+        }
+    return result
+
+
+def compare(old: dict, new: dict) -> None:
+    print(f"\n{old['commit'] or '?'} -> {new['commit'] or '?'} (old time / new time)")
+    for name, result in new["results"].items():
+        previous = old["results"].get(name)
+        if previous is None or previous["shape"] != result["shape"]:
+            continue
+        ratios = []
+        for phase in PHASES:
+            if phase in previous["phases"]:
+                before = previous["phases"][phase]["seconds"]
+                ratios.append(
+                    f"{phase} {before / result['phases'][phase]['seconds']:5.2f}x"
+                )
+        print(f"{name:14} " + "  ".join(ratios))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--vars", type=int, help="a single shape with this many variables"
+    )
+    parser.add_argument("--enum-width", type=int, default=4)
+    parser.add_argument("--branches", type=int, default=3)
+    parser.add_argument("--depth", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="default: benchmarks/results/<commit>.json")
+    parser.add_argument("--compare", help="an earlier results file")
+    args = parser.parse_args(argv)
+
+    shapes = SHAPES
+    if args.vars is not None:
+        shapes = {
+            "custom": dict(
+                variables=args.vars,
+                enum_width=args.enum_width,
+                case_branches=args.branches,
+                depth=args.depth,
+            )
+        }
+    report = {
+        **git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "repeat": args.repeat,
+        "results": {},
+    }
+    for name, shape in shapes.items():
+        result = report["results"][name] = run_shape(shape, args.repeat)
+        print(f"{name:14} {result['bytes'] / 1e6:6.2f} MB {result['nodes']:>8} nodes")
+        for phase, stats in result["phases"].items():
+            print(
+                f"    {phase:8} {stats['seconds']:8.3f} s {stats['mb_per_s']:7.2f} MB/s"
+                f"  peak {stats['peak_mib']:7.1f} MiB"
+            )
+
+    output = args.output
+    if output is None:
+        directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+        os.makedirs(directory, exist_ok=True)
+        output = os.path.join(directory, f"{(report['commit'] or 'unknown')[:12]}.json")
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
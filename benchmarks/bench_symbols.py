@@ -0,0 +1,52 @@
+"""
+Symbol lookup benchmark.
+
+Compares finding a variable's declaration and assignments by scanning the
+module with `Module.symbols` lookups (including the one-off index build).
+
+    PYTHONPATH=src python benchmarks/bench_symbols.py [vars] [lookups]
+"""
+
+import random
+import sys
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.models import AssignConstraint, VarDeclaration
+
+from bench_parse_scaling import make_model
+
+
+def scan(module, name):
+    declaration, assigns = None, []
+    for element in module.body:
+        if isinstance(element, VarDeclaration):
+            for item in element.var_list:
+                if item.identifier.name == name:
+                    declaration = item
+        elif isinstance(element, AssignConstraint):
+            assigns += [a for a in element.assigns_list if a.target.name == name]
+    return declaration, assigns
+
+
+def main(n_vars=20_000, lookups=200):
+    module = parse_nusmv_string(make_model(n_vars))
+    names = [f"v{random.randrange(n_vars)}" for _ in range(lookups)]
+
+    start = time.perf_counter()
+    for name in names:
+        scan(module, name)
+    scanned = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in names:
+        symbol = module.symbols[name]
+        symbol.declaration, symbol.assigns["init"]
+    indexed = time.perf_counter() - start
+
+    print(f"scan     {scanned / lookups * 1e6:10.1f} us/lookup")
+    print(f"symbols  {indexed / lookups * 1e6:10.1f} us/lookup (with index build)")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,72 @@
+"""
+Trace checking benchmark.
+
+Writes a long trace of a model of counters to a temporary file, checks it
+with `check_trace`, and reports the states per second. The peak memory
+traced while checking a short and a five times longer trace shows that
+memory does not grow with the trace.
+
+    PYTHONPATH=src python benchmarks/bench_trace_check.py [counters] [states]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.trace_check import check_trace
+
+
+def make_model(n: int) -> str:
+    lines = ["MODULE main", "VAR"]
+    lines += [f"    c{i} : {{0, 1, 2, 3}};" for i in range(n)]
+    lines.append("ASSIGN")
+    for i in range(n):
+        lines.append(f"    init(c{i}) := 0;")
+        lines.append(f"    next(c{i}) := case c{i} = 3 : 0; TRUE : c{i} + 1; esac;")
+    return "\n".join(lines)
+
+
+def write_trace(path: str, n: int, states: int) -> None:
+    with open(path, "w") as f:
+        f.write("Trace Description: Simulation Trace\nTrace Type: Simulation\n")
+        for step in range(states):
+            f.write(f"  -> State: 1.{step + 1} <-\n")
+            f.writelines(f"    c{i} = {step % 4}\n" for i in range(n))
+
+
+def peak_memory(module, path) -> int:
+    tracemalloc.start()
+    check_trace(module, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(n=20, states=200_000):
+    module = parse_nusmv_string(make_model(n))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trace.txt")
+        write_trace(path, n, states)
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        violation = check_trace(module, path)
+        elapsed = time.perf_counter() - start
+        assert violation is None, violation
+        peaks = []
+        for length in (2_000, 10_000):
+            write_trace(path, n, length)
+            peaks.append(peak_memory(module, path) / 2**20)
+    print(
+        f"{states} states ({size / 2**20:.0f} MiB) in {elapsed:.2f}s:"
+        f" {states / elapsed:,.0f} states/s"
+    )
+    print(
+        f"peak memory: {peaks[0]:.2f} MiB for 2000 states, {peaks[1]:.2f} MiB for 10000"
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
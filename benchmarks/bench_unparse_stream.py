@@ -0,0 +1,47 @@
+"""
+Streaming unparse benchmark.
+
+Compares `unparse()` with `unparse_to(stream)` on a large model: wall time
+and peak memory allocated while producing the text.
+
+    PYTHONPATH=src python benchmarks/bench_unparse_stream.py [vars]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+from py_nusmv_parser import parse_nusmv_string
+
+from bench_memory import make_reuse_model
+
+
+def measure(fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(n_vars=5_000):
+    module = parse_nusmv_string(make_reuse_model(n_vars))
+    size = len(module.unparse())
+    with open(os.devnull, "w") as devnull:
+        for label, fn in (
+            ("unparse()", module.unparse),
+            ("unparse_to()", lambda: module.unparse_to(devnull)),
+        ):
+            elapsed, peak = measure(fn)
+            print(
+                f"{label:>13}: {elapsed:6.2f}s  peak {peak / 2**20:7.2f} MiB"
+                f"  (output {size / 2**20:.2f} MiB)"
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
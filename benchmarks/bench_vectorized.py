@@ -0,0 +1,92 @@
+"""
+Vectorized evaluation benchmark.
+
+Evaluates a guard over a batch of random states with `evaluate_batch`, and
+over a sample of the same states with a per-state Python loop, and reports
+the states per second of both.
+
+    PYTHONPATH=src python benchmarks/bench_vectorized.py [states]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.vectorized import EnumCodes, evaluate_batch
+
+SOURCE = """
+MODULE main
+VAR
+    a : {ready, busy, done};
+    b : {ready, busy, done};
+    c : boolean;
+    d : {0, 1, 2, 3};
+ASSIGN
+    next(a) := case
+                   a = ready & b = busy & c : busy;
+                   a = busy & d + 1 = 3 : done;
+                   b = done & c = FALSE : ready;
+                   TRUE : a;
+               esac;
+"""
+
+_OPS = {"&": lambda x, y: x and y, "=": lambda x, y: x == y, "+": lambda x, y: x + y}
+
+
+def evaluate_state(expr, state):
+    # The per-state loop body being replaced.
+    match type(expr).__name__:
+        case "BinaryOperator":
+            left = evaluate_state(expr.left, state)
+            return _OPS[expr.operator](left, evaluate_state(expr.right, state))
+        case "Identifier":
+            return state.get(expr.name, expr.name)
+        case "Const":
+            return expr.value
+        case "CaseExpr":
+            for item in expr.case_body:
+                if evaluate_state(item.condition, state):
+                    return evaluate_state(item.expr, state)
+    raise NotImplementedError(expr)
+
+
+def main(n_states=1_000_000):
+    module = parse_nusmv_string(SOURCE)
+    expr = module.body[1].assigns_list[0].expr
+    codes = EnumCodes.from_module(module)
+    rng = np.random.default_rng(0)
+    names = ["ready", "busy", "done"]
+    columns = {
+        "a": rng.integers(3, size=n_states) + codes["ready"],
+        "b": rng.integers(3, size=n_states) + codes["ready"],
+        "c": rng.integers(2, size=n_states).astype(bool),
+        "d": rng.integers(4, size=n_states),
+    }
+
+    start = time.perf_counter()
+    result = evaluate_batch(expr, columns, codes)
+    batch = time.perf_counter() - start
+
+    sample = min(n_states, 100_000)
+    states = [
+        {
+            "a": names[columns["a"][i] - codes["ready"]],
+            "b": names[columns["b"][i] - codes["ready"]],
+            "c": bool(columns["c"][i]),
+            "d": int(columns["d"][i]),
+        }
+        for i in range(sample)
+    ]
+    start = time.perf_counter()
+    expected = [evaluate_state(expr, state) for state in states]
+    loop = time.perf_counter() - start
+    assert codes.decode(result[:sample]) == expected
+
+    print(f"vectorized: {n_states / batch:,.0f} states/s")
+    print(f"python loop: {sample / loop:,.0f} states/s")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
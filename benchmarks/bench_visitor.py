@@ -0,0 +1,46 @@
+"""
+Traversal benchmark.
+
+Times `walk`, a `NodeVisitor` and a no-op copy-on-write `NodeTransformer`
+over a large tree, next to the generic `to_dict_handler` walk.
+
+    PYTHONPATH=src python benchmarks/bench_visitor.py [vars]
+"""
+
+import sys
+import time
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.models import to_dict_handler
+from py_nusmv_parser.visitor import NodeTransformer, NodeVisitor, walk
+
+from bench_memory import make_reuse_model
+
+
+class CountIdentifiers(NodeVisitor):
+    def __init__(self):
+        self.count = 0
+
+    def visit_Identifier(self, node):
+        self.count += 1
+
+
+def timed(label, fn, nodes):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>16}: {elapsed:6.2f}s  {elapsed / nodes * 1e9:6.0f} ns/node")
+
+
+def main(n_vars=10_000):
+    module = parse_nusmv_string(make_reuse_model(n_vars))
+    nodes = sum(1 for _ in walk(module))
+    print(f"{nodes} nodes")
+    timed("to_dict_handler", lambda: to_dict_handler(module), nodes)
+    timed("walk", lambda: sum(1 for _ in walk(module)), nodes)
+    timed("NodeVisitor", lambda: CountIdentifiers().visit(module), nodes)
+    timed("NodeTransformer", lambda: NodeTransformer(copy=True).visit(module), nodes)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -1 +1,3 @@
-from .parser import parse_nusmv_string
\ No newline at end of file
+from .parser import NuSMVParser, iter_modules, parse_nusmv_string
+from .pool import ParserPool
+from .batch import ParseResult, parse_many
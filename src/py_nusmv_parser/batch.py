@@ -0,0 +1,68 @@
+import os
+from typing import Iterable, Iterator, NamedTuple
+
+from . import codec
+from .models import Module
+from .parser import parse_nusmv_string
+
+
+class ParseResult(NamedTuple):
+    path: str
+    module: Module | None
+    error: str | None = None
+
+
+def _parse_path(path: str) -> tuple[str, bytes | None, str | None]:
+    """
+    Worker entry point. The AST travels back to the parent process in the
+    `codec` encoding, which is much cheaper than pickling the model objects.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            module = parse_nusmv_string(f.read())
+        if module is None:
+            return path, None, "SyntaxError: could not parse module"
+        return path, codec.dumps(module), None
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+def _load_result(path: str, payload: bytes | None, error: str | None):
+    if payload is None:
+        return ParseResult(path, None, error)
+    return ParseResult(path, codec.loads(payload))
+
+
+def parse_many(
+    paths: Iterable[str | os.PathLike],
+    workers: int | None = None,
+    ordered: bool = True,
+) -> Iterator[ParseResult]:
+    """
+    Parse many `.smv` files on a process pool.
+
+    Yields one `ParseResult` per path, in input order when `ordered` is true
+    and as soon as each file is done otherwise. A file that fails to parse
+    yields a result with `module=None` and the error message, the rest of the
+    batch carries on. `workers=1` parses in the calling process.
+    """
+    paths = [os.fspath(p) for p in paths]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        for path in paths:
+            yield _load_result(*_parse_path(path))
+        return
+
+    # Imported here so that importing the package does not pull in
+    # multiprocessing.
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if ordered:
+            chunksize = max(1, len(paths) // (workers * 4))
+            for result in executor.map(_parse_path, paths, chunksize=chunksize):
+                yield _load_result(*result)
+        else:
+            futures = [executor.submit(_parse_path, path) for path in paths]
+            for future in as_completed(futures):
+                yield _load_result(*future.result())
@@ -0,0 +1,144 @@
+import hashlib
+import os
+import tempfile
+import zlib
+from functools import lru_cache
+
+from . import codec
+from .models import Module
+from .parser import parse_nusmv_string
+
+# Bump when the layout of cache entries changes. Entries are keyed by the
+# codec format version too, so a codec change needs no bump here.
+CACHE_FORMAT = 3
+_SUFFIX = ".ast"
+
+
+@lru_cache(maxsize=None)
+def grammar_version() -> str:
+    """
+    A short digest of the grammar the LALR tables were built from.
+    """
+    from . import parsetab
+
+    return hashlib.sha256(parsetab._lr_signature.encode()).hexdigest()[:16]
+
+
+class ASTCache:
+    """
+    A content-addressed on-disk cache of parsed modules.
+
+    Entries are keyed by a hash of the source text, the grammar version and
+    the cache and codec formats, so a grammar change never serves stale
+    trees. When the directory grows past `max_bytes`, the least recently
+    used entries are evicted. Several processes can share one directory:
+    entries are written to a temporary file and renamed into place, and a
+    reader that loses a race with eviction just sees a miss.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike, max_bytes: int = 256 << 20
+    ) -> None:
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        # Size estimate since the last scan, so that `put` does not list the
+        # directory on every call.
+        self._approx_bytes: int | None = None
+
+    def key(self, source: str) -> str:
+        h = hashlib.sha256()
+        h.update(
+            f"{grammar_version()}:{CACHE_FORMAT}:{codec.FORMAT_VERSION}:".encode()
+        )
+        h.update(source.encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, source: str) -> Module | None:
+        path = self._path(self.key(source))
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+            # Refresh the modification time, which is the LRU clock.
+            os.utime(path)
+        except OSError:
+            return None
+        try:
+            return codec.loads(zlib.decompress(payload))
+        except Exception:
+            self._remove(path)
+            return None
+
+    def put(self, source: str, module: Module) -> None:
+        payload = zlib.compress(codec.dumps(module), 1)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self._path(self.key(source)))
+            except BaseException:
+                self._remove(tmp_path)
+                raise
+        except OSError:
+            # Caching is best effort, a full or read-only disk must not break
+            # parsing.
+            return
+        if self._approx_bytes is not None:
+            self._approx_bytes += len(payload)
+        if self._approx_bytes is None or self._approx_bytes > self.max_bytes:
+            self.evict()
+
+    def parse_string(self, source: str) -> Module:
+        module = self.get(source)
+        if module is None:
+            module = parse_nusmv_string(source)
+            if module is not None:
+                self.put(source, module)
+        return module
+
+    def parse_file(self, path: str | os.PathLike) -> Module:
+        with open(path, encoding="utf-8") as f:
+            return self.parse_string(f.read())
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits `max_bytes`.
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+        self._approx_bytes = total
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            self._remove(path)
+        self._approx_bytes = 0
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
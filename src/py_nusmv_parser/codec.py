@@ -0,0 +1,324 @@
+"""
+A compact, versioned binary encoding of parsed trees.
+
+Layout of an encoded tree::
+
+    magic b"NSMV", format version (1 byte)
+    word type:     the array typecode of the words, b"b", b"h", b"i" or b"q"
+    word count:    an unsigned LEB128 varint
+    words:         little-endian signed integers of the word type
+    ints:          the ints of the tree as zigzag LEB128 varints
+    floats:        the floats of the tree as little-endian 8-byte doubles
+    text:          the strings of the string table, concatenated, in utf-8
+
+Each stored word is the difference from the previous one, which keeps
+runs of consecutive indices small and compressible; the decoder restores
+them with a single `accumulate`.
+
+Every distinct value of the tree (nodes, lists and tuples by identity) has
+an index in one table: None, False and True, then the strings, ints,
+floats, nodes (grouped by class), lists and tuples. The words hold, in
+order:
+
+    strings:   count, then the length in characters of each string
+    ints:      count
+    floats:    count
+    classes:   count, then (name, field count, field names, instance count)
+    lists:     count, then (length, item indices) per list
+    tuples:    count, then (length, item indices) per tuple
+    fields:    per class and field, the index of the value of each instance
+    root:      the index of the encoded value
+
+Names are indices of strings too. Tuples come after their items. Nodes and
+lists are created empty and filled in afterwards, so the decoder builds
+whole columns at a time instead of one node at a time. Instances of
+classes that keep extra attributes in a `__dict__` write, after the field
+columns of their class, the number of extra attributes and (name, value)
+index pairs per instance.
+"""
+
+import sys
+from array import array
+from collections import deque
+from itertools import accumulate, count, repeat
+from operator import attrgetter
+from typing import BinaryIO
+
+from .models import BasicSemantic, _node_class, gc_paused, get_fields
+
+MAGIC = b"NSMV"
+FORMAT_VERSION = 2
+
+_WORD_TYPES = ("b", "h", "i", "q")
+_CONSTANTS = (None, False, True)
+_SWAP = sys.byteorder == "big"
+
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+class _Close:
+    # Marks the point where all items of a tuple have been seen.
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+def dumps(node) -> bytes:
+    """
+    Encode a tree (or any value made of nodes, lists, tuples, strings,
+    numbers, booleans and None) into bytes.
+    """
+    # Dicts with None values are insertion-ordered sets.
+    strings: dict[str, None] = {}
+    ints: dict[int, None] = {}
+    # Keyed by `repr`, which tells 0.0 from -0.0 and lets nan equal itself.
+    floats: dict[str, float] = {}
+    instances: dict[type, list] = {}
+    lists: list[list] = []
+    tuples: list[tuple] = []
+    seen: set[int] = set()
+
+    stack = [node]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    while stack:
+        value = pop()
+        t = type(value)
+        if t is str:
+            strings[value] = None
+        elif t is _Close:
+            tuples.append(value.value)
+        elif value is None or t is bool:
+            pass
+        elif t is int:
+            ints[value] = None
+        elif t is float:
+            floats.setdefault(repr(value), value)
+        elif id(value) in seen:
+            continue
+        elif t is list:
+            seen.add(id(value))
+            lists.append(value)
+            extend(value)
+        elif t is tuple:
+            seen.add(id(value))
+            push(_Close(value))
+            extend(value)
+        elif isinstance(value, BasicSemantic):
+            seen.add(id(value))
+            fields = get_fields(t)
+            group = instances.get(t)
+            if group is None:
+                group = instances[t] = []
+                strings[t.__name__] = None
+                strings.update(dict.fromkeys(fields))
+            group.append(value)
+            if t.__dictoffset__:
+                strings.update(dict.fromkeys(value.__dict__))
+                extend(value.__dict__.values())
+            extend([getattr(value, f) for f in fields])
+        else:
+            raise TypeError(f"Cannot encode a {t.__name__} value")
+
+    string_refs = dict(zip(strings, count(len(_CONSTANTS))))
+    int_refs = dict(zip(ints, count(len(_CONSTANTS) + len(strings))))
+    float_refs = dict(zip(floats, count(len(_CONSTANTS) + len(strings) + len(ints))))
+    # Nodes, lists and tuples are indexed by identity.
+    refs: dict[int, int] = {}
+    start = len(_CONSTANTS) + len(strings) + len(ints) + len(floats)
+    for group in (*instances.values(), lists, tuples):
+        refs.update(zip(map(id, group), count(start)))
+        start += len(group)
+
+    def ref(value):
+        t = type(value)
+        if t is str:
+            return string_refs[value]
+        index = refs.get(id(value))
+        if index is not None:
+            return index
+        if t is int:
+            return int_refs[value]
+        if t is float:
+            return float_refs[repr(value)]
+        return _CONSTANTS.index(value)
+
+    words = [len(strings), *map(len, strings)]
+    words += [len(ints), len(floats)]
+    words.append(len(instances))
+    for t, group in instances.items():
+        fields = get_fields(t)
+        words += [string_refs[t.__name__], len(fields)]
+        words += map(string_refs.__getitem__, fields)
+        words.append(len(group))
+    for containers in (lists, tuples):
+        words.append(len(containers))
+        for value in containers:
+            words.append(len(value))
+            words += map(ref, value)
+    for t, group in instances.items():
+        for field in get_fields(t):
+            words += map(ref, map(attrgetter(field), group))
+        if t.__dictoffset__:
+            for value in group:
+                words.append(len(value.__dict__))
+                for name, item in value.__dict__.items():
+                    words += (string_refs[name], ref(item))
+    words.append(ref(node))
+
+    deltas = [w - previous for previous, w in zip([0, *words], words)]
+    largest = max(max(deltas), -1 - min(deltas))
+    word_type = next(
+        t for t in _WORD_TYPES if largest < 1 << 8 * array(t).itemsize - 1
+    )
+    encoded = array(word_type, deltas)
+    if _SWAP:
+        encoded.byteswap()
+    out = bytearray(MAGIC)
+    out.append(FORMAT_VERSION)
+    out += word_type.encode()
+    _write_varint(out, len(words))
+    out += encoded.tobytes()
+    for value in ints:
+        _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+    doubles = array("d", floats.values())
+    if _SWAP:
+        doubles.byteswap()
+    out += doubles.tobytes()
+    out += "".join(strings).encode("utf-8")
+    return bytes(out)
+
+
+def loads(data: bytes):
+    """
+    Decode bytes produced by `dumps`.
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("Not an encoded tree")
+    if data[4] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {data[4]}")
+    word_type = chr(data[5])
+    if word_type not in _WORD_TYPES:
+        raise ValueError(f"Unknown word type {word_type!r}")
+    try:
+        pos = 6
+        n = shift = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            n |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        encoded = array(word_type)
+        end = pos + n * encoded.itemsize
+        encoded.frombytes(data[pos:end])
+        if len(encoded) != n:
+            raise ValueError("Truncated or malformed data")
+        if _SWAP:
+            encoded.byteswap()
+        words = list(accumulate(encoded))
+
+        n_strings = words[0]
+        pos = end
+        numbers: list = []
+        for _ in range(words[1 + n_strings]):
+            n = shift = 0
+            while True:
+                b = data[pos]
+                pos += 1
+                n |= (b & 0x7F) << shift
+                if b < 0x80:
+                    break
+                shift += 7
+            numbers.append(-((n + 1) >> 1) if n & 1 else n >> 1)
+        doubles = array("d")
+        end = pos + 8 * words[2 + n_strings]
+        doubles.frombytes(data[pos:end])
+        if _SWAP:
+            doubles.byteswap()
+        numbers += doubles
+        text = data[end:].decode("utf-8")
+        with gc_paused():
+            return _decode(words, numbers, text)
+    except (IndexError, TypeError, AttributeError):
+        raise ValueError("Truncated or malformed data") from None
+
+
+def _decode(words: list[int], numbers: list, text: str):
+    table = list(_CONSTANTS)
+    get = table.__getitem__
+
+    n = words[0]
+    ends = list(accumulate(words[1 : 1 + n]))
+    pos = 1 + n
+    if (ends[-1] if ends else 0) != len(text):
+        raise ValueError("Truncated or malformed data")
+    table += map(text.__getitem__, map(slice, [0, *ends], ends))
+    if len(numbers) != words[pos] + words[pos + 1]:
+        raise ValueError("Truncated or malformed data")
+    table += numbers
+    pos += 2
+
+    groups = []
+    for _ in range(words[pos]):
+        cls = _node_class(table[words[pos + 1]])
+        n = words[pos + 2]
+        fields = tuple(map(get, words[pos + 3 : pos + 3 + n]))
+        pos += 3 + n
+        nodes = list(map(cls.__new__, repeat(cls, words[pos])))
+        table += nodes
+        groups.append((cls, fields, nodes))
+    pos += 1
+
+    spans = []
+    for _ in range(words[pos]):
+        n = words[pos + 1]
+        spans.append(words[pos + 2 : pos + 2 + n])
+        pos += 1 + n
+    pos += 1
+    lists = [[] for _ in spans]
+    table += lists
+    for _ in range(words[pos]):
+        n = words[pos + 1]
+        table.append(tuple(map(get, words[pos + 2 : pos + 2 + n])))
+        pos += 1 + n
+    pos += 1
+    for items, span in zip(lists, spans):
+        items += map(get, span)
+
+    consume = deque(maxlen=0).extend
+    for cls, fields, nodes in groups:
+        n = len(nodes)
+        for field in fields:
+            values = map(get, words[pos : pos + n])
+            consume(map(getattr(cls, field).__set__, nodes, values))
+            pos += n
+        if cls.__dictoffset__:
+            for node in nodes:
+                n = words[pos]
+                for i in range(pos + 1, pos + 1 + 2 * n, 2):
+                    setattr(node, table[words[i]], table[words[i + 1]])
+                pos += 1 + 2 * n
+    if pos + 1 != len(words):
+        raise ValueError("Truncated or malformed data")
+    return table[words[pos]]
+
+
+def dump(node, fp: BinaryIO) -> None:
+    """
+    Encode a tree into a binary file object.
+    """
+    fp.write(dumps(node))
+
+
+def load(fp: BinaryIO):
+    """
+    Decode a tree from a binary file object.
+    """
+    return loads(fp.read())
@@ -0,0 +1,351 @@
+"""
+Compilation of expressions to Python functions.
+
+`compile_expr` turns an expression into a function of a state tuple, so
+that evaluating it for many states walks the tree only once. The function
+is generated as Python source, with chains of `&`, `|`, `+` and `*`
+flattened into a single Python expression. Trees nested too deeply for
+the Python compiler are turned into nested closures instead, which keep
+the flattened chains.
+"""
+
+import math
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Sequence
+
+from .models import (
+    BasicSemantic,
+    BinaryOperator,
+    CaseExpr,
+    ComplexIdentifier,
+    Const,
+    EnumerationType,
+    Identifier,
+    SetExpr,
+    UnaryOperator,
+)
+from .visitor import walk
+
+# Generated expressions nested deeper than this are built from closures.
+# Python refuses source with 200 nested parentheses.
+_MAX_SOURCE_DEPTH = 150
+
+
+def _div(a, b):
+    # NuSMV integer division rounds towards zero.
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def _mod(a, b):
+    return int(math.fmod(a, b))
+
+
+def _choose(rng, values):
+    if rng is None:
+        raise ValueError("A set or range expression needs an `rng` to choose from")
+    return rng.choice(values)
+
+
+def _no_case():
+    raise ValueError("No case condition holds")
+
+
+_CHAINS = {"&": " and ", "|": " or ", "+": " + ", "*": " * "}
+
+_BINARY_SOURCE = {
+    "xor": "({} != {})",
+    "xnor": "({} == {})",
+    "->": "(not {} or {})",
+    "<->": "({} == {})",
+    "=": "({} == {})",
+    "!=": "({} != {})",
+    "<": "({} < {})",
+    "<=": "({} <= {})",
+    ">": "({} > {})",
+    ">=": "({} >= {})",
+    "-": "({} - {})",
+    "/": "_div({}, {})",
+    "mod": "_mod({}, {})",
+}
+
+_UNARY_SOURCE = {"!": "(not {})", "-": "(-{})"}
+
+_BINARY = {
+    "xor": operator.ne,
+    "xnor": operator.eq,
+    "->": lambda a, b: not a or b,
+    "<->": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "-": operator.sub,
+    "/": _div,
+    "mod": _mod,
+}
+
+_UNARY = {"!": operator.not_, "-": operator.neg}
+
+
+def _chain(node: BinaryOperator) -> list:
+    # The operands of a chain of one associative operator, left to right.
+    op = node.operator
+    operands = []
+    stack = [node.right, node.left]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, BinaryOperator) and item.operator == op:
+            stack += [item.right, item.left]
+        else:
+            operands.append(item)
+    return operands
+
+
+def _elements(node) -> list:
+    # The choices of a set, ranges expanded to their integers.
+    if isinstance(node, Const) and node.type == "range":
+        low, high = node.value
+        return [Const(v, "integer") for v in range(low, high + 1)]
+    if not isinstance(node, SetExpr):
+        return [node]
+    elements = []
+    for element in node.set_body:
+        elements += _elements(element)
+    return elements
+
+
+class _Compiler:
+    """
+    Folds an expression bottom-up with an explicit stack. Subclasses give
+    the value of leaves and how operands combine.
+    """
+
+    def __init__(self, layout: Mapping[str, int], codes) -> None:
+        self.layout = layout
+        self.codes = codes
+
+    def operands(self, node) -> list:
+        match node:
+            case BinaryOperator(operator=op) if op in _CHAINS:
+                return _chain(node)
+            case BinaryOperator(operator="in"):
+                return [node.left, *_elements(node.right)]
+            case BinaryOperator():
+                return [node.left, node.right]
+            case UnaryOperator():
+                return [node.operand]
+            case CaseExpr():
+                return [
+                    v for item in node.case_body for v in (item.condition, item.expr)
+                ]
+            case SetExpr() | Const(type="range"):
+                return _elements(node)
+            case ComplexIdentifier() if self.position(node) is None:
+                return [node.item] if node.type == "index" else []
+        return []
+
+    def fold(self, expr):
+        values = []
+        stack = [(expr, None)]
+        while stack:
+            node, operands = stack.pop()
+            if operands is None:
+                operands = self.operands(node)
+                stack.append((node, operands))
+                stack += [(child, None) for child in reversed(operands)]
+                continue
+            count = len(operands)
+            parts = values[len(values) - count :]
+            del values[len(values) - count :]
+            values.append(self.combine(node, parts))
+        return values[0]
+
+    def position(self, node) -> int | None:
+        name = node.name if isinstance(node, Identifier) else node.unparse()
+        return self.layout.get(name)
+
+    def constant(self, node) -> Any:
+        codes = self.codes
+        match node:
+            case Identifier(name=name):
+                # Symbolic values parse as identifiers: a name that is not a
+                # variable must be one of the `codes`.
+                if codes is None or name not in codes:
+                    raise ValueError(f"Unknown identifier {name!r}")
+                return codes[name]
+            case Const(type="symbolic", value=name):
+                return codes[name] if codes is not None and name in codes else name
+            case Const():
+                return node.value
+        raise NotImplementedError(type(node).__name__)
+
+    def cells(self, node: ComplexIdentifier) -> dict[int, int]:
+        # `a[i]` with a variable index picks among the `a[<k>]` variables.
+        prefix = node.target.unparse() + "["
+        cells = {}
+        for name, position in self.layout.items():
+            if name.startswith(prefix) and name.endswith("]"):
+                index = name[len(prefix) : -1]
+                if index.lstrip("-").isdigit():
+                    cells[int(index)] = position
+        if node.type != "index" or not cells:
+            raise ValueError(f"Unknown identifier {node.unparse()!r}")
+        return cells
+
+
+class _SourceCompiler(_Compiler):
+    # Each value is (source, nesting depth).
+    def combine(self, node, parts):
+        depth = 1 + max((d for _, d in parts), default=0)
+        sources = [s for s, _ in parts]
+        match node:
+            case BinaryOperator(operator=op) if op in _CHAINS:
+                # Python nests `a + b + c` but keeps `a and b and c` flat.
+                if op in ("+", "*"):
+                    depth += len(parts)
+                return "(" + _CHAINS[op].join(sources) + ")", depth
+            case BinaryOperator(operator="in"):
+                return f"({sources[0]} in ({', '.join(sources[1:])},))", depth
+            case BinaryOperator(operator=op):
+                if op not in _BINARY_SOURCE:
+                    raise NotImplementedError(op)
+                return _BINARY_SOURCE[op].format(*sources), depth
+            case UnaryOperator(operator=op):
+                if op not in _UNARY_SOURCE:
+                    raise NotImplementedError(op)
+                return _UNARY_SOURCE[op].format(*sources), depth
+            case CaseExpr():
+                branches = [
+                    f"{value} if {condition} else "
+                    for condition, value in zip(sources[0::2], sources[1::2])
+                ]
+                depth += len(branches)
+                return "(" + "".join(branches) + "_no_case())", depth
+            case SetExpr() | Const(type="range"):
+                return f"_choose(rng, ({', '.join(sources)},))", depth
+            case ComplexIdentifier() if self.position(node) is None:
+                cells = self.cells(node)
+                table = ", ".join(f"{k}: state[{p}]" for k, p in cells.items())
+                return f"{{{table}}}[{sources[0]}]", depth
+            case Identifier() | ComplexIdentifier():
+                position = self.position(node)
+                if position is not None:
+                    return f"state[{position}]", depth
+        return repr(self.constant(node)), depth
+
+
+class _ClosureCompiler(_Compiler):
+    # Each value is a function of (state, rng).
+    def combine(self, node, parts):
+        match node:
+            case BinaryOperator(operator="&"):
+                return lambda s, r: all(f(s, r) for f in parts)
+            case BinaryOperator(operator="|"):
+                return lambda s, r: any(f(s, r) for f in parts)
+            case BinaryOperator(operator="+"):
+                return lambda s, r: sum(f(s, r) for f in parts)
+            case BinaryOperator(operator="*"):
+                return lambda s, r: math.prod(f(s, r) for f in parts)
+            case BinaryOperator(operator="in"):
+                left, *elements = parts
+                return lambda s, r: left(s, r) in [f(s, r) for f in elements]
+            case BinaryOperator(operator=op):
+                if op not in _BINARY:
+                    raise NotImplementedError(op)
+                fn, left, right = _BINARY[op], *parts
+                return lambda s, r: fn(left(s, r), right(s, r))
+            case UnaryOperator(operator=op):
+                if op not in _UNARY:
+                    raise NotImplementedError(op)
+                fn, operand = _UNARY[op], parts[0]
+                return lambda s, r: fn(operand(s, r))
+            case CaseExpr():
+                branches = list(zip(parts[0::2], parts[1::2]))
+
+                def case(s, r):
+                    for condition, value in branches:
+                        if condition(s, r):
+                            return value(s, r)
+                    return _no_case()
+
+                return case
+            case SetExpr() | Const(type="range"):
+                return lambda s, r: _choose(r, [f(s, r) for f in parts])
+            case ComplexIdentifier() if self.position(node) is None:
+                cells, index = self.cells(node), parts[0]
+                return lambda s, r: s[cells[index(s, r)]]
+            case Identifier() | ComplexIdentifier():
+                position = self.position(node)
+                if position is not None:
+                    return lambda s, r: s[position]
+        value = self.constant(node)
+        return lambda s, r: value
+
+
+def symbolic_constants(module: BasicSemantic) -> dict[str, str]:
+    """
+    The symbolic enumeration values of `module`, each mapped to itself: the
+    `codes` for functions that work with the names of the values.
+    """
+    return {
+        value.identifier.value: value.identifier.value
+        for node in walk(module)
+        if isinstance(node, EnumerationType)
+        for value in node.body
+        if value.identifier.type == "symbolic"
+    }
+
+
+@lru_cache(maxsize=1024)
+def _from_source(source: str) -> Callable:
+    namespace = {
+        "_div": _div,
+        "_mod": _mod,
+        "_choose": _choose,
+        "_no_case": _no_case,
+    }
+    exec(f"def compiled_expr(state, rng=None):\n    return {source}", namespace)
+    return namespace["compiled_expr"]
+
+
+def compile_expr(
+    expr: BasicSemantic,
+    env_layout: Sequence[str] | Mapping[str, int],
+    codes: Mapping[str, int] | None = None,
+) -> Callable:
+    """
+    Compile `expr` to a function `f(state, rng=None)`, where `state` is a
+    tuple holding the value of each variable at its position in
+    `env_layout` (a sequence of names, or a mapping from names to
+    positions). Names such as `a.b` and `a[1]` are variables of their own.
+
+    Symbolic constants evaluate to their code in `codes`: an `EnumCodes`
+    table for instance, or `symbolic_constants(module)` to keep their
+    names. Any other name that is not in `env_layout` raises ValueError.
+    Sets and ranges pick a value with `rng.choice`, `rng` being a
+    `random.Random`.
+
+    Functions are cached by generated source, so compiling structurally
+    equal expressions with the same layout is cheap.
+    """
+    if isinstance(env_layout, Mapping):
+        layout = dict(env_layout)
+    else:
+        layout = {name: i for i, name in enumerate(env_layout)}
+    source, depth = _SourceCompiler(layout, codes).fold(expr)
+    if depth <= _MAX_SOURCE_DEPTH:
+        try:
+            return _from_source(source)
+        except (RecursionError, SyntaxError):
+            # Past the nesting limits of the Python compiler.
+            pass
+    closure = _ClosureCompiler(layout, codes).fold(expr)
+
+    def compiled_expr(state, rng=None):
+        return closure(state, rng)
+
+    return compiled_expr
@@ -0,0 +1,191 @@
+"""
+Common-subexpression extraction.
+
+Expressions repeated across the assignments and defines of a module are
+found by structural key and moved into `DEFINE` entries, which the original
+places then refer to by name. Subexpressions with a nondeterministic
+`{...}` choice in them are never moved: every occurrence is a choice of its
+own.
+"""
+
+from .models import (
+    Assign,
+    AssignConstraint,
+    CaseExpr,
+    DefineDeclaration,
+    DefineItem,
+    Expr,
+    Identifier,
+    Module,
+    SetExpr,
+)
+from .visitor import (
+    SKIP,
+    NodeTransformer,
+    NodeVisitor,
+    StructuralKeys,
+    iter_child_nodes,
+    walk,
+)
+
+
+class _Marker(NodeVisitor):
+    # Records the outermost hoisted subtrees of `root`. The body of the
+    # define named `own` is not replaced by a reference to itself.
+    def __init__(
+        self, keys: StructuralKeys, names: dict[int, str], root, own: str | None
+    ) -> None:
+        self.keys = keys
+        self.names = names
+        self.root = root
+        self.own = own
+        self.marked: dict[int, str] = {}
+
+    def generic_visit(self, node):
+        name = self.names.get(self.keys(node))
+        if name is not None and not (node is self.root and name == self.own):
+            self.marked[id(node)] = name
+            return SKIP
+        return None
+
+
+class _Replacer(NodeTransformer):
+    def __init__(self, marked: dict[int, str]) -> None:
+        super().__init__(copy=True)
+        self.marked = marked
+
+    def _rebuild(self, node, new):
+        # A hoisted subtree is replaced whole, whatever changed inside it.
+        if id(node) in self.marked:
+            return node
+        return super()._rebuild(node, new)
+
+    def generic_visit(self, node):
+        name = self.marked.get(id(node))
+        return node if name is None else Identifier(name)
+
+
+def _replace(expr, keys: StructuralKeys, names: dict[int, str], own=None):
+    marker = _Marker(keys, names, expr, own)
+    marker.visit(expr)
+    if not marker.marked:
+        return expr
+    return _Replacer(marker.marked).visit(expr)
+
+
+def extract_common_subexpressions(
+    module: Module,
+    min_size: int = 3,
+    min_count: int = 2,
+    prefix: str = "_cse_",
+) -> Module:
+    """
+    A copy of `module` where every expression of at least `min_size` nodes
+    that occurs at least `min_count` times in assignments and defines is
+    replaced by a reference to a new `DEFINE` entry named `prefix` plus a
+    number. An existing define whose body is such an expression is reused
+    instead. Larger expressions are extracted first, and an occurrence
+    inside an extracted expression no longer counts towards `min_count`.
+
+    The new entries go in a `DEFINE` section before the first `ASSIGN`
+    section. `module` is left untouched.
+    """
+    assigns = [
+        assign
+        for element in module.body
+        if isinstance(element, AssignConstraint)
+        for assign in element.assigns_list
+        if isinstance(assign, Assign)
+    ]
+    defines = [
+        item
+        for element in module.body
+        if isinstance(element, DefineDeclaration)
+        for item in element.define_list
+    ]
+    roots = [a.expr for a in assigns] + [d.expr for d in defines]
+
+    keys = StructuralKeys()
+    sizes: dict[int, int] = {}
+    pure: dict[int, bool] = {}
+    counts: dict[int, int] = {}
+    samples: dict[int, Expr | CaseExpr] = {}
+    for root in roots:
+        nodes = list(walk(root))
+        # Children come after their parent in pre-order.
+        for node in reversed(nodes):
+            key = keys(node)
+            if key not in sizes:
+                children = [keys(c) for c in iter_child_nodes(node)]
+                sizes[key] = 1 + sum(sizes[c] for c in children)
+                pure[key] = not isinstance(node, SetExpr) and all(
+                    pure[c] for c in children
+                )
+        for node in nodes:
+            if isinstance(node, (Expr, CaseExpr)):
+                key = keys(node)
+                counts[key] = counts.get(key, 0) + 1
+                samples.setdefault(key, node)
+
+    reused = {}
+    for item in defines:
+        reused.setdefault(keys(item.expr), item.identifier.name)
+    taken = {n.name for n in walk(module) if isinstance(n, Identifier)}
+
+    names: dict[int, str] = {}
+    new_items: list[tuple[int, str]] = []
+    candidates = [k for k in samples if sizes[k] >= min_size and pure[k]]
+    candidates.sort(key=lambda k: -sizes[k])
+    index = 0
+    for key in candidates:
+        count = counts[key]
+        if count < min_count:
+            continue
+        name = reused.get(key)
+        if name is None:
+            while f"{prefix}{index}" in taken:
+                index += 1
+            name = f"{prefix}{index}"
+            taken.add(name)
+            new_items.append((key, name))
+        names[key] = name
+        # The occurrences merge into one: so do the subtrees inside them.
+        inner = samples[key]
+        for node in walk(inner):
+            if node is not inner and isinstance(node, (Expr, CaseExpr)):
+                counts[keys(node)] -= count - 1
+
+    if not names:
+        return module
+
+    replaced = {
+        id(a): Assign(a.target, _replace(a.expr, keys, names), a.modifier)
+        for a in assigns
+    }
+    items = [
+        DefineItem(Identifier(name), _replace(samples[key], keys, names, name))
+        for key, name in new_items
+    ]
+    body = []
+    for element in module.body:
+        if isinstance(element, AssignConstraint):
+            if items:
+                body.append(DefineDeclaration(items))
+                items = []
+            element = AssignConstraint(
+                [replaced.get(id(a), a) for a in element.assigns_list]
+            )
+        elif isinstance(element, DefineDeclaration):
+            element = DefineDeclaration(
+                [
+                    DefineItem(
+                        d.identifier,
+                        _replace(d.expr, keys, names, d.identifier.name),
+                    )
+                    for d in element.define_list
+                ]
+            )
+        body.append(element)
+    if items:
+        body.append(DefineDeclaration(items))
+    return Module(module.name, body)
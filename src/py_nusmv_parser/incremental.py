@@ -0,0 +1,175 @@
+import re
+from bisect import bisect_left, bisect_right
+
+from .models import Module
+from .parser import parse_nusmv_string
+
+# Section keywords are reserved words, so each occurrence outside an
+# identifier starts a new top-level section.
+_section_keyword = re.compile(
+    r"(?<![A-Za-z0-9_$#])(MODULE|VAR|DEFINE|ASSIGN)(?![A-Za-z0-9_$#])"
+)
+
+# The text before the first `MODULE` keyword is tracked as a section too, so
+# that every offset in the text belongs to exactly one section.
+_PREAMBLE = ""
+
+
+def _scan_sections(text: str, start: int, end: int):
+    starts, kinds = [], []
+    for match in _section_keyword.finditer(text, start, end):
+        starts.append(match.start())
+        kinds.append(match.group(1))
+    return starts, kinds
+
+
+def _parse_elements(text: str) -> list:
+    """
+    Parse a run of `VAR`/`DEFINE`/`ASSIGN` sections and return the module elements.
+    """
+    module = parse_nusmv_string("MODULE __incremental__ " + text)
+    if module is None:
+        raise SyntaxError("Could not parse the edited section")
+    return module.body
+
+
+def _parse_modules(text: str) -> list[Module]:
+    starts, kinds = _scan_sections(text, 0, len(text))
+    if text[: starts[0] if starts else len(text)].strip() or (
+        starts and kinds[0] != "MODULE"
+    ):
+        raise SyntaxError("Expected MODULE at the start of the edited region")
+    module_starts = [s for s, k in zip(starts, kinds) if k == "MODULE"]
+    modules = []
+    for start, end in zip(module_starts, module_starts[1:] + [len(text)]):
+        module = parse_nusmv_string(text[start:end])
+        if module is None:
+            raise SyntaxError(f"Could not parse the module at offset {start}")
+        modules.append(module)
+    return modules
+
+
+class IncrementalParse:
+    """
+    A parse result that remembers where each top-level section of the source
+    starts, so that `edit()` can re-parse only the sections an edit touches.
+
+    Results are never mutated: `edit()` returns a new `IncrementalParse` that
+    shares every untouched `Module`, `VarDeclaration` and `AssignConstraint`
+    with this one.
+    """
+
+    def __init__(
+        self, text: str, modules: list[Module], starts: list[int], kinds: list[str]
+    ) -> None:
+        self.text = text
+        self.modules = modules
+        # Section i spans text[starts[i]:starts[i + 1]].
+        self._starts = starts
+        self._kinds = kinds
+
+    @property
+    def module(self) -> Module:
+        if len(self.modules) != 1:
+            raise ValueError(f"Source has {len(self.modules)} modules, expected one")
+        return self.modules[0]
+
+    def _end(self, i: int) -> int:
+        return self._starts[i + 1] if i + 1 < len(self._starts) else len(self.text)
+
+    def _locate(self, i: int) -> tuple[int, int]:
+        """
+        Return `(module_index, element_index)` of section `i`.
+        """
+        module_index = element_index = -1
+        for kind in self._kinds[: i + 1]:
+            if kind == "MODULE":
+                module_index += 1
+                element_index = -1
+            elif kind != _PREAMBLE:
+                element_index += 1
+        return module_index, element_index
+
+    def edit(self, offset: int, length: int, new_text: str) -> "IncrementalParse":
+        """
+        Replace `length` characters at `offset` with `new_text` and re-parse.
+
+        Raises `SyntaxError` if the edited text does not parse, in which case
+        this result stays valid and can take the next edit.
+        """
+        if offset < 0 or length < 0 or offset + length > len(self.text):
+            raise ValueError(f"Edit ({offset}, {length}) is outside the text")
+        text = self.text[:offset] + new_text + self.text[offset + length :]
+        delta = len(new_text) - length
+        starts, kinds = self._starts, self._kinds
+
+        # Sections touching the edit, including those adjacent to its ends,
+        # since the edit may join or split their keywords.
+        lo = max(0, bisect_left(starts, offset) - 1)
+        hi = bisect_right(starts, offset + length) - 1
+        region_start = starts[lo]
+        region_end = self._end(hi) + delta
+
+        if all(kind not in ("MODULE", _PREAMBLE) for kind in kinds[lo : hi + 1]):
+            new_starts, new_kinds = _scan_sections(text, region_start, region_end)
+            if (
+                new_starts
+                and new_starts[0] == region_start
+                and "MODULE" not in new_kinds
+            ):
+                module_index, element_lo = self._locate(lo)
+                element_hi = element_lo + hi - lo
+                elements = _parse_elements(text[region_start:region_end])
+                if len(elements) != len(new_starts):
+                    raise SyntaxError("Could not parse the edited section")
+                old = self.modules[module_index]
+                body = old.body[:element_lo] + elements + old.body[element_hi + 1 :]
+                modules = self.modules.copy()
+                modules[module_index] = Module(old.name, body)
+                return IncrementalParse(
+                    text,
+                    modules,
+                    starts[:lo] + new_starts + [s + delta for s in starts[hi + 1 :]],
+                    kinds[:lo] + new_kinds + kinds[hi + 1 :],
+                )
+
+        # The edit touches a MODULE header or moves section boundaries in a
+        # way that cannot be resolved inside one module: re-parse every module
+        # the edit overlaps.
+        while lo > 0 and kinds[lo] != "MODULE":
+            lo -= 1
+        hi += 1
+        while hi < len(kinds) and kinds[hi] != "MODULE":
+            hi += 1
+        region_start = starts[lo]
+        region_end = (starts[hi] if hi < len(starts) else len(self.text)) + delta
+        region = text[region_start:region_end]
+        new_modules = _parse_modules(region)
+        new_starts, new_kinds = _scan_sections(text, region_start, region_end)
+        if lo == 0:
+            new_starts.insert(0, 0)
+            new_kinds.insert(0, _PREAMBLE)
+
+        module_lo = sum(1 for kind in kinds[:lo] if kind == "MODULE")
+        module_hi = sum(1 for kind in kinds[:hi] if kind == "MODULE")
+        return IncrementalParse(
+            text,
+            self.modules[:module_lo] + new_modules + self.modules[module_hi:],
+            starts[:lo] + new_starts + [s + delta for s in starts[hi:]],
+            kinds[:lo] + new_kinds + kinds[hi:],
+        )
+
+
+def parse_incremental(text: str) -> IncrementalParse:
+    """
+    Parse `text`, which may hold several modules, for later incremental edits.
+    """
+    modules = _parse_modules(text)
+    starts, kinds = _scan_sections(text, 0, len(text))
+    return IncrementalParse(text, modules, [0] + starts, [_PREAMBLE] + kinds)
+
+
+def reparse(
+    previous: IncrementalParse, offset: int, length: int, new_text: str
+) -> IncrementalParse:
+    return previous.edit(offset, length, new_text)
@@ -0,0 +1,60 @@
+from .models import BinaryOperator, ComplexIdentifier, Const, Identifier
+
+
+def _key(obj):
+    # Children handed to the table are already canonical, so their identity
+    # stands for their structure. Plain values (operator and field names) are
+    # compared by value.
+    return obj if isinstance(obj, str) else id(obj)
+
+
+class InternTable:
+    """
+    A per-parse table that shares equal nodes.
+
+    `Identifier` and `Const` leaves with the same content are always shared.
+    With `hash_cons=True`, `BinaryOperator` and `ComplexIdentifier` nodes
+    over the same (shared) children are shared as well, so every repeated
+    subexpression is built once.
+
+    Shared nodes appear in several places in the tree and must be treated as
+    immutable: replace them instead of modifying them in place.
+    """
+
+    def __init__(self, hash_cons: bool = False) -> None:
+        self.hash_cons = hash_cons
+        self._identifiers: dict[str, Identifier] = {}
+        self._consts: dict[tuple, Const] = {}
+        self._nodes: dict[tuple, BinaryOperator | ComplexIdentifier] = {}
+
+    def identifier(self, name: str) -> Identifier:
+        node = self._identifiers.get(name)
+        if node is None:
+            node = self._identifiers[name] = Identifier(name)
+        return node
+
+    def const(self, value, type: str) -> Const:
+        # `type` is part of the key because `True == 1` in Python.
+        key = (type, value)
+        node = self._consts.get(key)
+        if node is None:
+            node = self._consts[key] = Const(value, type)
+        return node
+
+    def binary(self, left, operator: str, right) -> BinaryOperator:
+        if not self.hash_cons:
+            return BinaryOperator(left, operator, right)
+        key = (BinaryOperator, _key(left), operator, _key(right))
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = BinaryOperator(left, operator, right)
+        return node
+
+    def complex_identifier(self, target, item, type: str) -> ComplexIdentifier:
+        if not self.hash_cons:
+            return ComplexIdentifier(target, item, type)
+        key = (ComplexIdentifier, _key(target), _key(item), type)
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = ComplexIdentifier(target, item, type)
+        return node
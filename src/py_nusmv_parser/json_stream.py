@@ -0,0 +1,140 @@
+import json.encoder
+from itertools import chain
+from typing import TextIO
+
+from .models import BasicSemantic, get_fields
+
+_encode_str = json.encoder.encode_basestring_ascii
+# Number of chunks collected before they are handed to the stream.
+_FLUSH_EVERY = 4096
+
+
+def _float_repr(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _scalar(value) -> str | None:
+    """
+    The JSON text of a scalar value, or None if `value` is not a scalar.
+    """
+    if isinstance(value, str):
+        return _encode_str(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return _float_repr(value)
+    return None
+
+
+def _key(key) -> str:
+    if isinstance(key, str):
+        return _encode_str(key)
+    text = _scalar(key)
+    if text is None:
+        raise TypeError(
+            f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+        )
+    # Non-string keys are written as strings, like `json.dumps` does.
+    return text if text.startswith('"') else _encode_str(text)
+
+
+def _node_items(node: BasicSemantic):
+    cls = type(node)
+    items = chain(
+        [("_cls", cls.__name__)], ((f, getattr(node, f)) for f in get_fields(cls))
+    )
+    if cls.__dictoffset__:
+        items = chain(items, node.__dict__.items())
+    return items
+
+
+def to_json(node, stream: TextIO, indent: int | str | None = None) -> None:
+    """
+    Write `node` to a text stream as JSON, without building `to_dict()` first.
+
+    The output is identical to `json.dumps(node.to_dict(), indent=indent)`.
+    The tree is walked iteratively and the text is written in small batches,
+    so memory use does not grow with the size of the tree.
+    """
+    if indent is None:
+        item_separator = ", "
+        newline = None
+    else:
+        item_separator = ","
+        newline = "\n"
+        if not isinstance(indent, str):
+            indent = " " * indent
+
+    chunks: list[str] = []
+    write = chunks.append
+    # One iterator of (key, value) pairs per open container, keys being None
+    # inside arrays. The bottom entry holds the root value.
+    stack = [iter([(None, node)])]
+    closers = [""]
+    empty = [True]
+    while stack:
+        for key, value in stack[-1]:
+            break
+        else:
+            stack.pop()
+            if stack and newline is not None and not empty[-1]:
+                write(newline + indent * (len(stack) - 1))
+            empty.pop()
+            write(closers.pop())
+            continue
+
+        if empty[-1]:
+            empty[-1] = False
+        else:
+            write(item_separator)
+        if newline is not None and len(stack) > 1:
+            write(newline + indent * (len(stack) - 1))
+        if key is not None:
+            write(_key(key))
+            write(": ")
+
+        while True:
+            text = _scalar(value)
+            if text is not None:
+                write(text)
+                break
+            if isinstance(value, BasicSemantic) and (
+                type(value).to_dict is BasicSemantic.to_dict
+            ):
+                write("{")
+                stack.append(_node_items(value))
+                closers.append("}")
+            elif isinstance(value, dict):
+                write("{")
+                stack.append(iter(value.items()))
+                closers.append("}")
+            elif isinstance(value, (list, tuple, set)):
+                write("[")
+                stack.append((None, v) for v in value)
+                closers.append("]")
+            elif hasattr(value, "to_dict"):
+                value = value.to_dict()
+                continue
+            else:
+                raise TypeError(
+                    f"Object of type {type(value).__name__} is not JSON serializable"
+                )
+            empty.append(True)
+            break
+
+        if len(chunks) >= _FLUSH_EVERY:
+            stream.write("".join(chunks))
+            chunks.clear()
+    stream.write("".join(chunks))
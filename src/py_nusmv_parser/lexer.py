@@ -1,4 +1,6 @@
-import ply.lex as lex
+import sys
+import threading
+
 from .models import Const
 
 # 定义token
@@ -10,6 +12,7 @@ tokens = (
     "BOOLEAN",
     "MODULE",
     "VAR",
+    "DEFINE",
     "DOTDOT",
     "IDENTIFIER",
     "INTEGER_NUMBER",
@@ -141,6 +144,7 @@ reserved_words_converter = {
     "VAR": "VAR",
     "boolean": "BOOLEAN",
     "ASSIGN": "ASSIGN",
+    "DEFINE": "DEFINE",
     "init": "INIT_LOWERCASE",
     "next": "NEXT_LOWERCASE",
     "case": "CASE",
@@ -152,6 +156,7 @@ t_CASE = r"case"
 t_ESAC = r"esac"
 t_XOR = r"xor"
 t_ASSIGN = r"ASSIGN"
+t_DEFINE = r"DEFINE"
 t_TRUE = r"TRUE"
 t_FALSE = r"FALSE"
 t_MODULE = r"MODULE"
@@ -200,21 +205,39 @@ def t_error(t):
 
 
 # 构建lexer
-lexer = lex.lex()
+# The lexer is built on first use instead of at import time, so importing the
+# package stays cheap.
+_lexer = None
+_lexer_lock = threading.Lock()
+
+
+def get_lexer():
+    """
+    Return the shared lexer, building it on first call.
+    """
+    global _lexer
+    if _lexer is None:
+        with _lexer_lock:
+            if _lexer is None:
+                import ply.lex as lex
+
+                _lexer = lex.lex(module=sys.modules[__name__])
+    return _lexer
+
+
+def __getattr__(name):
+    # Keep `from .lexer import lexer` working without building it at import.
+    if name == "lexer":
+        return get_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # 测试代码
 def test_lexer(input_string):
+    lexer = get_lexer().clone()
     lexer.input(input_string)
     while True:
         tok = lexer.token()
         if not tok:
             break
         print(tok)
-
-
-# 测试
-test_lexer("""
-MODULE Abc
-           VAR a: BOOL;
-""")
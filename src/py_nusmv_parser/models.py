@@ -1,36 +1,105 @@
-from typing import Literal, Union
-from textwrap import indent, dedent
+import gc
+import re
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Literal, TextIO, Union
+from textwrap import indent
 
 
 def indent_4(s: str) -> str:
     return indent(s, "    ")
 
 
+# The line boundaries of `str.splitlines`, which `textwrap.indent` splits on.
+_LINE_BREAK = re.compile("[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def iter_indent_4(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Streaming `indent_4`: prefix every line of the text formed by `chunks`
+    with four spaces, except lines that consist solely of whitespace. The
+    output is identical to `indent_4("".join(chunks))`.
+    """
+    at_line_start = True
+    # Leading whitespace of the current line, until we know whether the line
+    # gets a prefix.
+    pending = []
+    search = _LINE_BREAK.search
+    for chunk in chunks:
+        # Most chunks lie inside a line and pass through as they are.
+        if not at_line_start and search(chunk) is None:
+            yield chunk
+            continue
+        for piece in chunk.splitlines(True):
+            ends_line = search(piece, len(piece) - 1) is not None
+            if not at_line_start:
+                yield piece
+            elif piece.strip():
+                yield "    "
+                yield from pending
+                pending.clear()
+                yield piece
+                at_line_start = False
+            else:
+                pending.append(piece)
+            if ends_line:
+                if pending:
+                    yield "".join(pending)
+                    pending.clear()
+                at_line_start = True
+    if pending:
+        yield "".join(pending)
+
+
+def iter_join(separator: str, elements: Iterable["BasicSemantic"]) -> Iterator[str]:
+    """
+    Streaming `separator.join(e.unparse() for e in elements)`.
+    """
+    for i, element in enumerate(elements):
+        if i:
+            yield separator
+        yield from element.iter_unparse()
+
+
+# Binary operators for which `a op (b op c)` equals `(a op b) op c`.
+ASSOCIATIVE_OPERATORS = frozenset({"&", "|", "||", "xor", "^", "+", "*"})
+
+
+_BINARY_PRIORITY = {
+    "&": 6,
+    "|": 6,
+    "||": 6,
+    "xor": 6,
+    "^": 6,
+    ">=": 5,
+    "<=": 5,
+    ">": 5,
+    "<": 5,
+    "=": 5,
+    "!=": 5,
+    "+": 4,
+    "-": 4,
+    "<<": 4,
+    ">>": 4,
+    "*": 3,
+    "/": 3,
+    "%": 3,
+}
+
+_UNARY_PRIORITY = {"A<>": 10}
+
+# Case and set expressions only parse as operands inside parentheses, so
+# they rank below every operator.
+_BRACKETED_PRIORITY = max(*_BINARY_PRIORITY.values(), *_UNARY_PRIORITY.values()) + 1
+
+
 def get_symbol_priority(kind: Literal["binary", "unary"], symbol):
     """
     Get the priority of symbols.
     """
     if kind == "binary":
-        return {
-            "&": 6,
-            "||": 6,
-            "^": 6,
-            ">=": 5,
-            "<=": 5,
-            ">": 5,
-            "<": 5,
-            "=": 5,
-            "!=": 5,
-            "+": 4,
-            "-": 4,
-            "<<": 4,
-            ">>": 4,
-            "*": 3,
-            "/": 3,
-            "%": 3,
-        }[symbol]
+        return _BINARY_PRIORITY[symbol]
     else:
-        return {"A<>": 10}[symbol]
+        return _UNARY_PRIORITY[symbol]
 
 
 def get_expr_priority(expr: "Expr"):
@@ -39,32 +108,295 @@ def get_expr_priority(expr: "Expr"):
             return get_symbol_priority("binary", expr.operator)
         case UnaryOperator():
             return get_symbol_priority("unary", expr.operator)
-        case Identifier() | Const():
+        case Identifier() | Const() | ComplexIdentifier():
             return -1  # Highest priority
+        case SetExpr() | CaseExpr():
+            return _BRACKETED_PRIORITY
         case _:
             raise NotImplementedError(expr)
 
 
+def iter_unparse_expr(expr: "Expr", streaming: bool = True):
+    """
+    Yield the unparsed text of an operator expression in chunks. Operands
+    that are not operators are streamed too, unless `streaming` is False.
+
+    Operator nodes are walked with an explicit stack, so arbitrarily long
+    operator chains neither hit the recursion limit nor re-copy the text
+    at every level.
+    """
+    stack = [expr]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, BinaryOperator):
+            priority_this = get_expr_priority(item)
+            # If an operand does not have priority then add brackets.
+            # Items are pushed in reverse order of output.
+            # `a & (b & c)` is written `a & b & c`, which parses back to
+            # the same right-nested tree.
+            if get_expr_priority(item.right) >= priority_this and not (
+                item.operator in ASSOCIATIVE_OPERATORS
+                and isinstance(item.right, BinaryOperator)
+                and item.right.operator == item.operator
+            ):
+                stack += [")", item.right, "("]
+            else:
+                stack.append(item.right)
+            stack.append(f" {item.operator} ")
+            if get_expr_priority(item.left) >= priority_this:
+                stack += [")", item.left, "("]
+            else:
+                stack.append(item.left)
+        elif isinstance(item, UnaryOperator):
+            if get_expr_priority(item.operand) >= get_expr_priority(item):
+                stack += [")", item.operand, f"{item.operator} ("]
+            else:
+                stack += [item.operand, f"{item.operator} "]
+        elif streaming:
+            yield from item.iter_unparse()
+        else:
+            yield item.unparse()
+
+
 def to_dict_handler(obj):
-    if hasattr(obj, "to_dict"):
-        return obj.to_dict()
-    elif isinstance(obj, (list, tuple, set)):
-        return [to_dict_handler(i) for i in obj]
-    else:
-        return obj
+    """
+    Convert `obj` to plain dicts and lists, walking nested nodes with an
+    explicit stack so that deep trees do not hit the recursion limit.
+    """
+    root = [None]
+    stack = [(obj, root, 0)]
+    while stack:
+        value, container, key = stack.pop()
+        if (
+            isinstance(value, BasicSemantic)
+            and type(value).to_dict is BasicSemantic.to_dict
+        ):
+            new_dict = container[key] = {"_cls": value.__class__.__name__}
+            for k in get_fields(value.__class__):
+                # Reserve the key now to keep the field order.
+                new_dict[k] = None
+                stack.append((getattr(value, k), new_dict, k))
+            # Subclasses defined without `__slots__` keep their extra
+            # attributes in a `__dict__`.
+            for k, v in getattr(value, "__dict__", {}).items():
+                new_dict[k] = None
+                stack.append((v, new_dict, k))
+        elif hasattr(value, "to_dict"):
+            container[key] = value.to_dict()
+        elif isinstance(value, (list, tuple, set)):
+            new_list = container[key] = [None] * len(value)
+            stack.extend((v, new_list, i) for i, v in enumerate(value))
+        else:
+            container[key] = value
+    return root[0]
+
+
+_fields_cache: dict[type, tuple[str, ...]] = {}
+
+
+def get_fields(cls: type) -> tuple[str, ...]:
+    """
+    Names of the slots declared by `cls` and its bases, in declaration order,
+    leaving out underscored ones.
+    """
+    fields = _fields_cache.get(cls)
+    if fields is None:
+        fields = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            fields.extend([slots] if isinstance(slots, str) else slots)
+        # Underscored slots hold caches, not fields.
+        fields = _fields_cache[cls] = tuple(f for f in fields if not f.startswith("_"))
+    return fields
+
+
+# `to_dict()` and `from_dict()` generate one function per node class the
+# first time they meet it. The generated code reads and writes the slots
+# directly instead of reflecting over each object. Past
+# `_MAX_COMPILED_DEPTH` nesting levels they hand the subtree to the
+# iterative walkers, so deep trees still never hit the recursion limit.
+_MAX_COMPILED_DEPTH = 100
+_SCALARS = frozenset({str, int, bool, float, type(None)})
+_serializers: dict[type, Callable] = {}
+_loaders: dict[type, Callable] = {}
+_node_classes: dict[str, type] = {}
+
+
+@contextmanager
+def gc_paused():
+    # Building a tree allocates many containers and none of them is garbage
+    # yet; the cyclic collector would only rescan them over and over.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _serialize(value, depth):
+    serializer = _serializers.get(type(value))
+    if serializer is None:
+        serializer = _serializers[type(value)] = _make_serializer(type(value))
+    return serializer(value, depth)
+
+
+def _serialize_sequence(value, depth):
+    get = _serializers.get
+    return [
+        v if type(v) in _SCALARS else get(type(v), _serialize)(v, depth) for v in value
+    ]
+
+
+def _serialize_other(value, depth):
+    return value.to_dict() if hasattr(value, "to_dict") else value
+
+
+def _make_serializer(cls: type) -> Callable:
+    if issubclass(cls, (list, tuple, set)):
+        return _serialize_sequence
+    if not issubclass(cls, BasicSemantic) or cls.to_dict is not BasicSemantic.to_dict:
+        return _serialize_other
+    lines = [
+        "def serialize_node(node, depth):",
+        f"    if depth > {_MAX_COMPILED_DEPTH}:",
+        "        return to_dict_handler(node)",
+        "    depth += 1",
+    ]
+    items = [f"'_cls': {cls.__name__!r}"]
+    for i, field in enumerate(get_fields(cls)):
+        lines.append(f"    v{i} = node.{field}")
+        items.append(
+            f"{field!r}: v{i} if type(v{i}) in SCALARS"
+            f" else get(type(v{i}), serialize)(v{i}, depth)"
+        )
+    lines.append(f"    new_dict = {{{', '.join(items)}}}")
+    if cls.__dictoffset__:
+        # Subclasses defined without `__slots__` keep their extra attributes
+        # in a `__dict__`.
+        lines.append("    for k, v in node.__dict__.items():")
+        lines.append(
+            "        new_dict[k] = v if type(v) in SCALARS"
+            " else get(type(v), serialize)(v, depth)"
+        )
+    lines.append("    return new_dict")
+    namespace = {
+        "SCALARS": _SCALARS,
+        "serialize": _serialize,
+        "get": _serializers.get,
+        "to_dict_handler": to_dict_handler,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["serialize_node"]
+
+
+def _node_class(name: str) -> type:
+    cls = _node_classes.get(name)
+    if cls is None:
+        stack = [BasicSemantic]
+        while stack:
+            klass = stack.pop()
+            _node_classes.setdefault(klass.__name__, klass)
+            stack.extend(klass.__subclasses__())
+        cls = _node_classes.get(name)
+        if cls is None:
+            raise ValueError(f"Unknown node class {name!r}")
+    return cls
+
+
+def _load(value, depth):
+    if type(value) is list:
+        return [v if type(v) not in (dict, list) else _load(v, depth) for v in value]
+    cls = _node_class(value["_cls"])
+    loader = _loaders.get(cls)
+    if loader is None:
+        loader = _loaders[cls] = _make_loader(cls)
+    return loader(value, depth)
+
+
+def _make_loader(cls: type) -> Callable:
+    fields = get_fields(cls)
+    lines = [
+        "def load_node(data, depth):",
+        f"    if depth > {_MAX_COMPILED_DEPTH}:",
+        "        return from_dict_iterative(data)",
+        "    depth += 1",
+        "    node = new(cls)",
+    ]
+    for field in fields:
+        lines.append(f"    v = data[{field!r}]")
+        if issubclass(cls, Const) and field == "value":
+            # JSON has no tuples, range constants come back as lists.
+            lines.append(f"    node.{field} = tuple(v) if type(v) is list else v")
+        else:
+            lines.append(
+                f"    node.{field} = v if type(v) not in CONTAINERS else load(v, depth)"
+            )
+    if cls.__dictoffset__:
+        lines.append("    for k, v in data.items():")
+        lines.append("        if k != '_cls' and k not in FIELDS:")
+        lines.append(
+            "            setattr(node, k, v if type(v) not in CONTAINERS else load(v, depth))"
+        )
+    lines.append("    return node")
+    namespace = {
+        "new": cls.__new__,
+        "cls": cls,
+        "FIELDS": frozenset(fields),
+        "CONTAINERS": (dict, list),
+        "load": _load,
+        "from_dict_iterative": _from_dict_iterative,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["load_node"]
+
+
+def _from_dict_iterative(data):
+    root = [None]
+    stack = [(data, root, 0)]
+    while stack:
+        value, target, key = stack.pop()
+        if type(value) is dict:
+            cls = _node_class(value["_cls"])
+            new = cls.__new__(cls)
+            for k, v in value.items():
+                if k == "_cls":
+                    continue
+                if issubclass(cls, Const) and k == "value" and type(v) is list:
+                    setattr(new, k, tuple(v))
+                else:
+                    stack.append((v, new, k))
+        elif type(value) is list:
+            new = [None] * len(value)
+            stack.extend((v, new, i) for i, v in enumerate(value))
+        else:
+            new = value
+        if type(target) is list:
+            target[key] = new
+        else:
+            setattr(target, key, new)
+    return root[0]
+
+
+def from_dict(data: dict) -> "BasicSemantic":
+    """
+    Rebuild a tree from the `_cls`-tagged dicts produced by `to_dict()`.
+    """
+    with gc_paused():
+        return _load(data, 0)
 
 
 class BasicSemantic:
+    # Nodes are slotted to keep large trees small. `__slots__` lists the
+    # fields in the order `to_dict()` emits them.
+    __slots__ = ()
+
     def to_dict(self):
-        new_dict = {"_cls": self.__class__.__name__}
-        for k, v in self.__dict__.items():
-            # if isinstance(v, BasicSemantic):
-            #     new_dict[k] = v.to_dict()
-            # if isinstance(v, list):
-            #     new_dict[k] = [(x.to_dict() if hasattr(x, 'to_dict') else x )for x in v]
-            # else:
-            new_dict[k] = to_dict_handler(v)
-        return new_dict
+        with gc_paused():
+            return _serialize(self, 0)
 
     def unparse(self):
         """
@@ -72,21 +404,50 @@ class BasicSemantic:
         """
         raise NotImplementedError(self.__class__)
 
+    def iter_unparse(self) -> Iterator[str]:
+        """
+        Yield the text of `unparse()` in chunks. Nodes with many children
+        override this so that large trees can be written without building
+        the whole text in memory.
+        """
+        yield self.unparse()
+
+    def unparse_to(self, stream: TextIO) -> None:
+        """
+        Write the text of `unparse()` to a text stream chunk by chunk.
+        """
+        write = stream.write
+        for chunk in self.iter_unparse():
+            write(chunk)
+
+    def to_json(self, stream: TextIO, indent: int | str | None = None) -> None:
+        """
+        Write `json.dumps(self.to_dict(), indent=indent)` to a text stream
+        without building the dict in memory.
+        """
+        from .json_stream import to_json
+
+        to_json(self, stream, indent)
+
     @classmethod
     def unparse_list(cls, elements: list, separator: str = "\n"):
         return separator.join([e.unparse() for e in elements])
 
 
 class Type(BasicSemantic):
-    pass
+    __slots__ = ()
 
 
 class BooleanType(Type):
+    __slots__ = ()
+
     def unparse(self):
         return "boolean"
 
 
 class ModuleType(Type):
+    __slots__ = ("identifier", "parameter_list")
+
     # identifier LPAREN parameter_list RPAREN
     def __init__(self, identifier: "Identifier", parameter_list: list["Expr"]):
         self.identifier = identifier
@@ -98,11 +459,15 @@ class ModuleType(Type):
 
 
 class EnumerationTypeValue(Type):
+    __slots__ = ("identifier",)
+
     def __init__(self, identifier: Union["Identifier", "Const"]):
         self.identifier = identifier
 
 
 class EnumerationType(Type):
+    __slots__ = ("body",)
+
     def __init__(self, body: list[EnumerationTypeValue]):
         self.body = body
 
@@ -117,7 +482,8 @@ class EnumerationType(Type):
 
 
 class Expr(BasicSemantic):
-    pass
+    __slots__ = ()
+
     # def to_dict(self):
     #     new_dict = {}
     #     for k, v in self.__dict__.items():
@@ -135,6 +501,8 @@ class Expr(BasicSemantic):
 
 
 class Identifier(Expr):
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name = name
 
@@ -146,6 +514,8 @@ class Identifier(Expr):
 
 
 class ComplexIdentifier(Expr):
+    __slots__ = ("item", "type", "target")
+
     def __init__(
         self, target: Expr, item: Expr, type: Literal["index", "field", "none"]
     ) -> None:
@@ -155,7 +525,11 @@ class ComplexIdentifier(Expr):
 
     def unparse(self):
         target_uparsed = self.target.unparse() if self.target else ""
-        item_uparsed = self.item.unparse() if self.item else ""
+        # The parser stores the name after `.` as a plain string.
+        if isinstance(self.item, str):
+            item_uparsed = self.item
+        else:
+            item_uparsed = self.item.unparse() if self.item else ""
         match self.type:
             case "none":
                 return f"{target_uparsed}"
@@ -168,6 +542,8 @@ class ComplexIdentifier(Expr):
 
 
 class Const(Expr):
+    __slots__ = ("value", "type")
+
     def __init__(
         self, value: str | int | bool, type: Literal["int", "boolean", "string"]
     ) -> None:
@@ -183,6 +559,8 @@ class Const(Expr):
 
 
 class UnaryOperator(Expr):
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator, operand) -> None:
         self.operator = operator
         self.operand = operand
@@ -191,13 +569,10 @@ class UnaryOperator(Expr):
     #     return f"({self.operator} {self.operand})"
 
     def unparse(self):
-        priority_this = get_expr_priority(self)
-        priority_operator = get_expr_priority(self.operand)
-        operand_parsed = self.operand.unparse()
-        if priority_operator >= priority_this:
-            return f"{self.operator} ({operand_parsed})"
-        else:
-            return f"{self.operator} {operand_parsed}"
+        return "".join(iter_unparse_expr(self, False))
+
+    def iter_unparse(self):
+        return iter_unparse_expr(self)
 
 
 # class VarDeclaration(Expr):
@@ -210,23 +585,49 @@ class UnaryOperator(Expr):
 
 
 class Module(BasicSemantic):
+    __slots__ = ("name", "body", "_symbols")
+
     # identifier, body等属性
     def __init__(self, name: Identifier, body: list) -> None:
         self.name = name
         self.body = body
+        self._symbols = None
+
+    @property
+    def symbols(self) -> "SymbolTable":
+        """
+        An index of the variables declared and assigned in this module. It
+        is built on first use, and rebuilt once a section or section list
+        has been added, removed or replaced, or a `NodeTransformer` has
+        changed a tree in place.
+        """
+        table = getattr(self, "_symbols", None)
+        if table is None or not table.is_current(self):
+            from .symbols import SymbolTable
+
+            table = self._symbols = SymbolTable(self)
+        return table
+
+    def invalidate_symbols(self) -> None:
+        """
+        Drop the index of `symbols`. Call it after changes that `symbols`
+        does not notice, such as renaming an identifier in place.
+        """
+        self._symbols = None
 
     def unparse(self):
         payload = "\n".join([item.unparse() for item in self.body])
-        s = dedent(
-            """
-        MODULE {name}
-        {payload}
-        """
-        )
-        return s.format(name=self.name.unparse(), payload=payload)
+        return f"\nMODULE {self.name.unparse()}\n{payload}\n"
+
+    def iter_unparse(self):
+        yield f"\nMODULE {self.name.unparse()}\n"
+        yield from iter_join("\n", self.body)
+        yield "\n"
 
 
 class VarDeclItem(BasicSemantic):
+    __slots__ = ("identifier", "type_specifier")
+
     def __init__(self, identifier: Identifier, type_specifier: Union[BooleanType, EnumerationType]) -> None:
         self.identifier = identifier
         self.type_specifier = type_specifier
@@ -234,8 +635,15 @@ class VarDeclItem(BasicSemantic):
     def unparse(self):
         return f"{self.identifier.unparse()} : {self.type_specifier.unparse()} ;"
 
+    def iter_unparse(self):
+        yield f"{self.identifier.unparse()} : "
+        yield from self.type_specifier.iter_unparse()
+        yield " ;"
+
 
 class Assign(BasicSemantic):
+    __slots__ = ("target", "expr", "modifier")
+
     def __init__(
         self,
         target: Identifier,
@@ -259,71 +667,125 @@ class Assign(BasicSemantic):
             case _:
                 raise ValueError(self.modifier)
 
+    def iter_unparse(self):
+        match self.modifier:
+            case "init":
+                yield f"init({self.target.unparse()}) := "
+            case "next":
+                yield f"next({self.target.unparse()}) := "
+            case "none":
+                yield f"{self.target.unparse()} := "
+            case _:
+                raise ValueError(self.modifier)
+        yield from self.expr.iter_unparse()
+        yield ";"
+
 
 class SetExpr(Expr):
+    __slots__ = ("set_body",)
+
     def __init__(self, set_body: list[Expr]) -> None:
         self.set_body = set_body
 
     def unparse(self):
         return "{" + self.unparse_list(self.set_body, ", ") + "}"
 
+    def iter_unparse(self):
+        yield "{"
+        yield from iter_join(", ", self.set_body)
+        yield "}"
+
 
 class CaseBodyItem(BasicSemantic):
+    __slots__ = ("condition", "expr")
+
     def __init__(self, condition: Expr, expr: Expr) -> None:
         self.condition = condition
         self.expr = expr
 
+    # A branch is short, `iter_unparse` yields it as one chunk.
     def unparse(self):
         return f"{self.condition.unparse()} : {self.expr.unparse()} ;"
 
 
 class CaseExpr(BasicSemantic):
+    __slots__ = ("case_body",)
+
     def __init__(self, case_body: list[BasicSemantic]) -> None:
         self.case_body = case_body
 
     def unparse(self):
-        template = dedent(
-            """
-            case
-            {case_body}
-            esac
-            """
-        )
-        # return  self.unparse_list(self.case_body) + "\nesac"
-        return template.format(
-            case_body=indent_4(self.unparse_list(self.case_body, "\n"))
-        )
+        case_body = indent_4(self.unparse_list(self.case_body))
+        return f"\ncase\n{case_body}\nesac\n"
+
+    def iter_unparse(self):
+        yield "\ncase\n"
+        yield from iter_indent_4(iter_join("\n", self.case_body))
+        yield "\nesac\n"
 
 
 class AssignConstraint(BasicSemantic):
+    __slots__ = ("assigns_list",)
+
     def __init__(self, assigns_list: list[Assign|CaseExpr]) -> None:
         self.assigns_list = assigns_list
 
     def unparse(self):
-        template = dedent(
-            """
-            ASSIGN
-            {assigns_list}
-            """
-        )
-        return template.format(
-            assigns_list=indent_4(self.unparse_list(self.assigns_list))
-        )
+        assigns_list = indent_4(self.unparse_list(self.assigns_list))
+        return f"\nASSIGN\n{assigns_list}\n"
+
+    def iter_unparse(self):
+        yield "\nASSIGN\n"
+        yield from iter_indent_4(iter_join("\n", self.assigns_list))
+        yield "\n"
 
 
 class VarDeclaration(BasicSemantic):
+    __slots__ = ("var_list",)
+
     def __init__(self, var_list: list[VarDeclItem]) -> None:
         self.var_list = var_list
 
     def unparse(self):
-        template = dedent(
-            """
-                                           VAR
-                                           {var_list}
-                                           """
-        )
+        var_list = indent_4(self.unparse_list(self.var_list))
+        return f"\nVAR\n{var_list}\n"
+
+    def iter_unparse(self):
+        yield "\nVAR\n"
+        yield from iter_indent_4(iter_join("\n", self.var_list))
+        yield "\n"
+
 
-        return template.format(var_list=indent_4(self.unparse_list(self.var_list)))
+class DefineItem(BasicSemantic):
+    __slots__ = ("identifier", "expr")
+
+    def __init__(self, identifier: Identifier, expr: Expr) -> None:
+        self.identifier = identifier
+        self.expr = expr
+
+    def unparse(self):
+        return f"{self.identifier.unparse()} := {self.expr.unparse()};"
+
+    def iter_unparse(self):
+        yield f"{self.identifier.unparse()} := "
+        yield from self.expr.iter_unparse()
+        yield ";"
+
+
+class DefineDeclaration(BasicSemantic):
+    __slots__ = ("define_list",)
+
+    def __init__(self, define_list: list[DefineItem]) -> None:
+        self.define_list = define_list
+
+    def unparse(self):
+        define_list = indent_4(self.unparse_list(self.define_list))
+        return f"\nDEFINE\n{define_list}\n"
+
+    def iter_unparse(self):
+        yield "\nDEFINE\n"
+        yield from iter_indent_4(iter_join("\n", self.define_list))
+        yield "\n"
 
 
 # class VarList(BasicSemantic):
@@ -332,6 +794,8 @@ class VarDeclaration(BasicSemantic):
 
 
 class BinaryOperator(Expr):
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left, operator, right) -> None:
         self.left: Expr = left
         self.operator = operator
@@ -342,22 +806,11 @@ class BinaryOperator(Expr):
 
     def unparse(self):
         """
-        Compare the priority on this level (priority_this) and
-            the sub-expressions (priority_left, priority_right).
+        Compare the priority on this level and the sub-expressions, and add
+        brackets around sub-expressions that do not have priority. See
+        `iter_unparse_expr`.
         """
+        return "".join(iter_unparse_expr(self, False))
 
-        priority_this = get_expr_priority(self)
-        priority_left = get_expr_priority(self.left)
-        priority_right = get_expr_priority(self.right)
-        left_unparsed = self.left.unparse()
-        right_unparsed = self.right.unparse()
-
-        # If left operand does not have priority
-        # then add brackets
-        if priority_left >= priority_this:
-            left_unparsed = f"({left_unparsed})"
-        # If right operand does not have priority
-        # then add brackets
-        if priority_right >= priority_this:
-            right_unparsed = f"({right_unparsed})"
-        return f"{left_unparsed} {self.operator} {right_unparsed}"
+    def iter_unparse(self):
+        return iter_unparse_expr(self)
@@ -1,7 +1,41 @@
-import ply.yacc as yacc
-from .lexer import lexer
+import copy
+import io
+import os
+import re
+import sys
+import threading
+from typing import Iterable, Iterator
+
+from .lexer import get_lexer
 from .lexer import tokens
 from .models import *
+from .interning import InternTable
+
+
+# Leaf and operator nodes are created through these helpers, which share
+# equal nodes when the parse runs with an `InternTable`.
+def _identifier(p, name):
+    table = p.parser.intern_table
+    return Identifier(name) if table is None else table.identifier(name)
+
+
+def _const(p, value, type):
+    table = p.parser.intern_table
+    return Const(value, type) if table is None else table.const(value, type)
+
+
+def _binary(p, left, operator, right):
+    table = p.parser.intern_table
+    if table is None:
+        return BinaryOperator(left, operator, right)
+    return table.binary(left, operator, right)
+
+
+def _complex_identifier(p, target, item, type):
+    table = p.parser.intern_table
+    if table is None:
+        return ComplexIdentifier(target, item, type)
+    return table.complex_identifier(target, item, type)
 
 
 # """
@@ -48,7 +82,8 @@ def p_module_body(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 # module_element :: var_declaration
@@ -69,6 +104,7 @@ def p_module_body(p):
 def p_module_element(p):
     """
     module_element : var_declaration
+        | define_declaration
         | assign_constraint
     """
     p[0] = p[1]
@@ -94,7 +130,8 @@ def p_assign_list(p):
     if len(p) == 3:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 # assign ::
@@ -119,6 +156,31 @@ def p_assign(p):
     # p[0] = Assign(p[1], p[3])
 
 
+# define_declaration :: DEFINE define_body
+# define_body :: identifier := simple_expr ;
+# | define_body identifier := simple_expr ;
+def p_define_declaration(p):
+    """
+    define_declaration : DEFINE define_body
+    """
+    p[0] = DefineDeclaration(p[2])
+
+
+def p_define_body(p):
+    """
+    define_body : identifier ASSIGNMENT_SYMBOL simple_expr SEMICOLON
+        | define_body identifier ASSIGNMENT_SYMBOL simple_expr SEMICOLON
+    """
+    match p[1:]:
+        case [identifier, ":=", simple_expr, ";"]:
+            p[0] = [DefineItem(identifier, simple_expr)]
+        case [define_body, identifier, ":=", simple_expr, ";"]:
+            define_body.append(DefineItem(identifier, simple_expr))
+            p[0] = define_body
+        case _:
+            raise NotImplementedError(p[:])
+
+
 # var_declaration :: VAR var_list
 # var_list :: identifier : type_specifier ;
 # | var_list identifier : type_specifier ;
@@ -139,7 +201,8 @@ def p_var_list(p):
         case [identifier, ":", type_specifier, ";"]:
             p[0] = [VarDeclItem(identifier, type_specifier)]
         case [var_list, identifier, ":", type_specifier, ";"]:
-            p[0] = var_list + [VarDeclItem(identifier, type_specifier)]
+            var_list.append(VarDeclItem(identifier, type_specifier))
+            p[0] = var_list
         case _:
             raise NotImplementedError(p[1:])
 
@@ -184,7 +247,8 @@ def p_enumeration_type_body(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 # enumeration_type_value :: symbolic_constant
@@ -217,7 +281,11 @@ def p_parameter_list(p):
     parameter_list : simple_expr
         | parameter_list COMMA simple_expr
     """
-    p[0] = [p[1]] if len(p) == 2 else p[1] + [p[3]]
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 # next_expr :: basic_expr
@@ -303,50 +371,74 @@ def p_basic_expr(p):
         case _:
             raise NotImplementedError(p[:])
 
-def p_binop_level_6(p):
-    """
-    binop_level_6 : binop_level_5
-        | binop_level_5 AND binop_level_6
-        | binop_level_5 OR binop_level_6
-        | binop_level_5 XOR binop_level_6
-    """
+# Operator chains are collected by left-recursive `*_chain` rules, which keep
+# the LALR stack shallow however long the chain is, and then folded into the
+# same right-nested `BinaryOperator` tree the right-recursive rules built.
+def _fold_right(p, chain):
+    expr = chain[-1]
+    for i in range(len(chain) - 2, 0, -2):
+        expr = _binary(p, chain[i - 1], chain[i], expr)
+    return expr
+
+
+def _extend_chain(p):
     match p[1:]:
         case [expr]:
-            p[0] = expr
-        case [expr_left, op, expr_right]:
-            p[0] = BinaryOperator(expr_left, op, expr_right)
+            p[0] = [expr]
+        case [chain, op, expr]:
+            chain.append(op)
+            chain.append(expr)
+            p[0] = chain
         case _:
             raise NotImplementedError(p[:])
 
 
+def p_binop_level_6(p):
+    """
+    binop_level_6 : binop_level_6_chain
+    """
+    p[0] = _fold_right(p, p[1])
+
+
+def p_binop_level_6_chain(p):
+    """
+    binop_level_6_chain : binop_level_5
+        | binop_level_6_chain AND binop_level_5
+        | binop_level_6_chain OR binop_level_5
+        | binop_level_6_chain XOR binop_level_5
+    """
+    _extend_chain(p)
 
 
 def p_binop_level_5(p):
     """
-    binop_level_5 : bin_op_lv4
-        | bin_op_lv4 EQUALS binop_level_5
+    binop_level_5 : binop_level_5_chain
     """
-    match p[1:]:
-        case [expr]:
-            p[0] = expr
-        case [expr_left, op, expr_right]:
-            p[0] = BinaryOperator(expr_left, op, expr_right)
-        case _:
-            raise NotImplementedError(p[:])
+    p[0] = _fold_right(p, p[1])
+
+
+def p_binop_level_5_chain(p):
+    """
+    binop_level_5_chain : bin_op_lv4
+        | binop_level_5_chain EQUALS bin_op_lv4
+    """
+    _extend_chain(p)
+
 
 def p_binop_level_4(p):
     """
-    bin_op_lv4 : sub_basic_expr PLUS bin_op_lv4
-        | sub_basic_expr
+    bin_op_lv4 : bin_op_lv4_chain
     """
-    match p[:]:
-        case [_, expr, op, expr2]:
-            p[0] = BinaryOperator(expr, op, expr2)
-        case [_, expr]:
-            p[0] = expr
-        case _:
-            raise NotImplementedError(p[:])
-    # p [0] = BinaryOperator(p[1], p[2], p[3])
+    p[0] = _fold_right(p, p[1])
+
+
+def p_binop_level_4_chain(p):
+    """
+    bin_op_lv4_chain : sub_basic_expr
+        | bin_op_lv4_chain PLUS sub_basic_expr
+    """
+    _extend_chain(p)
+
 
 def p_sub_basic_expr(p):
     """
@@ -382,7 +474,8 @@ def p_case_body(p):
         case [basic_expr_1, ':', basic_expr_2, ';']:
             p[0] = [CaseBodyItem(basic_expr_1, basic_expr_2)]
         case [case_body, basic_expr_1, ':', basic_expr_2, ';']:
-            p[0] = case_body + [CaseBodyItem(basic_expr_1, basic_expr_2)]
+            case_body.append(CaseBodyItem(basic_expr_1, basic_expr_2))
+            p[0] = case_body
         case _:
             raise NotImplementedError(p[:])
 
@@ -397,7 +490,8 @@ def p_set_body_expr(p):
         case [basic_expr]:
             p[0] = [basic_expr]
         case [set_body_expr, COMMA, basic_expr]:
-            p[0] = set_body_expr + [basic_expr]
+            set_body_expr.append(basic_expr)
+            p[0] = set_body_expr
 
 
 # Grammar rules
@@ -422,11 +516,11 @@ def p_complex_identifier(p):
     """
     match p[1:]:
         case [str()]:
-            p[0] = Identifier(p[1])
+            p[0] = _identifier(p, p[1])
         case [Expr(), ".", identifier]:
-            p[0] = ComplexIdentifier(p[1], identifier, "field")
+            p[0] = _complex_identifier(p, p[1], identifier, "field")
         case [Expr(), "[", simple_expr, "]"]:
-            p[0] = ComplexIdentifier(p[1], simple_expr, "index")
+            p[0] = _complex_identifier(p, p[1], simple_expr, "index")
         case _:
             raise NotImplementedError(p[:])
     
@@ -442,7 +536,7 @@ def p_identifier(p):
     """
     identifier : IDENTIFIER
     """
-    p[0] = Identifier(p[1])
+    p[0] = _identifier(p, p[1])
 
 
 def p_define_identifier(p):
@@ -459,14 +553,14 @@ def p_symbolic_constant(p):
     """
     symbolic_constant : IDENTIFIER
     """
-    p[0] = Const(p[1], "symbolic")
+    p[0] = _const(p, p[1], "symbolic")
 
 
 def p_integer_constant(p):
     """
     integer_constant : INTEGER_NUMBER
     """
-    p[0] = Const(int(p[1]), "integer")
+    p[0] = _const(p, int(p[1]), "integer")
 
 
 def p_boolean_constant(p):
@@ -474,22 +568,156 @@ def p_boolean_constant(p):
     boolean_constant : TRUE
                      | FALSE
     """
-    p[0] = Const(True if p[1] == "TRUE" else False, "boolean")
+    p[0] = _const(p, True if p[1] == "TRUE" else False, "boolean")
 
 
 def p_range_constant(p):
     """
     range_constant : INTEGER_NUMBER DOTDOT INTEGER_NUMBER
     """
-    p[0] = Const((int(p[1]), int(p[3])), "range")
+    p[0] = _const(p, (int(p[1]), int(p[3])), "range")
 
 
 def p_error(p):
+    if p is None:
+        print("Syntax error at end of input")
+        return
     print(p.lineno)
     print(f"Syntax error at '{p.value}'")
 
 
-parser = yacc.yacc(debug=True)
+# The LALR tables are loaded from the shipped `parsetab.py` on first use and
+# never written back at runtime. After changing a grammar rule, regenerate
+# them with `write_tables()`.
+_parser = None
+_parser_lock = threading.Lock()
+
+
+def get_parser():
+    """
+    Return the shared LALR parser, building it on first call.
+    """
+    global _parser
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                import ply.yacc as yacc
+
+                _parser = yacc.yacc(
+                    module=sys.modules[__name__],
+                    tabmodule="py_nusmv_parser.parsetab",
+                    debug=False,
+                    write_tables=False,
+                )
+                _parser.intern_table = None
+    return _parser
+
+
+def __getattr__(name):
+    # Keep `from .parser import parser` working without building it at import.
+    if name == "parser":
+        return get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class NuSMVParser:
+    """
+    A parser that owns its lexer and LALR parser state.
+
+    The grammar tables are shared, so creating an instance is cheap. An
+    instance must not be used by two threads at the same time; give each
+    thread its own instance or borrow one from a `ParserPool`.
+    """
+
+    def __init__(self) -> None:
+        self.lexer = get_lexer().clone()
+        # The LRParser keeps its state stacks on the instance, the tables are
+        # read-only and can be shared with the master parser.
+        self.parser = copy.copy(get_parser())
+
+    def parse(self, input_string: str, intern: bool = False, hash_cons: bool = False):
+        """
+        Parse one module.
+
+        With `intern=True`, equal `Identifier` and `Const` leaves are shared
+        within the returned tree; `hash_cons=True` also shares repeated
+        operator expressions. See `InternTable` for the caveats.
+        """
+        if intern or hash_cons:
+            self.parser.intern_table = InternTable(hash_cons)
+        try:
+            return self.parser.parse(input_string, lexer=self.lexer)
+        finally:
+            self.parser.intern_table = None
+
+
+_thread_local = threading.local()
+
+
+def parse_nusmv_string(
+    input_string: str, intern: bool = False, hash_cons: bool = False
+):
+    nusmv_parser = getattr(_thread_local, "parser", None)
+    if nusmv_parser is None:
+        nusmv_parser = _thread_local.parser = NuSMVParser()
+    return nusmv_parser.parse(input_string, intern, hash_cons)
+
+
+# `MODULE` is a reserved word, so every occurrence outside an identifier starts
+# a new module.
+_module_keyword = re.compile(r"(?<![A-Za-z0-9_$#])MODULE(?![A-Za-z0-9_$#])")
+
+
+def _split_modules(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """
+    Yield `(line_number, text)` for each `MODULE` section of `lines`.
+    """
+    chunk: list[str] = []
+    chunk_line = line_number = 1
+    for line_number, line in enumerate(lines, 1):
+        pos = 0
+        for match in _module_keyword.finditer(line):
+            chunk.append(line[pos : match.start()])
+            text = "".join(chunk)
+            if text.strip():
+                yield chunk_line, text
+            chunk = []
+            chunk_line = line_number
+            pos = match.start()
+        chunk.append(line[pos:])
+    text = "".join(chunk)
+    if text.strip():
+        yield chunk_line, text
+
+
+def iter_modules(source: str | Iterable[str]) -> Iterator[Module]:
+    """
+    Parse a multi-module model and yield each `Module` as soon as it is parsed.
+
+    `source` is either the model text or an iterable of lines, such as an open
+    file. Only one module's text and tree are held at a time.
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    nusmv_parser = NuSMVParser()
+    for line_number, text in _split_modules(source):
+        module = nusmv_parser.parse(text)
+        if module is None:
+            raise SyntaxError(
+                f"Could not parse the module starting at line {line_number}"
+            )
+        yield module
+
+
+def write_tables():
+    """
+    Regenerate the shipped `parsetab.py` from the grammar rules in this module.
+    """
+    import ply.yacc as yacc
 
-def parse_nusmv_string(input_string: str):
-    return parser.parse(input_string)
\ No newline at end of file
+    yacc.yacc(
+        module=sys.modules[__name__],
+        tabmodule="py_nusmv_parser.parsetab",
+        outputdir=os.path.dirname(os.path.abspath(__file__)),
+        debug=False,
+    )
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'AND ASSIGN ASSIGNMENT_SYMBOL BOOLEAN CASE COLON COMMA DOT DOTDOT EQUALS ESAC FALSE IDENTIFIER INIT_LOWERCASE INTEGER_NUMBER LBRACE LBRACKET LPAREN MODULE NEXT_LOWERCASE OR PLUS RBRACE RBRACKET RPAREN SELF SEMICOLON TRUE VAR XOR\n    module : MODULE identifier module_body\n    \n    module_body : module_element\n        | module_body module_element\n    \n    module_element : var_declaration\n        | assign_constraint\n    \n    assign_constraint : ASSIGN assign_list\n    \n    assign_list : assign SEMICOLON\n        | assign_list assign SEMICOLON\n    \n    assign : complex_identifier ASSIGNMENT_SYMBOL simple_expr\n        | INIT_LOWERCASE LPAREN complex_identifier RPAREN ASSIGNMENT_SYMBOL simple_expr\n        | NEXT_LOWERCASE LPAREN complex_identifier RPAREN ASSIGNMENT_SYMBOL next_expr\n    \n    var_declaration : VAR var_list\n    \n    var_list : identifier COLON type_specifier SEMICOLON\n        | var_list identifier COLON type_specifier SEMICOLON\n    \n    type_specifier : simple_type_specifier\n        | module_type_specifier\n    \n    simple_type_specifier : BOOLEAN\n        | LBRACE enumeration_type_body RBRACE\n    \n    enumeration_type_body : enumeration_type_value\n        | enumeration_type_body COMMA enumeration_type_value\n    \n    enumeration_type_value : symbolic_constant\n        | integer_constant\n    \n    module_type_specifier : identifier LPAREN parameter_list RPAREN\n    \n    parameter_list : simple_expr\n        | parameter_list COMMA simple_expr\n    \n    next_expr : basic_expr\n    \n    simple_expr : basic_expr\n    \n    basic_expr : case_expr\n        | LBRACE set_body_expr RBRACE\n        | binop_level_6\n    \n    binop_level_6 : binop_level_5\n        | binop_level_5 AND binop_level_6\n        | binop_level_5 OR binop_level_6\n        | binop_level_5 XOR binop_level_6\n    \n    binop_level_5 : bin_op_lv4\n        | bin_op_lv4 EQUALS binop_level_5\n    \n    bin_op_lv4 : sub_basic_expr PLUS bin_op_lv4\n        | sub_basic_expr\n    \n    sub_basic_expr :  LPAREN basic_expr RPAREN\n        | constant\n        | variable_identifier\n        | define_identifier\n    \n    case_expr : CASE case_body ESAC\n    \n    case_body : basic_expr COLON basic_expr SEMICOLON\n        | case_body basic_expr COLON basic_expr SEMICOLON\n    \n    set_body_expr : basic_expr\n        | set_body_expr COMMA basic_expr\n    \n    constant : boolean_constant\n        | integer_constant\n        | symbolic_constant\n        | range_constant\n    \n    complex_identifier : IDENTIFIER\n        | complex_identifier DOT IDENTIFIER\n        | complex_identifier LBRACKET simple_expr RBRACKET\n        | SELF\n    \n    variable_identifier : complex_identifier\n    \n    identifier : IDENTIFIER\n    \n    define_identifier : complex_identifier\n    \n    symbolic_constant : IDENTIFIER\n    \n    integer_constant : INTEGER_NUMBER\n    \n    boolean_constant : TRUE\n                     | FALSE\n    \n    range_constant : INTEGER_NUMBER DOTDOT INTEGER_NUMBER\n    '
+_lr_signature = 'AND ASSIGN ASSIGNMENT_SYMBOL BOOLEAN CASE COLON COMMA DEFINE DOT DOTDOT EQUALS ESAC FALSE IDENTIFIER INIT_LOWERCASE INTEGER_NUMBER LBRACE LBRACKET LPAREN MODULE NEXT_LOWERCASE OR PLUS RBRACE RBRACKET RPAREN SELF SEMICOLON TRUE VAR XOR\n    module : MODULE identifier module_body\n    \n    module_body : module_element\n        | module_body module_element\n    \n    module_element : var_declaration\n        | define_declaration\n        | assign_constraint\n    \n    assign_constraint : ASSIGN assign_list\n    \n    assign_list : assign SEMICOLON\n        | assign_list assign SEMICOLON\n    \n    assign : complex_identifier ASSIGNMENT_SYMBOL simple_expr\n        | INIT_LOWERCASE LPAREN complex_identifier RPAREN ASSIGNMENT_SYMBOL simple_expr\n        | NEXT_LOWERCASE LPAREN complex_identifier RPAREN ASSIGNMENT_SYMBOL next_expr\n    \n    define_declaration : DEFINE define_body\n    \n    define_body : identifier ASSIGNMENT_SYMBOL simple_expr SEMICOLON\n        | define_body identifier ASSIGNMENT_SYMBOL simple_expr SEMICOLON\n    \n    var_declaration : VAR var_list\n    \n    var_list : identifier COLON type_specifier SEMICOLON\n        | var_list identifier COLON type_specifier SEMICOLON\n    \n    type_specifier : simple_type_specifier\n        | module_type_specifier\n    \n    simple_type_specifier : BOOLEAN\n        | LBRACE enumeration_type_body RBRACE\n    \n    enumeration_type_body : enumeration_type_value\n        | enumeration_type_body COMMA enumeration_type_value\n    \n    enumeration_type_value : symbolic_constant\n        | integer_constant\n    \n    module_type_specifier : identifier LPAREN parameter_list RPAREN\n    \n    parameter_list : simple_expr\n        | parameter_list COMMA simple_expr\n    \n    next_expr : basic_expr\n    \n    simple_expr : basic_expr\n    \n    basic_expr : case_expr\n        | LBRACE set_body_expr RBRACE\n        | binop_level_6\n    \n    binop_level_6 : binop_level_6_chain\n    \n    binop_level_6_chain : binop_level_5\n        | binop_level_6_chain AND binop_level_5\n        | binop_level_6_chain OR binop_level_5\n        | binop_level_6_chain XOR binop_level_5\n    \n    binop_level_5 : binop_level_5_chain\n    \n    binop_level_5_chain : bin_op_lv4\n        | binop_level_5_chain EQUALS bin_op_lv4\n    \n    bin_op_lv4 : bin_op_lv4_chain\n    \n    bin_op_lv4_chain : sub_basic_expr\n        | bin_op_lv4_chain PLUS sub_basic_expr\n    \n    sub_basic_expr :  LPAREN basic_expr RPAREN\n        | constant\n        | variable_identifier\n        | define_identifier\n    \n    case_expr : CASE case_body ESAC\n    \n    case_body : basic_expr COLON basic_expr SEMICOLON\n        | case_body basic_expr COLON basic_expr SEMICOLON\n    \n    set_body_expr : basic_expr\n        | set_body_expr COMMA basic_expr\n    \n    constant : boolean_constant\n        | integer_constant\n        | symbolic_constant\n        | range_constant\n    \n    complex_identifier : IDENTIFIER\n        | complex_identifier DOT IDENTIFIER\n        | complex_identifier LBRACKET simple_expr RBRACKET\n        | SELF\n    \n    variable_identifier : complex_identifier\n    \n    identifier : IDENTIFIER\n    \n    define_identifier : complex_identifier\n    \n    symbolic_constant : IDENTIFIER\n    \n    integer_constant : INTEGER_NUMBER\n    \n    boolean_constant : TRUE\n                     | FALSE\n    \n    range_constant : INTEGER_NUMBER DOTDOT INTEGER_NUMBER\n    '
     
-_lr_action_items = {'MODULE':([0,],[2,]),'$end':([1,5,6,7,8,11,12,14,24,37,66,87,],[0,-1,-2,-4,-5,-3,-12,-6,-7,-8,-13,-14,]),'IDENTIFIER':([2,9,10,12,14,22,24,25,26,27,28,29,30,36,37,42,44,48,65,66,75,77,78,79,80,81,87,91,93,96,104,105,107,110,117,118,],[4,4,19,4,19,4,-7,59,60,59,19,19,4,71,-8,59,59,59,59,-13,59,59,59,59,59,59,-14,71,59,59,59,59,59,59,-44,-45,]),'VAR':([3,4,5,6,7,8,11,12,14,24,37,66,87,],[9,-57,9,-2,-4,-5,-3,-12,-6,-7,-8,-13,-14,]),'ASSIGN':([3,4,5,6,7,8,11,12,14,24,37,66,87,],[10,-57,10,-2,-4,-5,-3,-12,-6,-7,-8,-13,-14,]),'COLON':([4,13,20,21,38,41,43,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,76,84,92,94,95,97,98,99,100,101,102,103,],[-57,22,-55,30,-56,-28,-30,-31,-35,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,96,-54,-29,-43,110,-32,-33,-34,-36,-37,-39,-63,]),'LPAREN':([4,17,18,25,27,31,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,117,118,],[-57,28,29,48,48,65,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-44,-45,]),'INIT_LOWERCASE':([10,14,24,37,],[17,17,-7,-8,]),'NEXT_LOWERCASE':([10,14,24,37,],[18,18,-7,-8,]),'SELF':([10,14,24,25,27,28,29,37,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,117,118,],[20,20,-7,20,20,20,20,-8,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-44,-45,]),'SEMICOLON':([15,20,23,32,33,34,35,38,39,40,41,43,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,64,84,90,92,94,97,98,99,100,101,102,103,106,111,112,113,114,116,],[24,-55,37,66,-15,-16,-17,-56,-9,-27,-28,-30,-31,-35,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,87,-54,-18,-29,-43,-32,-33,-34,-36,-37,-39,-63,-23,117,-10,-11,-26,118,]),'ASSIGNMENT_SYMBOL':([16,19,20,60,84,85,86,],[25,-52,-55,-53,-54,104,105,]),'DOT':([16,19,20,38,59,60,62,63,84,],[26,-52,-55,26,-52,-53,26,26,-54,]),'LBRACKET':([16,19,20,38,59,60,62,63,84,],[27,-52,-55,27,-52,-53,27,27,-54,]),'RPAREN':([19,20,38,40,41,43,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,62,63,82,84,88,89,92,94,97,98,99,100,101,102,103,115,],[-52,-55,-56,-27,-28,-30,-31,-35,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,85,86,102,-54,106,-24,-29,-43,-32,-33,-34,-36,-37,-39,-63,-25,]),'PLUS':([20,38,47,49,50,51,52,53,54,55,56,57,58,59,60,84,102,103,],[-55,-56,81,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,-54,-39,-63,]),'EQUALS':([20,38,46,47,49,50,51,52,53,54,55,56,57,58,59,60,84,101,102,103,],[-55,-56,80,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,-54,-37,-39,-63,]),'AND':([20,38,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,84,100,101,102,103,],[-55,-56,77,-35,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,-54,-36,-37,-39,-63,]),'OR':([20,38,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,84,100,101,102,103,],[-55,-56,78,-35,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,-54,-36,-37,-39,-63,]),'XOR':([20,38,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,84,100,101,102,103,],[-55,-56,79,-35,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,-54,-36,-37,-39,-63,]),'RBRACKET':([20,38,40,41,43,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,61,84,92,94,97,98,99,100,101,102,103,],[-55,-56,-27,-28,-30,-31,-35,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,84,-54,-29,-43,-32,-33,-34,-36,-37,-39,-63,]),'RBRACE':([20,38,41,43,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,67,68,69,70,71,72,73,74,84,92,94,97,98,99,100,101,102,103,108,109,],[-55,-56,-28,-30,-31,-35,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,90,-19,-21,-22,-59,-60,92,-46,-54,-29,-43,-32,-33,-34,-36,-37,-39,-63,-20,-47,]),'COMMA':([20,38,40,41,43,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,67,68,69,70,71,72,73,74,84,88,89,92,94,97,98,99,100,101,102,103,108,109,115,],[-55,-56,-27,-28,-30,-31,-35,-38,-40,-41,-42,-48,-49,-50,-51,-61,-62,-60,-52,-53,91,-19,-21,-22,-59,-60,93,-46,-54,107,-24,-29,-43,-32,-33,-34,-36,-37,-39,-63,-20,-47,-25,]),'BOOLEAN':([22,30,],[35,35,]),'LBRACE':([22,25,27,30,42,44,48,65,75,93,96,104,105,107,110,117,118,],[36,42,42,36,42,42,42,42,42,42,42,42,42,42,42,-44,-45,]),'CASE':([25,27,42,44,48,65,75,93,96,104,105,107,110,117,118,],[44,44,44,44,44,44,44,44,44,44,44,44,44,-44,-45,]),'TRUE':([25,27,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,117,118,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-44,-45,]),'FALSE':([25,27,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,117,118,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-44,-45,]),'INTEGER_NUMBER':([25,27,36,42,44,48,65,75,77,78,79,80,81,83,91,93,96,104,105,107,110,117,118,],[58,58,72,58,58,58,58,58,58,58,58,58,58,103,72,58,58,58,58,58,58,-44,-45,]),'DOTDOT':([58,],[83,]),'ESAC':([75,117,118,],[94,-44,-45,]),}
+_lr_action_items = {'MODULE':([0,],[2,]),'$end':([1,5,6,7,8,9,13,14,16,18,30,69,77,85,100,105,],[0,-1,-2,-4,-5,-6,-3,-16,-13,-7,-8,-9,-17,-14,-18,-15,]),'IDENTIFIER':([2,10,11,12,14,16,18,26,28,30,31,32,33,34,35,36,42,43,47,49,56,69,76,77,85,88,90,91,92,93,94,100,104,105,107,110,118,119,121,124,131,132,],[4,4,4,23,4,4,23,4,68,-8,68,71,68,23,23,4,82,68,68,68,68,-9,68,-17,-14,68,68,68,68,68,68,-18,82,-15,68,68,68,68,68,68,-51,-52,]),'VAR':([3,4,5,6,7,8,9,13,14,16,18,30,69,77,85,100,105,],[10,-64,10,-2,-4,-5,-6,-3,-16,-13,-7,-8,-9,-17,-14,-18,-15,]),'DEFINE':([3,4,5,6,7,8,9,13,14,16,18,30,69,77,85,100,105,],[11,-64,11,-2,-4,-5,-6,-3,-16,-13,-7,-8,-9,-17,-14,-18,-15,]),'ASSIGN':([3,4,5,6,7,8,9,13,14,16,18,30,69,77,85,100,105,],[12,-64,12,-2,-4,-5,-6,-3,-16,-13,-7,-8,-9,-17,-14,-18,-15,]),'COLON':([4,15,24,25,46,48,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,89,97,106,108,109,111,112,113,114,115,116,117,],[-64,26,-62,36,-32,-34,-35,-36,-40,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,110,-61,-33,-50,124,-37,-38,-39,-42,-45,-46,-70,]),'ASSIGNMENT_SYMBOL':([4,17,20,23,24,27,71,97,98,99,],[-64,28,31,-59,-62,43,-60,-61,118,119,]),'LPAREN':([4,21,22,28,31,33,37,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,131,132,],[-64,34,35,56,56,56,76,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-51,-52,]),'INIT_LOWERCASE':([12,18,30,69,],[21,21,-8,-9,]),'NEXT_LOWERCASE':([12,18,30,69,],[22,22,-8,-9,]),'SELF':([12,18,28,30,31,33,34,35,43,47,49,56,69,76,88,90,91,92,93,94,107,110,118,119,121,124,131,132,],[24,24,24,-8,24,24,24,24,24,24,24,24,-9,24,24,24,24,24,24,24,24,24,24,24,24,24,-51,-52,]),'SEMICOLON':([19,24,29,38,39,40,41,44,45,46,48,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,70,71,75,84,97,103,106,108,111,112,113,114,115,116,117,120,125,126,127,128,130,],[30,-62,69,77,-19,-20,-21,85,-31,-32,-34,-35,-36,-40,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-10,-60,100,105,-61,-22,-33,-50,-37,-38,-39,-42,-45,-46,-70,-27,131,-11,-12,-30,132,]),'DOT':([20,23,24,64,68,71,73,74,97,],[32,-59,-62,32,-59,-60,32,32,-61,]),'LBRACKET':([20,23,24,64,68,71,73,74,97,],[33,-59,-62,33,-59,-60,33,33,-61,]),'RPAREN':([23,24,45,46,48,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,73,74,95,97,101,102,106,108,111,112,113,114,115,116,117,129,],[-59,-62,-31,-32,-34,-35,-36,-40,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,98,99,116,-61,120,-28,-33,-50,-37,-38,-39,-42,-45,-46,-70,-29,]),'PLUS':([24,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,97,115,116,117,],[-62,94,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,-61,-45,-46,-70,]),'EQUALS':([24,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,97,114,115,116,117,],[-62,93,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,-61,-42,-45,-46,-70,]),'AND':([24,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,97,111,112,113,114,115,116,117,],[-62,90,-36,-40,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,-61,-37,-38,-39,-42,-45,-46,-70,]),'OR':([24,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,97,111,112,113,114,115,116,117,],[-62,91,-36,-40,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,-61,-37,-38,-39,-42,-45,-46,-70,]),'XOR':([24,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,97,111,112,113,114,115,116,117,],[-62,92,-36,-40,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,-61,-37,-38,-39,-42,-45,-46,-70,]),'RBRACKET':([24,45,46,48,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,72,97,106,108,111,112,113,114,115,116,117,],[-62,-31,-32,-34,-35,-36,-40,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,97,-61,-33,-50,-37,-38,-39,-42,-45,-46,-70,]),'RBRACE':([24,46,48,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,78,79,80,81,82,83,86,87,97,106,108,111,112,113,114,115,116,117,122,123,],[-62,-32,-34,-35,-36,-40,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,103,-23,-25,-26,-66,-67,106,-53,-61,-33,-50,-37,-38,-39,-42,-45,-46,-70,-24,-54,]),'COMMA':([24,45,46,48,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,71,78,79,80,81,82,83,86,87,97,101,102,106,108,111,112,113,114,115,116,117,122,123,129,],[-62,-31,-32,-34,-35,-36,-40,-41,-43,-44,-47,-48,-49,-55,-56,-57,-58,-63,-68,-69,-67,-59,-60,104,-23,-25,-26,-66,-67,107,-53,-61,121,-28,-33,-50,-37,-38,-39,-42,-45,-46,-70,-24,-54,-29,]),'BOOLEAN':([26,36,],[41,41,]),'LBRACE':([26,28,31,33,36,43,47,49,56,76,88,107,110,118,119,121,124,131,132,],[42,47,47,47,42,47,47,47,47,47,47,47,47,47,47,47,47,-51,-52,]),'CASE':([28,31,33,43,47,49,56,76,88,107,110,118,119,121,124,131,132,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-51,-52,]),'TRUE':([28,31,33,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,131,132,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-51,-52,]),'FALSE':([28,31,33,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,131,132,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-51,-52,]),'INTEGER_NUMBER':([28,31,33,42,43,47,49,56,76,88,90,91,92,93,94,96,104,107,110,118,119,121,124,131,132,],[67,67,67,83,67,67,67,67,67,67,67,67,67,67,67,117,83,67,67,67,67,67,67,-51,-52,]),'DOTDOT':([67,],[96,]),'ESAC':([88,131,132,],[108,-51,-52,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'module':([0,],[1,]),'identifier':([2,9,12,22,30,],[3,13,21,31,31,]),'module_body':([3,],[5,]),'module_element':([3,5,],[6,11,]),'var_declaration':([3,5,],[7,7,]),'assign_constraint':([3,5,],[8,8,]),'var_list':([9,],[12,]),'assign_list':([10,],[14,]),'assign':([10,14,],[15,23,]),'complex_identifier':([10,14,25,27,28,29,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,],[16,16,38,38,62,63,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'type_specifier':([22,30,],[32,64,]),'simple_type_specifier':([22,30,],[33,33,]),'module_type_specifier':([22,30,],[34,34,]),'simple_expr':([25,27,65,104,107,],[39,61,89,112,115,]),'basic_expr':([25,27,42,44,48,65,75,93,96,104,105,107,110,],[40,40,74,76,82,40,95,109,111,40,114,40,116,]),'case_expr':([25,27,42,44,48,65,75,93,96,104,105,107,110,],[41,41,41,41,41,41,41,41,41,41,41,41,41,]),'binop_level_6':([25,27,42,44,48,65,75,77,78,79,93,96,104,105,107,110,],[43,43,43,43,43,43,43,97,98,99,43,43,43,43,43,43,]),'binop_level_5':([25,27,42,44,48,65,75,77,78,79,80,93,96,104,105,107,110,],[45,45,45,45,45,45,45,45,45,45,100,45,45,45,45,45,45,]),'bin_op_lv4':([25,27,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,],[46,46,46,46,46,46,46,46,46,46,46,101,46,46,46,46,46,46,]),'sub_basic_expr':([25,27,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'constant':([25,27,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'variable_identifier':([25,27,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'define_identifier':([25,27,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'boolean_constant':([25,27,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'integer_constant':([25,27,36,42,44,48,65,75,77,78,79,80,81,91,93,96,104,105,107,110,],[53,53,70,53,53,53,53,53,53,53,53,53,53,70,53,53,53,53,53,53,]),'symbolic_constant':([25,27,36,42,44,48,65,75,77,78,79,80,81,91,93,96,104,105,107,110,],[54,54,69,54,54,54,54,54,54,54,54,54,54,69,54,54,54,54,54,54,]),'range_constant':([25,27,42,44,48,65,75,77,78,79,80,81,93,96,104,105,107,110,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'enumeration_type_body':([36,],[67,]),'enumeration_type_value':([36,91,],[68,108,]),'set_body_expr':([42,],[73,]),'case_body':([44,],[75,]),'parameter_list':([65,],[88,]),'next_expr':([105,],[113,]),}
+_lr_goto_items = {'module':([0,],[1,]),'identifier':([2,10,11,14,16,26,36,],[3,15,17,25,27,37,37,]),'module_body':([3,],[5,]),'module_element':([3,5,],[6,13,]),'var_declaration':([3,5,],[7,7,]),'define_declaration':([3,5,],[8,8,]),'assign_constraint':([3,5,],[9,9,]),'var_list':([10,],[14,]),'define_body':([11,],[16,]),'assign_list':([12,],[18,]),'assign':([12,18,],[19,29,]),'complex_identifier':([12,18,28,31,33,34,35,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,],[20,20,64,64,64,73,74,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'type_specifier':([26,36,],[38,75,]),'simple_type_specifier':([26,36,],[39,39,]),'module_type_specifier':([26,36,],[40,40,]),'simple_expr':([28,31,33,43,76,118,121,],[44,70,72,84,102,126,129,]),'basic_expr':([28,31,33,43,47,49,56,76,88,107,110,118,119,121,124,],[45,45,45,45,87,89,95,45,109,123,125,45,128,45,130,]),'case_expr':([28,31,33,43,47,49,56,76,88,107,110,118,119,121,124,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'binop_level_6':([28,31,33,43,47,49,56,76,88,107,110,118,119,121,124,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'binop_level_6_chain':([28,31,33,43,47,49,56,76,88,107,110,118,119,121,124,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'binop_level_5':([28,31,33,43,47,49,56,76,88,90,91,92,107,110,118,119,121,124,],[51,51,51,51,51,51,51,51,51,111,112,113,51,51,51,51,51,51,]),'binop_level_5_chain':([28,31,33,43,47,49,56,76,88,90,91,92,107,110,118,119,121,124,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'bin_op_lv4':([28,31,33,43,47,49,56,76,88,90,91,92,93,107,110,118,119,121,124,],[53,53,53,53,53,53,53,53,53,53,53,53,114,53,53,53,53,53,53,]),'bin_op_lv4_chain':([28,31,33,43,47,49,56,76,88,90,91,92,93,107,110,118,119,121,124,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'sub_basic_expr':([28,31,33,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,],[55,55,55,55,55,55,55,55,55,55,55,55,55,115,55,55,55,55,55,55,]),'constant':([28,31,33,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'variable_identifier':([28,31,33,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'define_identifier':([28,31,33,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'boolean_constant':([28,31,33,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'integer_constant':([28,31,33,42,43,47,49,56,76,88,90,91,92,93,94,104,107,110,118,119,121,124,],[61,61,61,81,61,61,61,61,61,61,61,61,61,61,61,81,61,61,61,61,61,61,]),'symbolic_constant':([28,31,33,42,43,47,49,56,76,88,90,91,92,93,94,104,107,110,118,119,121,124,],[62,62,62,80,62,62,62,62,62,62,62,62,62,62,62,80,62,62,62,62,62,62,]),'range_constant':([28,31,33,43,47,49,56,76,88,90,91,92,93,94,107,110,118,119,121,124,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'enumeration_type_body':([42,],[78,]),'enumeration_type_value':([42,104,],[79,122,]),'set_body_expr':([47,],[86,]),'case_body':([49,],[88,]),'parameter_list':([76,],[101,]),'next_expr':([119,],[127,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,67 +27,74 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> module","S'",1,None,None,None),
-  ('module -> MODULE identifier module_body','module',3,'p_module','parser.py',34),
-  ('module_body -> module_element','module_body',1,'p_module_body','parser.py',45),
-  ('module_body -> module_body module_element','module_body',2,'p_module_body','parser.py',46),
-  ('module_element -> var_declaration','module_element',1,'p_module_element','parser.py',71),
-  ('module_element -> assign_constraint','module_element',1,'p_module_element','parser.py',72),
-  ('assign_constraint -> ASSIGN assign_list','assign_constraint',2,'p_assign_constraint','parser.py',80),
-  ('assign_list -> assign SEMICOLON','assign_list',2,'p_assign_list','parser.py',91),
-  ('assign_list -> assign_list assign SEMICOLON','assign_list',3,'p_assign_list','parser.py',92),
-  ('assign -> complex_identifier ASSIGNMENT_SYMBOL simple_expr','assign',3,'p_assign','parser.py',107),
-  ('assign -> INIT_LOWERCASE LPAREN complex_identifier RPAREN ASSIGNMENT_SYMBOL simple_expr','assign',6,'p_assign','parser.py',108),
-  ('assign -> NEXT_LOWERCASE LPAREN complex_identifier RPAREN ASSIGNMENT_SYMBOL next_expr','assign',6,'p_assign','parser.py',109),
-  ('var_declaration -> VAR var_list','var_declaration',2,'p_var_declaration','parser.py',128),
-  ('var_list -> identifier COLON type_specifier SEMICOLON','var_list',4,'p_var_list','parser.py',135),
-  ('var_list -> var_list identifier COLON type_specifier SEMICOLON','var_list',5,'p_var_list','parser.py',136),
-  ('type_specifier -> simple_type_specifier','type_specifier',1,'p_type_specifier','parser.py',150),
-  ('type_specifier -> module_type_specifier','type_specifier',1,'p_type_specifier','parser.py',151),
-  ('simple_type_specifier -> BOOLEAN','simple_type_specifier',1,'p_simple_type_specifier','parser.py',166),
-  ('simple_type_specifier -> LBRACE enumeration_type_body RBRACE','simple_type_specifier',3,'p_simple_type_specifier','parser.py',167),
-  ('enumeration_type_body -> enumeration_type_value','enumeration_type_body',1,'p_enumeration_type_body','parser.py',182),
-  ('enumeration_type_body -> enumeration_type_body COMMA enumeration_type_value','enumeration_type_body',3,'p_enumeration_type_body','parser.py',183),
-  ('enumeration_type_value -> symbolic_constant','enumeration_type_value',1,'p_enumeration_type_value','parser.py',195),
-  ('enumeration_type_value -> integer_constant','enumeration_type_value',1,'p_enumeration_type_value','parser.py',196),
-  ('module_type_specifier -> identifier LPAREN parameter_list RPAREN','module_type_specifier',4,'p_module_type_specifier','parser.py',206),
-  ('parameter_list -> simple_expr','parameter_list',1,'p_parameter_list','parser.py',218),
-  ('parameter_list -> parameter_list COMMA simple_expr','parameter_list',3,'p_parameter_list','parser.py',219),
-  ('next_expr -> basic_expr','next_expr',1,'p_next_expr','parser.py',227),
-  ('simple_expr -> basic_expr','simple_expr',1,'p_simple_expr','parser.py',234),
-  ('basic_expr -> case_expr','basic_expr',1,'p_basic_expr','parser.py',291),
-  ('basic_expr -> LBRACE set_body_expr RBRACE','basic_expr',3,'p_basic_expr','parser.py',292),
-  ('basic_expr -> binop_level_6','basic_expr',1,'p_basic_expr','parser.py',293),
-  ('binop_level_6 -> binop_level_5','binop_level_6',1,'p_binop_level_6','parser.py',309),
-  ('binop_level_6 -> binop_level_5 AND binop_level_6','binop_level_6',3,'p_binop_level_6','parser.py',310),
-  ('binop_level_6 -> binop_level_5 OR binop_level_6','binop_level_6',3,'p_binop_level_6','parser.py',311),
-  ('binop_level_6 -> binop_level_5 XOR binop_level_6','binop_level_6',3,'p_binop_level_6','parser.py',312),
-  ('binop_level_5 -> bin_op_lv4','binop_level_5',1,'p_binop_level_5','parser.py',327),
-  ('binop_level_5 -> bin_op_lv4 EQUALS binop_level_5','binop_level_5',3,'p_binop_level_5','parser.py',328),
-  ('bin_op_lv4 -> sub_basic_expr PLUS bin_op_lv4','bin_op_lv4',3,'p_binop_level_4','parser.py',340),
-  ('bin_op_lv4 -> sub_basic_expr','bin_op_lv4',1,'p_binop_level_4','parser.py',341),
-  ('sub_basic_expr -> LPAREN basic_expr RPAREN','sub_basic_expr',3,'p_sub_basic_expr','parser.py',354),
-  ('sub_basic_expr -> constant','sub_basic_expr',1,'p_sub_basic_expr','parser.py',355),
-  ('sub_basic_expr -> variable_identifier','sub_basic_expr',1,'p_sub_basic_expr','parser.py',356),
-  ('sub_basic_expr -> define_identifier','sub_basic_expr',1,'p_sub_basic_expr','parser.py',357),
-  ('case_expr -> CASE case_body ESAC','case_expr',3,'p_case_expr','parser.py',370),
-  ('case_body -> basic_expr COLON basic_expr SEMICOLON','case_body',4,'p_case_body','parser.py',379),
-  ('case_body -> case_body basic_expr COLON basic_expr SEMICOLON','case_body',5,'p_case_body','parser.py',380),
-  ('set_body_expr -> basic_expr','set_body_expr',1,'p_set_body_expr','parser.py',395),
-  ('set_body_expr -> set_body_expr COMMA basic_expr','set_body_expr',3,'p_set_body_expr','parser.py',396),
-  ('constant -> boolean_constant','constant',1,'p_constant','parser.py',408),
-  ('constant -> integer_constant','constant',1,'p_constant','parser.py',409),
-  ('constant -> symbolic_constant','constant',1,'p_constant','parser.py',410),
-  ('constant -> range_constant','constant',1,'p_constant','parser.py',411),
-  ('complex_identifier -> IDENTIFIER','complex_identifier',1,'p_complex_identifier','parser.py',420),
-  ('complex_identifier -> complex_identifier DOT IDENTIFIER','complex_identifier',3,'p_complex_identifier','parser.py',421),
-  ('complex_identifier -> complex_identifier LBRACKET simple_expr RBRACKET','complex_identifier',4,'p_complex_identifier','parser.py',422),
-  ('complex_identifier -> SELF','complex_identifier',1,'p_complex_identifier','parser.py',423),
-  ('variable_identifier -> complex_identifier','variable_identifier',1,'p_variable_identifier','parser.py',441),
-  ('identifier -> IDENTIFIER','identifier',1,'p_identifier','parser.py',448),
-  ('define_identifier -> complex_identifier','define_identifier',1,'p_define_identifier','parser.py',455),
-  ('symbolic_constant -> IDENTIFIER','symbolic_constant',1,'p_symbolic_constant','parser.py',465),
-  ('integer_constant -> INTEGER_NUMBER','integer_constant',1,'p_integer_constant','parser.py',472),
-  ('boolean_constant -> TRUE','boolean_constant',1,'p_boolean_constant','parser.py',479),
-  ('boolean_constant -> FALSE','boolean_constant',1,'p_boolean_constant','parser.py',480),
-  ('range_constant -> INTEGER_NUMBER DOTDOT INTEGER_NUMBER','range_constant',3,'p_range_constant','parser.py',487),
+  ('module -> MODULE identifier module_body','module',3,'p_module','parser.py',68),
+  ('module_body -> module_element','module_body',1,'p_module_body','parser.py',79),
+  ('module_body -> module_body module_element','module_body',2,'p_module_body','parser.py',80),
+  ('module_element -> var_declaration','module_element',1,'p_module_element','parser.py',106),
+  ('module_element -> define_declaration','module_element',1,'p_module_element','parser.py',107),
+  ('module_element -> assign_constraint','module_element',1,'p_module_element','parser.py',108),
+  ('assign_constraint -> ASSIGN assign_list','assign_constraint',2,'p_assign_constraint','parser.py',116),
+  ('assign_list -> assign SEMICOLON','assign_list',2,'p_assign_list','parser.py',127),
+  ('assign_list -> assign_list assign SEMICOLON','assign_list',3,'p_assign_list','parser.py',128),
+  ('assign -> complex_identifier ASSIGNMENT_SYMBOL simple_expr','assign',3,'p_assign','parser.py',143),
+  ('assign -> INIT_LOWERCASE LPAREN complex_identifier RPAREN ASSIGNMENT_SYMBOL simple_expr','assign',6,'p_assign','parser.py',144),
+  ('assign -> NEXT_LOWERCASE LPAREN complex_identifier RPAREN ASSIGNMENT_SYMBOL next_expr','assign',6,'p_assign','parser.py',145),
+  ('define_declaration -> DEFINE define_body','define_declaration',2,'p_define_declaration','parser.py',164),
+  ('define_body -> identifier ASSIGNMENT_SYMBOL simple_expr SEMICOLON','define_body',4,'p_define_body','parser.py',171),
+  ('define_body -> define_body identifier ASSIGNMENT_SYMBOL simple_expr SEMICOLON','define_body',5,'p_define_body','parser.py',172),
+  ('var_declaration -> VAR var_list','var_declaration',2,'p_var_declaration','parser.py',189),
+  ('var_list -> identifier COLON type_specifier SEMICOLON','var_list',4,'p_var_list','parser.py',196),
+  ('var_list -> var_list identifier COLON type_specifier SEMICOLON','var_list',5,'p_var_list','parser.py',197),
+  ('type_specifier -> simple_type_specifier','type_specifier',1,'p_type_specifier','parser.py',212),
+  ('type_specifier -> module_type_specifier','type_specifier',1,'p_type_specifier','parser.py',213),
+  ('simple_type_specifier -> BOOLEAN','simple_type_specifier',1,'p_simple_type_specifier','parser.py',228),
+  ('simple_type_specifier -> LBRACE enumeration_type_body RBRACE','simple_type_specifier',3,'p_simple_type_specifier','parser.py',229),
+  ('enumeration_type_body -> enumeration_type_value','enumeration_type_body',1,'p_enumeration_type_body','parser.py',244),
+  ('enumeration_type_body -> enumeration_type_body COMMA enumeration_type_value','enumeration_type_body',3,'p_enumeration_type_body','parser.py',245),
+  ('enumeration_type_value -> symbolic_constant','enumeration_type_value',1,'p_enumeration_type_value','parser.py',258),
+  ('enumeration_type_value -> integer_constant','enumeration_type_value',1,'p_enumeration_type_value','parser.py',259),
+  ('module_type_specifier -> identifier LPAREN parameter_list RPAREN','module_type_specifier',4,'p_module_type_specifier','parser.py',269),
+  ('parameter_list -> simple_expr','parameter_list',1,'p_parameter_list','parser.py',281),
+  ('parameter_list -> parameter_list COMMA simple_expr','parameter_list',3,'p_parameter_list','parser.py',282),
+  ('next_expr -> basic_expr','next_expr',1,'p_next_expr','parser.py',294),
+  ('simple_expr -> basic_expr','simple_expr',1,'p_simple_expr','parser.py',301),
+  ('basic_expr -> case_expr','basic_expr',1,'p_basic_expr','parser.py',358),
+  ('basic_expr -> LBRACE set_body_expr RBRACE','basic_expr',3,'p_basic_expr','parser.py',359),
+  ('basic_expr -> binop_level_6','basic_expr',1,'p_basic_expr','parser.py',360),
+  ('binop_level_6 -> binop_level_6_chain','binop_level_6',1,'p_binop_level_6','parser.py',398),
+  ('binop_level_6_chain -> binop_level_5','binop_level_6_chain',1,'p_binop_level_6_chain','parser.py',405),
+  ('binop_level_6_chain -> binop_level_6_chain AND binop_level_5','binop_level_6_chain',3,'p_binop_level_6_chain','parser.py',406),
+  ('binop_level_6_chain -> binop_level_6_chain OR binop_level_5','binop_level_6_chain',3,'p_binop_level_6_chain','parser.py',407),
+  ('binop_level_6_chain -> binop_level_6_chain XOR binop_level_5','binop_level_6_chain',3,'p_binop_level_6_chain','parser.py',408),
+  ('binop_level_5 -> binop_level_5_chain','binop_level_5',1,'p_binop_level_5','parser.py',415),
+  ('binop_level_5_chain -> bin_op_lv4','binop_level_5_chain',1,'p_binop_level_5_chain','parser.py',422),
+  ('binop_level_5_chain -> binop_level_5_chain EQUALS bin_op_lv4','binop_level_5_chain',3,'p_binop_level_5_chain','parser.py',423),
+  ('bin_op_lv4 -> bin_op_lv4_chain','bin_op_lv4',1,'p_binop_level_4','parser.py',430),
+  ('bin_op_lv4_chain -> sub_basic_expr','bin_op_lv4_chain',1,'p_binop_level_4_chain','parser.py',437),
+  ('bin_op_lv4_chain -> bin_op_lv4_chain PLUS sub_basic_expr','bin_op_lv4_chain',3,'p_binop_level_4_chain','parser.py',438),
+  ('sub_basic_expr -> LPAREN basic_expr RPAREN','sub_basic_expr',3,'p_sub_basic_expr','parser.py',445),
+  ('sub_basic_expr -> constant','sub_basic_expr',1,'p_sub_basic_expr','parser.py',446),
+  ('sub_basic_expr -> variable_identifier','sub_basic_expr',1,'p_sub_basic_expr','parser.py',447),
+  ('sub_basic_expr -> define_identifier','sub_basic_expr',1,'p_sub_basic_expr','parser.py',448),
+  ('case_expr -> CASE case_body ESAC','case_expr',3,'p_case_expr','parser.py',461),
+  ('case_body -> basic_expr COLON basic_expr SEMICOLON','case_body',4,'p_case_body','parser.py',470),
+  ('case_body -> case_body basic_expr COLON basic_expr SEMICOLON','case_body',5,'p_case_body','parser.py',471),
+  ('set_body_expr -> basic_expr','set_body_expr',1,'p_set_body_expr','parser.py',486),
+  ('set_body_expr -> set_body_expr COMMA basic_expr','set_body_expr',3,'p_set_body_expr','parser.py',487),
+  ('constant -> boolean_constant','constant',1,'p_constant','parser.py',500),
+  ('constant -> integer_constant','constant',1,'p_constant','parser.py',501),
+  ('constant -> symbolic_constant','constant',1,'p_constant','parser.py',502),
+  ('constant -> range_constant','constant',1,'p_constant','parser.py',503),
+  ('complex_identifier -> IDENTIFIER','complex_identifier',1,'p_complex_identifier','parser.py',512),
+  ('complex_identifier -> complex_identifier DOT IDENTIFIER','complex_identifier',3,'p_complex_identifier','parser.py',513),
+  ('complex_identifier -> complex_identifier LBRACKET simple_expr RBRACKET','complex_identifier',4,'p_complex_identifier','parser.py',514),
+  ('complex_identifier -> SELF','complex_identifier',1,'p_complex_identifier','parser.py',515),
+  ('variable_identifier -> complex_identifier','variable_identifier',1,'p_variable_identifier','parser.py',530),
+  ('identifier -> IDENTIFIER','identifier',1,'p_identifier','parser.py',537),
+  ('define_identifier -> complex_identifier','define_identifier',1,'p_define_identifier','parser.py',544),
+  ('symbolic_constant -> IDENTIFIER','symbolic_constant',1,'p_symbolic_constant','parser.py',554),
+  ('integer_constant -> INTEGER_NUMBER','integer_constant',1,'p_integer_constant','parser.py',561),
+  ('boolean_constant -> TRUE','boolean_constant',1,'p_boolean_constant','parser.py',568),
+  ('boolean_constant -> FALSE','boolean_constant',1,'p_boolean_constant','parser.py',569),
+  ('range_constant -> INTEGER_NUMBER DOTDOT INTEGER_NUMBER','range_constant',3,'p_range_constant','parser.py',576),
 ]
@@ -0,0 +1,60 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+from .parser import NuSMVParser
+
+
+class ParserPool:
+    """
+    A bounded pool of `NuSMVParser` instances for thread-based servers.
+
+    Parsers are created on demand up to `size`. When all of them are borrowed,
+    `acquire()` blocks until one is released or `timeout` seconds have passed.
+    """
+
+    def __init__(self, size: int = 8) -> None:
+        if size < 1:
+            raise ValueError(f"Pool size must be positive, got {size}")
+        self.size = size
+        self._idle: queue.LifoQueue[NuSMVParser] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> NuSMVParser:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if can_create:
+            try:
+                return NuSMVParser()
+            except BaseException:
+                with self._lock:
+                    self._created -= 1
+                raise
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No parser became available within {timeout} seconds"
+            ) from None
+
+    def release(self, nusmv_parser: NuSMVParser) -> None:
+        self._idle.put(nusmv_parser)
+
+    @contextmanager
+    def borrow(self, timeout: float | None = None):
+        nusmv_parser = self.acquire(timeout)
+        try:
+            yield nusmv_parser
+        finally:
+            self.release(nusmv_parser)
+
+    def parse(self, input_string: str, timeout: float | None = None):
+        with self.borrow(timeout) as nusmv_parser:
+            return nusmv_parser.parse(input_string)
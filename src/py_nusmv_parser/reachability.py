@@ -0,0 +1,447 @@
+"""
+Explicit-state reachability.
+
+`reachable` explores the states of a module breadth-first from its initial
+states. Each state is packed into an integer, with a bit field per
+variable wide enough for the values of its type, so the visited set holds
+plain integers, or bits of a bitmap when the state space is small enough.
+
+Large frontiers are expanded on a process pool. Every worker compiles the
+module once, and gets chunks of packed states back and forth.
+
+Only `boolean` and enumeration variables are supported. Sets may appear
+as whole assignment values or `case` branches, not inside operators.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Sequence
+
+from . import codec
+from .compiled import compile_expr, symbolic_constants
+from .models import (
+    BooleanType,
+    CaseExpr,
+    Const,
+    EnumerationType,
+    Expr,
+    Module,
+    SetExpr,
+)
+from .slicing import evaluation_order
+from .visitor import walk
+
+# Up to this many bits per state, visited states are kept in a bitmap
+# (at most 16 MiB) instead of a set.
+_BITMAP_BITS = 27
+
+# Frontiers smaller than this are expanded in the main process.
+_MIN_PARALLEL_FRONTIER = 512
+
+
+class StateSpace:
+    """
+    The packing of the states of a module into integers: variable `i`
+    holds the index of its value in `domains[i]` at bit `offsets[i]`.
+    """
+
+    __slots__ = ("variables", "domains", "indexes", "offsets", "masks", "bits")
+
+    def __init__(self, module: Module) -> None:
+        symbols = module.symbols
+        self.variables: list[str] = []
+        self.domains: list[tuple] = []
+        for name in symbols:
+            declaration = symbols[name].declaration
+            if declaration is None:
+                continue
+            match declaration.type_specifier:
+                case BooleanType():
+                    domain = (False, True)
+                case EnumerationType(body=body):
+                    domain = tuple(v.identifier.value for v in body)
+                case other:
+                    raise NotImplementedError(f"{name}: {other.unparse()}")
+            self.variables.append(name)
+            self.domains.append(domain)
+        self.indexes = [{v: i for i, v in enumerate(d)} for d in self.domains]
+        self.offsets = []
+        self.masks = []
+        bits = 0
+        for domain in self.domains:
+            width = max(1, (len(domain) - 1).bit_length())
+            self.offsets.append(bits)
+            self.masks.append((1 << width) - 1)
+            bits += width
+        self.bits = bits
+
+    def pack(self, values: Sequence) -> int:
+        state = 0
+        for value, index, offset, name in zip(
+            values, self.indexes, self.offsets, self.variables
+        ):
+            position = index.get(value)
+            if position is None:
+                raise ValueError(f"{value!r} is out of the range of {name!r}")
+            state |= position << offset
+        return state
+
+    def unpack(self, state: int) -> tuple:
+        return tuple(
+            domain[(state >> offset) & mask]
+            for domain, offset, mask in zip(self.domains, self.offsets, self.masks)
+        )
+
+    def size(self) -> int:
+        """
+        The number of states, reachable or not.
+        """
+        count = 1
+        for domain in self.domains:
+            count *= len(domain)
+        return count
+
+
+def _is_choice(node) -> bool:
+    return isinstance(node, SetExpr) or (
+        isinstance(node, Const) and node.type == "range"
+    )
+
+
+def _choices(expr: Expr, layout: dict[str, int], codes: dict[str, str]) -> Callable:
+    """
+    Compile `expr` to a function giving the tuple of its possible values.
+    """
+    match expr:
+        case Const(type="range"):
+            values = tuple(range(expr.value[0], expr.value[1] + 1))
+            return lambda state: values
+        case SetExpr():
+            fns = [_choices(e, layout, codes) for e in expr.set_body]
+            return lambda state: tuple(v for fn in fns for v in fn(state))
+        case CaseExpr() if any(map(_is_choice, walk(expr))):
+            branches = [
+                (
+                    compile_expr(item.condition, layout, codes),
+                    _choices(item.expr, layout, codes),
+                )
+                for item in expr.case_body
+            ]
+
+            def case(state):
+                for condition, values in branches:
+                    if condition(state):
+                        return values(state)
+                raise ValueError("No case condition holds")
+
+            return case
+    if any(map(_is_choice, walk(expr))):
+        raise NotImplementedError(f"Set inside an operator: {expr.unparse()}")
+    fn = compile_expr(expr, layout, codes)
+    return lambda state: (fn(state),)
+
+
+class _Engine:
+    """
+    Initial states, successors and invariant checks over packed states.
+    Unpacked states are lists of the values of the variables, then of the
+    defines.
+    """
+
+    def __init__(self, module: Module, invariants: Sequence[Expr]) -> None:
+        space = self.space = StateSpace(module)
+        symbols = module.symbols
+        variables = space.variables
+        defines = {n: symbols[n].define.expr for n in symbols if symbols[n].define}
+        names = variables + [n for n in defines if n not in variables]
+        layout = {name: i for i, name in enumerate(names)}
+        codes = symbolic_constants(module)
+        self.width = len(names)
+
+        init: dict[str, Expr] = {}
+        next: dict[str, Expr] = {}
+        settled: dict[str, Expr] = {}
+        for name in symbols:
+            assigns = symbols[name].assigns
+            if any(assigns.values()) and name not in space.variables:
+                raise ValueError(f"Assignment to undeclared variable {name!r}")
+            for target, modifier in ((init, "init"), (next, "next"), (settled, "none")):
+                for assign in assigns[modifier]:
+                    target[name] = assign.expr
+
+        def steps(exprs):
+            return [
+                (layout[n], _choices(exprs[n], layout, codes))
+                for n in evaluation_order(exprs)
+            ]
+
+        # Defines and `x := e` variables follow from the other variables.
+        self.define_steps = steps(defines)
+        self.settle_steps = steps({**defines, **settled})
+        self.init_steps = [
+            (i, lambda state, domain=domain: domain)
+            for i, (name, domain) in enumerate(zip(variables, space.domains))
+            if name not in init and name not in settled
+        ] + steps({**defines, **init, **settled})
+        self.next_steps = [
+            (
+                i,
+                (
+                    _choices(next[name], layout, codes)
+                    if name in next
+                    else lambda state, d=domain: d
+                ),
+            )
+            for i, (name, domain) in enumerate(zip(variables, space.domains))
+            if name not in settled
+        ]
+        self.invariants = [compile_expr(expr, layout, codes) for expr in invariants]
+
+    @staticmethod
+    def _expand(states: list[list], steps) -> list[list]:
+        # Branches every state on the possible values of each step in turn.
+        for position, choices in steps:
+            expanded = []
+            for state in states:
+                values = choices(state)
+                if len(values) == 1:
+                    state[position] = values[0]
+                    expanded.append(state)
+                    continue
+                for value in values:
+                    new = state.copy()
+                    new[position] = value
+                    expanded.append(new)
+            states = expanded
+        return states
+
+    def _packed(self, states: list[list]) -> list[tuple[int, list]]:
+        count = len(self.space.variables)
+        pack = self.space.pack
+        return [(pack(state[:count]), state) for state in states]
+
+    def initial(self) -> list[tuple[int, list]]:
+        """
+        The initial states, packed and unpacked.
+        """
+        return self._packed(self._expand([[None] * self.width], self.init_steps))
+
+    def successors(self, packed: int) -> list[tuple[int, list]]:
+        """
+        The successors of a packed state, packed and unpacked.
+        """
+        padding = [None] * (self.width - len(self.space.variables))
+        current = list(self.space.unpack(packed)) + padding
+        current = self._expand([current], self.define_steps)[0]
+        positions = [position for position, _ in self.next_steps]
+        choices = [fn(current) for _, fn in self.next_steps]
+        empty = [None] * self.width
+        states = []
+        for values in itertools.product(*choices):
+            state = empty.copy()
+            for position, value in zip(positions, values):
+                state[position] = value
+            states.append(state)
+        return self._packed(self._expand(states, self.settle_steps))
+
+    def violated(self, state: list) -> list[int]:
+        return [i for i, fn in enumerate(self.invariants) if not fn(state)]
+
+    def expand(self, frontier: Iterable[int]) -> tuple[set[int], list[tuple[int, int]]]:
+        """
+        The successors of the states in `frontier`, and the (invariant,
+        state) pairs of the successors that violate an invariant.
+        """
+        found = set()
+        violations = []
+        for state in frontier:
+            for packed, full in self.successors(state):
+                if packed not in found:
+                    found.add(packed)
+                    violations += [(i, packed) for i in self.violated(full)]
+        return found, violations
+
+
+# The engine of a pool worker, built once by `_start_worker`.
+_worker_engine: _Engine | None = None
+
+
+def _start_worker(module: bytes, invariants: list[bytes]) -> None:
+    global _worker_engine
+    _worker_engine = _Engine(codec.loads(module), [codec.loads(i) for i in invariants])
+
+
+def _expand_chunk(chunk: list[int]):
+    return _worker_engine.expand(chunk)
+
+
+class _Bitmap:
+    # The visited states of a small state space, one bit each.
+    __slots__ = ("bits", "count")
+
+    def __init__(self, bits: int) -> None:
+        self.bits = bytearray(((1 << bits) + 7) >> 3)
+        self.count = 0
+
+    def add(self, state: int) -> bool:
+        byte, bit = state >> 3, 1 << (state & 7)
+        if self.bits[byte] & bit:
+            return False
+        self.bits[byte] |= bit
+        self.count += 1
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class _HashSet:
+    __slots__ = ("states",)
+
+    def __init__(self) -> None:
+        self.states: set[int] = set()
+
+    def add(self, state: int) -> bool:
+        states = self.states
+        count = len(states)
+        states.add(state)
+        return len(states) != count
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+
+class InvariantViolation:
+    """
+    A reachable state where `invariant` does not hold, at the smallest
+    `depth` (number of steps from an initial state) where it fails.
+    """
+
+    __slots__ = ("invariant", "state", "depth")
+
+    def __init__(self, invariant: str, state: dict, depth: int) -> None:
+        self.invariant = invariant
+        self.state = state
+        self.depth = depth
+
+    def __repr__(self) -> str:
+        return f"InvariantViolation({self.invariant!r}, depth={self.depth}, state={self.state})"
+
+
+class ReachabilityResult:
+    """
+    The outcome of `reachable`. `states` counts the reachable states found,
+    `depth` is the number of steps to the farthest of them, and `complete`
+    is False when the search stopped at `max_states`.
+    """
+
+    __slots__ = ("states", "depth", "complete", "violations")
+
+    def __init__(
+        self,
+        states: int,
+        depth: int,
+        complete: bool,
+        violations: list[InvariantViolation],
+    ) -> None:
+        self.states = states
+        self.depth = depth
+        self.complete = complete
+        self.violations = violations
+
+    def __repr__(self) -> str:
+        return (
+            f"ReachabilityResult(states={self.states}, depth={self.depth},"
+            f" complete={self.complete}, violations={len(self.violations)})"
+        )
+
+
+def _invariant(invariant: Expr | str) -> Expr:
+    if not isinstance(invariant, str):
+        return invariant
+    from .parser import parse_nusmv_string
+
+    module = parse_nusmv_string(f"MODULE _ ASSIGN _ := {invariant};")
+    return module.body[0].assigns_list[0].expr
+
+
+def reachable(
+    module: Module,
+    invariants: Iterable[Expr | str] = (),
+    workers: int = 1,
+    max_states: int | None = None,
+) -> ReachabilityResult:
+    """
+    Explore the states reachable from the initial states of `module`, and
+    check `invariants` (expressions, or their text) in each of them. The
+    first violation found of each invariant is reported, at the smallest
+    depth where it fails.
+
+    With `workers > 1`, large frontiers are expanded on a process pool of
+    that many processes (`os.cpu_count()` for `workers=0`).
+    """
+    invariants = [_invariant(i) for i in invariants]
+    texts = [" ".join(i.unparse().split()) for i in invariants]
+    engine = _Engine(module, invariants)
+    space = engine.space
+    visited = _Bitmap(space.bits) if space.bits <= _BITMAP_BITS else _HashSet()
+    violations: dict[int, InvariantViolation] = {}
+
+    def found(index: int, packed: int, depth: int) -> None:
+        if index not in violations:
+            state = dict(zip(space.variables, space.unpack(packed)))
+            violations[index] = InvariantViolation(texts[index], state, depth)
+
+    frontier = []
+    for packed, state in engine.initial():
+        if visited.add(packed):
+            frontier.append(packed)
+            for index in engine.violated(state):
+                found(index, packed, 0)
+
+    workers = workers or os.cpu_count() or 1
+    pool = None
+    depth = 0
+    complete = True
+    try:
+        while frontier:
+            if max_states is not None and len(visited) >= max_states:
+                complete = False
+                break
+            if workers > 1 and len(frontier) >= _MIN_PARALLEL_FRONTIER:
+                if pool is None:
+                    pool = ProcessPoolExecutor(
+                        workers,
+                        initializer=_start_worker,
+                        initargs=(
+                            codec.dumps(module),
+                            [codec.dumps(i) for i in invariants],
+                        ),
+                    )
+                chunks = [frontier[i :: workers * 4] for i in range(workers * 4)]
+                results = list(pool.map(_expand_chunk, chunks))
+            else:
+                results = [engine.expand(frontier)]
+            next_frontier = []
+            for successors, bad in results:
+                bad_states: dict[int, list[int]] = {}
+                for index, packed in bad:
+                    bad_states.setdefault(packed, []).append(index)
+                for packed in successors:
+                    if visited.add(packed):
+                        next_frontier.append(packed)
+                        for index in bad_states.get(packed, ()):
+                            found(index, packed, depth + 1)
+            if next_frontier:
+                depth += 1
+            frontier = next_frontier
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return ReachabilityResult(
+        len(visited),
+        depth,
+        complete,
+        [violations[i] for i in sorted(violations)],
+    )
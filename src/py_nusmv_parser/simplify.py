@@ -0,0 +1,158 @@
+"""
+Constant folding and expression simplification.
+
+The rules only rely on the meaning of the operators, never on the types of
+variables:
+
+- operators over constants are folded: `1 + 2`, `TRUE & FALSE`, `3 = 3`;
+- `TRUE & x`, `FALSE | x`, `FALSE xor x`, `0 + x` become `x`, and
+  `FALSE & x`, `TRUE | x` become the constant;
+- `x & x`, `x | x` become `x`, `x = x` becomes `TRUE` and `x != x`
+  `FALSE`, as long as `x` has no nondeterministic `{...}` choice in it;
+- constants next to each other in a `+` chain are added up;
+- `case` branches after a `TRUE` condition or with a `FALSE` condition are
+  dropped, and `case TRUE : e; esac` becomes `e`;
+- repeated elements of a set are dropped, and `{x}` becomes `x`.
+"""
+
+from .models import BasicSemantic, BinaryOperator, CaseExpr, Const, SetExpr
+from .visitor import NodeTransformer, StructuralKeys, walk
+
+
+def _bool(node) -> bool | None:
+    if isinstance(node, Const) and node.type == "boolean":
+        return node.value
+    return None
+
+
+def _int(node) -> int | None:
+    if isinstance(node, Const) and node.type == "integer":
+        return node.value
+    return None
+
+
+def _same_op(node, operator: str) -> bool:
+    return isinstance(node, BinaryOperator) and node.operator == operator
+
+
+class Simplifier(NodeTransformer):
+    """
+    The transformer behind `simplify`. Nodes are rewritten bottom-up, so
+    every rule sees operands that are already simplified.
+    """
+
+    def __init__(self, copy: bool = True) -> None:
+        super().__init__(copy)
+        self.keys = StructuralKeys()
+        self._pure: dict[int, bool] = {}
+
+    def _equal(self, a, b) -> bool:
+        return a is b or self.keys(a) == self.keys(b)
+
+    def _is_pure(self, node) -> bool:
+        key = self.keys(node)
+        pure = self._pure.get(key)
+        if pure is None:
+            pure = self._pure[key] = not any(isinstance(n, SetExpr) for n in walk(node))
+        return pure
+
+    def _idempotent(self, left, right) -> bool:
+        return self._equal(left, right) and self._is_pure(left)
+
+    def visit_BinaryOperator(self, node: BinaryOperator) -> BasicSemantic:
+        left, op, right = node.left, node.operator, node.right
+        match op:
+            case "&" | "|" | "||":
+                # TRUE is the identity of `&` and FALSE the one of `|`.
+                identity = op == "&"
+                for a, b in ((left, right), (right, left)):
+                    value = _bool(a)
+                    if value is not None:
+                        return b if value == identity else a
+                if self._idempotent(left, right):
+                    return left
+                if _same_op(right, op) and self._idempotent(left, right.left):
+                    return right
+            case "xor":
+                lvalue, rvalue = _bool(left), _bool(right)
+                if lvalue is not None and rvalue is not None:
+                    return Const(lvalue != rvalue, "boolean")
+                if lvalue is False:
+                    return right
+                if rvalue is False:
+                    return left
+            case "=" | "!=":
+                if isinstance(left, Const) and isinstance(right, Const):
+                    if left.type == right.type and left.type != "range":
+                        equal = left.value == right.value
+                        return Const(equal == (op == "="), "boolean")
+                elif self._idempotent(left, right):
+                    return Const(op == "=", "boolean")
+            case "+":
+                return self._add(left, right) or node
+        return node
+
+    def _add(self, left, right) -> BasicSemantic | None:
+        """
+        The simplified `left + right`, or None when no rule applies.
+        """
+        lvalue, rvalue = _int(left), _int(right)
+        if lvalue is not None and rvalue is not None:
+            return Const(lvalue + rvalue, "integer")
+        if lvalue == 0:
+            return right
+        if rvalue == 0:
+            return left
+        if lvalue is not None and _same_op(right, "+"):
+            # 1 + (2 + x) == 3 + x, and 1 + (x + 2) == x + 3.
+            inner_left, inner_right = _int(right.left), _int(right.right)
+            if inner_left is not None:
+                total = Const(lvalue + inner_left, "integer")
+                rest = right.right
+                return self._add(total, rest) or BinaryOperator(total, "+", rest)
+            if inner_right is not None:
+                total = Const(lvalue + inner_right, "integer")
+                rest = right.left
+                return self._add(rest, total) or BinaryOperator(rest, "+", total)
+        return None
+
+    def visit_CaseExpr(self, node: CaseExpr) -> BasicSemantic:
+        branches = []
+        for item in node.case_body:
+            condition = _bool(item.condition)
+            if condition is False:
+                continue
+            branches.append(item)
+            if condition is True:
+                break
+        if not branches:
+            # Every condition is FALSE: leave the error for NuSMV to report.
+            return node
+        if _bool(branches[0].condition) is True:
+            return branches[0].expr
+        if len(branches) == len(node.case_body):
+            return node
+        return CaseExpr(branches)
+
+    def visit_SetExpr(self, node: SetExpr) -> BasicSemantic:
+        elements = []
+        seen = set()
+        for element in node.set_body:
+            key = self.keys(element)
+            if key not in seen:
+                seen.add(key)
+                elements.append(element)
+        if len(elements) == 1:
+            return elements[0]
+        if len(elements) == len(node.set_body):
+            return node
+        return SetExpr(elements)
+
+
+def simplify(node: BasicSemantic, copy: bool = True) -> BasicSemantic:
+    """
+    Simplify every expression in `node`. With `copy=True` (the default)
+    `node` is left untouched and unchanged subtrees are shared with the
+    result; with `copy=False` the tree is rewritten in place.
+    """
+    return Simplifier(copy).visit(node)
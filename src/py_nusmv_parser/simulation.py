@@ -0,0 +1,182 @@
+"""
+Batched random simulation.
+
+`Simulator` steps many independent runs of a module at once. The state of
+all runs is held columnwise, one NumPy array per variable, and every
+assignment is evaluated for all runs in one go with `evaluate_batch`:
+
+- `init(x) := e` and `next(x) := e` give the first and the next values;
+- `x := e` and `DEFINE x := e` hold in every state;
+- a variable without an assignment takes any value of its type;
+- `{...}` sets and ranges pick one of their values per run.
+
+Traces are streamed to a file: a one line JSON header, then for every step
+the values of all variables in all runs as a `(variables, runs)` array.
+`load_trace` maps such a file back into memory.
+"""
+
+import json
+import os
+from typing import Iterator
+
+import numpy as np
+
+from .models import BooleanType, EnumerationType, Expr, Module
+from .slicing import evaluation_order
+from .vectorized import EnumCodes, evaluate_batch
+
+TRACE_FORMAT = 1
+
+
+class Simulator:
+    """
+    Simulates `runs` independent runs of `module`. Runs are reproducible
+    for a given `seed`.
+    """
+
+    def __init__(
+        self, module: Module, runs: int = 1000, seed: int | None = None
+    ) -> None:
+        self.runs = runs
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.codes = EnumCodes.from_module(module)
+        symbols = module.symbols
+
+        self.variables: list[str] = []
+        self.domains: dict[str, np.ndarray] = {}
+        for name in symbols:
+            declaration = symbols[name].declaration
+            if declaration is None:
+                continue
+            match declaration.type_specifier:
+                case BooleanType():
+                    domain = np.array([False, True])
+                case EnumerationType(body=body):
+                    domain = self.codes.encode(v.identifier.value for v in body)
+                case other:
+                    raise NotImplementedError(f"{name}: {other.unparse()}")
+            self.variables.append(name)
+            self.domains[name] = domain
+
+        invariants: dict[str, Expr] = {}
+        self.init: dict[str, Expr] = {}
+        self.next: dict[str, Expr] = {}
+        for name in symbols:
+            symbol = symbols[name]
+            if symbol.define is not None:
+                invariants[name] = symbol.define.expr
+            for modifier, target in (("init", self.init), ("next", self.next)):
+                for assign in symbol.assigns[modifier]:
+                    target[name] = assign.expr
+            for assign in symbol.assigns["none"]:
+                invariants[name] = assign.expr
+            assigned = any(symbol.assigns.values())
+            if assigned and name not in self.domains:
+                raise ValueError(f"Assignment to undeclared variable {name!r}")
+        self.invariants = invariants
+        # Variables that take any value in the first and in later states.
+        self._free_init = [
+            v for v in self.variables if v not in self.init and v not in invariants
+        ]
+        self._free_next = [
+            v for v in self.variables if v not in self.next and v not in invariants
+        ]
+        self._init_order = evaluation_order({**self.init, **invariants})
+        self._invariant_order = evaluation_order(invariants)
+
+    def _evaluate(self, name: str, expr: Expr, columns: dict) -> np.ndarray:
+        value = evaluate_batch(expr, columns, self.codes, self.rng)
+        domain = self.domains.get(name)
+        if domain is not None and domain.dtype != bool:
+            if not np.isin(value, domain, kind="table").all():
+                raise ValueError(f"Value out of the range of {name!r}")
+        return value
+
+    def _free(self, columns: dict, names) -> None:
+        for name in names:
+            domain = self.domains[name]
+            columns[name] = domain[self.rng.integers(len(domain), size=self.runs)]
+
+    def initial(self) -> dict[str, np.ndarray]:
+        """
+        The first state of every run, as a column per variable and define.
+        """
+        columns: dict[str, np.ndarray] = {}
+        self._free(columns, self._free_init)
+        for name in self._init_order:
+            expr = self.invariants.get(name)
+            if expr is None:
+                expr = self.init[name]
+            columns[name] = self._evaluate(name, expr, columns)
+        return columns
+
+    def step(self, columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """
+        The state after `columns` in every run.
+        """
+        new: dict[str, np.ndarray] = {}
+        for name, expr in self.next.items():
+            new[name] = self._evaluate(name, expr, columns)
+        self._free(new, self._free_next)
+        for name in self._invariant_order:
+            new[name] = self._evaluate(name, self.invariants[name], new)
+        return new
+
+    def states(self, steps: int) -> Iterator[dict[str, np.ndarray]]:
+        """
+        Yield the first state and the `steps` states after it.
+        """
+        columns = self.initial()
+        yield columns
+        for _ in range(steps):
+            columns = self.step(columns)
+            yield columns
+
+    def _dtype(self) -> np.dtype:
+        values = [d.astype(np.int64) for d in self.domains.values()]
+        low = min((v.min() for v in values), default=0)
+        high = max((v.max() for v in values), default=0)
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return np.dtype(dtype)
+        return np.dtype(np.int64)
+
+    def write_trace(self, path: str | os.PathLike, steps: int) -> dict:
+        """
+        Simulate `steps` steps and stream the trace to `path`. Returns the
+        header written at the start of the file.
+        """
+        dtype = self._dtype()
+        header = {
+            "format": TRACE_FORMAT,
+            "runs": self.runs,
+            "steps": steps,
+            "seed": self.seed,
+            "dtype": dtype.str,
+            "variables": self.variables,
+            "codes": self.codes.codes,
+        }
+        with open(path, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            for columns in self.states(steps):
+                block = np.stack([columns[v] for v in self.variables]).astype(dtype)
+                f.write(block.tobytes())
+        return header
+
+
+def load_trace(path: str | os.PathLike) -> tuple[dict, np.ndarray]:
+    """
+    The header of a trace written by `Simulator.write_trace`, and its
+    values as a read-only `(steps + 1, variables, runs)` memory-mapped
+    array.
+    """
+    with open(path, "rb") as f:
+        line = f.readline()
+    header = json.loads(line)
+    if header.get("format") != TRACE_FORMAT:
+        raise ValueError(f"Unsupported trace format {header.get('format')!r}")
+    shape = (header["steps"] + 1, len(header["variables"]), header["runs"])
+    values = np.memmap(path, np.dtype(header["dtype"]), "r", len(line), shape)
+    return header, values
@@ -0,0 +1,172 @@
+"""
+Variable dependencies and cone-of-influence slicing.
+
+A variable depends on every declared variable that appears on the right
+hand side of one of its assignments, `case` conditions included. A
+reference through `a.b` or `a[i]` counts as a reference to `a` (and to the
+variables used in the index). An instance `c : counter(x)` of a module
+depends on the variables passed as parameters. `DEFINE` names are nodes of
+the graph too, depending on the variables and defines in their body.
+"""
+
+from collections import deque
+from typing import Iterable
+
+from .models import (
+    Assign,
+    AssignConstraint,
+    ComplexIdentifier,
+    DefineDeclaration,
+    Expr,
+    Identifier,
+    Module,
+    ModuleType,
+    VarDeclaration,
+)
+from .visitor import walk
+
+
+def root_name(target) -> str:
+    """
+    The variable a possibly complex identifier refers to: `a` for `a.b[i]`.
+    """
+    while isinstance(target, ComplexIdentifier):
+        target = target.target
+    if not isinstance(target, Identifier):
+        raise ValueError(f"Not a variable reference: {target.unparse()}")
+    return target.name
+
+
+def _references(expr, variables: set[str]) -> set[str]:
+    return {
+        node.name
+        for node in walk(expr)
+        if isinstance(node, Identifier) and node.name in variables
+    }
+
+
+def dependency_graph(module: Module) -> dict[str, set[str]]:
+    """
+    Map every declared or assigned variable to the declared variables its
+    assignments (or its module parameters) read, and every define to those
+    its body reads.
+    """
+    symbols = module.symbols
+    declared = {
+        name
+        for name in symbols
+        if symbols[name].declaration is not None or symbols[name].define is not None
+    }
+    graph: dict[str, set[str]] = {name: set() for name in declared}
+    for name in symbols:
+        declaration = symbols[name].declaration
+        if declaration is not None and isinstance(
+            declaration.type_specifier, ModuleType
+        ):
+            for parameter in declaration.type_specifier.parameter_list:
+                graph[name] |= _references(parameter, declared) - {name}
+        define = symbols[name].define
+        if define is not None:
+            graph[name] |= _references(define.expr, declared) - {name}
+        for assigns in symbols[name].assigns.values():
+            for assign in assigns:
+                deps = graph.setdefault(root_name(assign.target), set())
+                deps |= _references(assign.expr, declared)
+                # The index in `a[i] := ...` selects what is assigned.
+                if isinstance(assign.target, ComplexIdentifier):
+                    deps |= _references(assign.target, declared) - {
+                        root_name(assign.target)
+                    }
+    return graph
+
+
+def cone_of_influence(
+    module: Module,
+    targets: Iterable[str],
+    graph: dict[str, set[str]] | None = None,
+) -> set[str]:
+    """
+    The variables that can affect any of `targets`, the targets included.
+    """
+    if graph is None:
+        graph = dependency_graph(module)
+    cone = set()
+    queue = deque()
+    for name in targets:
+        if name not in graph:
+            raise ValueError(f"Unknown variable {name!r}")
+        if name not in cone:
+            cone.add(name)
+            queue.append(name)
+    while queue:
+        for dep in graph[queue.popleft()]:
+            if dep not in cone:
+                cone.add(dep)
+                queue.append(dep)
+    return cone
+
+
+def slice_module(module: Module, targets: Iterable[str]) -> Module:
+    """
+    A copy of `module` that keeps only the declarations, defines and
+    assignments of the cone of influence of `targets`. Sections left empty
+    are dropped. The entries themselves are shared with `module`.
+    """
+    cone = cone_of_influence(module, targets)
+    body = []
+    for element in module.body:
+        if isinstance(element, VarDeclaration):
+            var_list = [v for v in element.var_list if v.identifier.name in cone]
+            if var_list:
+                body.append(VarDeclaration(var_list))
+        elif isinstance(element, DefineDeclaration):
+            defines = [d for d in element.define_list if d.identifier.name in cone]
+            if defines:
+                body.append(DefineDeclaration(defines))
+        elif isinstance(element, AssignConstraint):
+            assigns = [
+                a
+                for a in element.assigns_list
+                if not isinstance(a, Assign) or root_name(a.target) in cone
+            ]
+            if assigns:
+                body.append(AssignConstraint(assigns))
+        else:
+            body.append(element)
+    return Module(module.name, body)
+
+
+def evaluation_order(exprs: dict[str, Expr]) -> list[str]:
+    """
+    The names of `exprs` ordered so that each expression comes after the
+    others it reads.
+    """
+    deps = {
+        name: {
+            n.name
+            for n in walk(expr)
+            if isinstance(n, Identifier) and n.name in exprs and n.name != name
+        }
+        for name, expr in exprs.items()
+    }
+    order = []
+    done = set()
+    for name in exprs:
+        # Depth-first, with an explicit stack of (name, entered) pairs.
+        stack = [(name, False)]
+        visiting = set()
+        while stack:
+            item, entered = stack.pop()
+            if item in done:
+                continue
+            if entered:
+                visiting.discard(item)
+                done.add(item)
+                order.append(item)
+                continue
+            if item in visiting:
+                raise ValueError(f"Circular definition of {item!r}")
+            visiting.add(item)
+            stack.append((item, True))
+            stack += [(d, False) for d in deps[item] if d not in done]
+    return order
@@ -0,0 +1,164 @@
+from operator import is_
+from typing import Iterator, Literal
+
+from . import visitor
+from .models import (
+    Assign,
+    AssignConstraint,
+    DefineDeclaration,
+    DefineItem,
+    Identifier,
+    Module,
+    Type,
+    VarDeclaration,
+    VarDeclItem,
+    gc_paused,
+)
+
+Modifier = Literal["init", "next", "none"]
+
+
+def _name(target) -> str:
+    # Plain variables are keyed by name, `a.b` style targets by their text.
+    return target.name if isinstance(target, Identifier) else target.unparse()
+
+
+class Symbol:
+    """
+    What a module says about one variable: its declaration (None when it is
+    only assigned), its assignments by modifier, and its `DEFINE` entry when
+    the name is a define rather than a variable.
+    """
+
+    __slots__ = ("name", "declaration", "assigns", "define")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.declaration: VarDeclItem | None = None
+        self.define: DefineItem | None = None
+        self.assigns: dict[str, list[Assign]] = {"init": [], "next": [], "none": []}
+
+    @property
+    def type(self) -> Type | None:
+        if self.declaration is None:
+            return None
+        return self.declaration.type_specifier
+
+    def __repr__(self) -> str:
+        counts = {k: len(v) for k, v in self.assigns.items() if v}
+        if self.define is not None:
+            return f"Symbol({self.name!r}, define={self.define.expr.unparse()!r})"
+        return f"Symbol({self.name!r}, declared={self.declaration is not None}, assigns={counts})"
+
+
+_SECTION_LISTS = {
+    VarDeclaration: "var_list",
+    DefineDeclaration: "define_list",
+    AssignConstraint: "assigns_list",
+}
+
+
+def _layout(module: Module) -> tuple[list, list[int]]:
+    # The lists and sections the index is built from, and the lengths of
+    # the lists.
+    objects = [module.body]
+    lengths = [len(module.body)]
+    for element in module.body:
+        objects.append(element)
+        field = _SECTION_LISTS.get(type(element))
+        if field is not None:
+            items = getattr(element, field)
+            objects.append(items)
+            lengths.append(len(items))
+    return objects, lengths
+
+
+class SymbolTable:
+    """
+    An index from variable names to their `Symbol`, built in one pass over a
+    module. Use `Module.symbols`, which caches the table on the module,
+    rather than creating one directly.
+
+    The table remembers the body, the sections and the section lists it
+    was built from, and `Module.symbols` builds a new one when any of them
+    has been replaced or changed length, or when a `NodeTransformer` has
+    changed any tree in place since. Other changes that keep all of them,
+    such as assigning an identifier's name directly, need a call to
+    `Module.invalidate_symbols()`.
+    """
+
+    def __init__(self, module: Module) -> None:
+        symbols: dict[str, Symbol] = {}
+        self._changes = visitor._in_place_changes
+        self._objects, self._lengths = _layout(module)
+        with gc_paused():
+            self._index(module, symbols)
+        self._symbols = symbols
+
+    def is_current(self, module: Module) -> bool:
+        """
+        Whether `module` still has the layout the table was built from.
+        """
+        if visitor._in_place_changes != self._changes:
+            return False
+        objects, lengths = _layout(module)
+        return (
+            lengths == self._lengths
+            and len(objects) == len(self._objects)
+            and all(map(is_, objects, self._objects))
+        )
+
+    @staticmethod
+    def _index(module: Module, symbols: dict[str, "Symbol"]) -> None:
+        for element in module.body:
+            if isinstance(element, VarDeclaration):
+                for item in element.var_list:
+                    name = _name(item.identifier)
+                    symbol = symbols.get(name) or symbols.setdefault(name, Symbol(name))
+                    # A redeclaration is an error in NuSMV, keep the first one.
+                    if symbol.declaration is None:
+                        symbol.declaration = item
+            elif isinstance(element, DefineDeclaration):
+                for item in element.define_list:
+                    name = _name(item.identifier)
+                    symbol = symbols.get(name) or symbols.setdefault(name, Symbol(name))
+                    if symbol.define is None:
+                        symbol.define = item
+            elif isinstance(element, AssignConstraint):
+                for assign in element.assigns_list:
+                    if not isinstance(assign, Assign):
+                        continue
+                    name = _name(assign.target)
+                    symbol = symbols.get(name) or symbols.setdefault(name, Symbol(name))
+                    symbol.assigns[assign.modifier].append(assign)
+
+    def __getitem__(self, name: str) -> Symbol:
+        return self._symbols[name]
+
+    def get(self, name: str, default=None) -> Symbol | None:
+        return self._symbols.get(name, default)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._symbols
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._symbols)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def declaration(self, name: str) -> VarDeclItem | None:
+        symbol = self._symbols.get(name)
+        return None if symbol is None else symbol.declaration
+
+    def define(self, name: str) -> DefineItem | None:
+        symbol = self._symbols.get(name)
+        return None if symbol is None else symbol.define
+
+    def type_of(self, name: str) -> Type | None:
+        symbol = self._symbols.get(name)
+        return None if symbol is None else symbol.type
+
+    def assigns(self, name: str, modifier: Modifier) -> list[Assign]:
+        symbol = self._symbols.get(name)
+        return [] if symbol is None else symbol.assigns[modifier]
@@ -0,0 +1,66 @@
+"""
+Synthetic SMV models of configurable size and shape.
+
+`generate_model` writes a `main` module whose variables are mostly
+enumerations (`s0`, `s1`, ... values), with every fourth one boolean.
+Enumeration variables get a `next` case, booleans a `next` condition. Case
+conditions are trees of `&` and `=` over comparisons of other variables,
+so the number of comparisons grows as `2**depth`.
+
+    python -m py_nusmv_parser.synthetic [vars] [enum_width] [branches] [depth]
+"""
+
+import random
+import sys
+
+
+def generate_model(
+    variables: int = 100,
+    enum_width: int = 4,
+    case_branches: int = 3,
+    depth: int = 2,
+    seed: int = 0,
+) -> str:
+    """
+    The source of a model with `variables` variables, enumerations of
+    `enum_width` values, `case_branches` branches per case (the last one a
+    `TRUE` default) and conditions nested `depth` deep. The same arguments
+    always give the same source.
+    """
+    if variables < 1 or enum_width < 1 or case_branches < 1 or depth < 0:
+        raise ValueError("Model dimensions must be positive")
+    rng = random.Random(seed)
+    names = [f"v{i}" for i in range(variables)]
+    boolean = {name for i, name in enumerate(names) if i % 4 == 3}
+    values = [f"s{k}" for k in range(enum_width)]
+
+    def condition(level: int) -> str:
+        if level == 0:
+            name = rng.choice(names)
+            if name in boolean:
+                return name
+            return f"{name} = {rng.choice(values)}"
+        operator = rng.choice(("&", "="))
+        return f"({condition(level - 1)}) {operator} ({condition(level - 1)})"
+
+    lines = ["MODULE main", "VAR"]
+    enum_type = "{" + ", ".join(values) + "}"
+    for name in names:
+        lines.append(f"    {name} : {'boolean' if name in boolean else enum_type};")
+    lines.append("ASSIGN")
+    for name in names:
+        if name in boolean:
+            lines.append(f"    init({name}) := FALSE;")
+            lines.append(f"    next({name}) := {condition(depth)};")
+            continue
+        lines.append(f"    init({name}) := {values[0]};")
+        lines.append(f"    next({name}) := case")
+        for _ in range(case_branches - 1):
+            lines.append(f"        {condition(depth)} : {rng.choice(values)};")
+        lines.append(f"        TRUE : {{{', '.join(values[:2])}}};")
+        lines.append("    esac;")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate_model(*map(int, sys.argv[1:])), end="")
@@ -0,0 +1,235 @@
+"""
+Checking NuSMV counterexample traces against a module.
+
+A trace is read line by line, keeping only the values of the current and
+the previous state, so traces of any length are checked in constant
+memory. In every state:
+
+- the first state must satisfy the `init(x) := e` assignments;
+- every other state must follow from the one before it by the
+  `next(x) := e` assignments;
+- `x := e` assignments and `DEFINE` entries must hold.
+
+A value picked from a `{...}` set only has to be one of its elements, and a
+state where no condition of a `case` holds is a violation too.
+NuSMV prints only the values that changed, and may leave defines out: the
+others keep their value, and defines never printed are computed.
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Iterable
+
+from .compiled import compile_expr, symbolic_constants
+from .models import (
+    BinaryOperator,
+    CaseBodyItem,
+    CaseExpr,
+    Const,
+    Identifier,
+    Module,
+    SetExpr,
+)
+from .slicing import evaluation_order
+
+_HEADER = re.compile(r"->\s*(State|Input):\s*(\S+)\s*<-")
+
+# The value of a variable not given by the trace yet.
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _value(text: str):
+    match text:
+        case "TRUE":
+            return True
+        case "FALSE":
+            return False
+    if re.fullmatch(r"-?\d+", text):
+        return int(text)
+    return text
+
+
+def _text(expr) -> str:
+    # `case` is unparsed over several lines.
+    return " ".join(expr.unparse().split())
+
+
+def _constraint(target: Identifier, expr):
+    """
+    The condition for `target` to be a value of `expr`: `target = expr`,
+    with `=` turned into `in` for sets and pushed into `case` branches.
+    """
+    match expr:
+        case CaseExpr():
+            return CaseExpr(
+                [
+                    CaseBodyItem(item.condition, _constraint(target, item.expr))
+                    for item in expr.case_body
+                ]
+            )
+        case SetExpr() | Const(type="range"):
+            return BinaryOperator(target, "in", expr)
+    return BinaryOperator(target, "=", expr)
+
+
+class Violation:
+    """
+    The first state of a trace that does not agree with the module.
+    `kind` is "init", "next", "invariant", "define", "missing" or "no case".
+    """
+
+    __slots__ = ("state", "step", "kind", "name", "expected", "actual")
+
+    def __init__(self, state: str, step: int, kind: str, name: str, expected, actual):
+        self.state = state
+        self.step = step
+        self.kind = kind
+        self.name = name
+        self.expected = expected
+        self.actual = actual
+
+    def __str__(self) -> str:
+        if self.kind == "missing":
+            return f"State {self.state}: no value for {self.name}"
+        if self.kind == "no case":
+            return f"State {self.state}: no case condition holds for {self.name}"
+        target = self.name
+        if self.kind in ("init", "next"):
+            target = f"{self.kind}({self.name})"
+        return f"State {self.state}: {target} is {self.actual!r}, not {self.expected}"
+
+    def __repr__(self) -> str:
+        return f"Violation({str(self)!r})"
+
+
+class TraceChecker:
+    """
+    Checks traces against `module`. The assignments are compiled once, so
+    one checker can check many traces.
+    """
+
+    def __init__(self, module: Module) -> None:
+        symbols = module.symbols
+        variables = [n for n in symbols if symbols[n].declaration is not None]
+        defines = {n: symbols[n].define.expr for n in symbols if symbols[n].define}
+        names = variables + [n for n in defines if n not in variables]
+        self.variables = variables
+        self.names = names
+        self.positions = {name: i for i, name in enumerate(names)}
+        # The state before a step, then the state after it.
+        layout = {**self.positions}
+        layout.update({f"next({n})": len(names) + i for i, n in enumerate(names)})
+        codes = symbolic_constants(module)
+
+        def check(kind, name, expr, target):
+            fn = compile_expr(_constraint(Identifier(target), expr), layout, codes)
+            return kind, name, _text(expr), fn
+
+        self.defines = [
+            (name, _text(defines[name]), compile_expr(defines[name], layout, codes))
+            for name in evaluation_order(defines)
+        ]
+        self.init = []
+        self.next = []
+        self.invariants = []
+        for name in symbols:
+            assigns = symbols[name].assigns
+            for assign in assigns["init"]:
+                self.init.append(check("init", name, assign.expr, name))
+            for assign in assigns["next"]:
+                self.next.append(check("next", name, assign.expr, f"next({name})"))
+            for assign in assigns["none"]:
+                self.invariants.append(check("invariant", name, assign.expr, name))
+
+    def check(self, lines: Iterable[str]) -> Violation | None:
+        """
+        Check the trace in `lines` and return its first violation, or None.
+        A new `Trace Description` line starts a new trace.
+        """
+        positions = self.positions
+        current = previous = None
+        label, step, pending = None, 0, False
+        printed = set()
+        for line in lines:
+            line = line.strip()
+            # Most lines give a value: `name = value`.
+            name, sep, text = line.partition(" = ")
+            if sep and name[0] not in "-*":
+                position = positions.get(name)
+                if position is not None and current is not None:
+                    current[position] = _value(text)
+                    printed.add(position)
+                continue
+            if not line or line.startswith(("--", "***")):
+                continue
+            if line.startswith("Trace Description"):
+                if pending:
+                    violation = self._finish(current, previous, label, step, printed)
+                    if violation is not None:
+                        return violation
+                current = previous = None
+                label, step, pending = None, 0, False
+                printed = set()
+                continue
+            header = _HEADER.match(line)
+            if header is not None:
+                if pending:
+                    violation = self._finish(current, previous, label, step, printed)
+                    if violation is not None:
+                        return violation
+                    previous, step = current, step + 1
+                    current = list(current)
+                    pending = False
+                if current is None:
+                    current = [_MISSING] * len(self.names)
+                # Inputs belong to the state that follows them.
+                if header.group(1) == "State":
+                    label, pending = header.group(2), True
+                continue
+        if pending:
+            return self._finish(current, previous, label, step, printed)
+        return None
+
+    def _finish(self, current, previous, label, step, printed) -> Violation | None:
+        # Checks the state in `current`, filling in the defines.
+        positions = self.positions
+        if previous is None:
+            for name in self.variables:
+                if current[positions[name]] is _MISSING:
+                    return Violation(label, step, "missing", name, None, None)
+        for name, expected, fn in self.defines:
+            position = positions[name]
+            try:
+                value = fn(current)
+            except ValueError:
+                return Violation(label, step, "no case", name, expected, None)
+            if position not in printed:
+                current[position] = value
+            elif current[position] != value:
+                actual = current[position]
+                return Violation(label, step, "define", name, expected, actual)
+        if previous is None:
+            checks, state = self.init, current
+        else:
+            checks, state = self.next, previous + current
+        for checks, state in ((checks, state), (self.invariants, current)):
+            for kind, name, expected, fn in checks:
+                try:
+                    holds = fn(state)
+                except ValueError:
+                    return Violation(label, step, "no case", name, expected, None)
+                if not holds:
+                    actual = current[positions[name]]
+                    return Violation(label, step, kind, name, expected, actual)
+        return None
+
+
+def check_trace(module: Module, path: str | os.PathLike) -> Violation | None:
+    """
+    Stream the trace file at `path` and return its first violation of
+    `module`, or None.
+    """
+    with open(path) as f:
+        return TraceChecker(module).check(f)
@@ -0,0 +1,272 @@
+"""
+Vectorized evaluation of expressions over batches of states.
+
+A batch is columnar: one NumPy array per variable, all of the same length.
+Boolean variables hold `bool` arrays, integer variables integer arrays and
+enumeration variables the integer codes given by `EnumCodes`. An
+expression is evaluated once for the whole batch with NumPy operations,
+without a Python loop over the states.
+
+NumPy is an optional dependency: `pip install py-nusmv-parser[numpy]`.
+"""
+
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from .models import (
+    BasicSemantic,
+    BinaryOperator,
+    CaseExpr,
+    ComplexIdentifier,
+    Const,
+    EnumerationType,
+    Identifier,
+    SetExpr,
+    UnaryOperator,
+)
+from .visitor import walk
+
+
+def _divide(a, b):
+    # NuSMV integer division rounds towards zero.
+    return np.sign(a) * np.sign(b) * (np.abs(a) // np.abs(b))
+
+
+_BINARY = {
+    "&": np.logical_and,
+    "|": np.logical_or,
+    "xor": np.logical_xor,
+    "xnor": np.equal,
+    "->": lambda a, b: np.logical_or(np.logical_not(a), b),
+    "<->": np.equal,
+    "=": np.equal,
+    "!=": np.not_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": _divide,
+    "mod": np.fmod,
+}
+
+_UNARY = {
+    "!": np.logical_not,
+    "-": np.negative,
+}
+
+
+class EnumCodes:
+    """
+    The integer codes of symbolic enumeration values. NuSMV symbolic
+    constants are shared by all enumerations of a model, so one table
+    covers every variable. Integer values of enumerations keep their
+    value, and symbolic codes start above the largest of them.
+    """
+
+    __slots__ = ("codes", "names")
+
+    def __init__(self, symbols: Iterable[str], start: int = 0) -> None:
+        self.codes: dict[str, int] = {}
+        for name in symbols:
+            self.codes.setdefault(name, start + len(self.codes))
+        self.names = {code: name for name, code in self.codes.items()}
+
+    @classmethod
+    def from_module(cls, module: BasicSemantic) -> "EnumCodes":
+        symbols = []
+        integers = []
+        for node in walk(module):
+            if isinstance(node, EnumerationType):
+                for value in node.body:
+                    const = value.identifier
+                    if const.type == "integer":
+                        integers.append(const.value)
+                    else:
+                        symbols.append(const.value)
+        return cls(symbols, max(integers, default=-1) + 1)
+
+    def __getitem__(self, name: str) -> int:
+        return self.codes[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.codes
+
+    def encode(self, values: Iterable[str | int]) -> np.ndarray:
+        """
+        A column of codes for `values`, symbolic names or integers.
+        """
+        codes = self.codes
+        return np.array(
+            [v if isinstance(v, int) else codes[v] for v in values], dtype=np.int64
+        )
+
+    def decode(self, column: np.ndarray) -> list[str | int]:
+        names = self.names
+        return [names.get(code, code) for code in column.tolist()]
+
+
+class _Evaluator:
+    def __init__(self, columns, codes, rng, size) -> None:
+        self.columns = columns
+        self.codes = codes
+        self.rng = rng
+        self.size = size
+
+    def run(self, expr):
+        # Post-order with an explicit stack: `values` holds the results of
+        # the operands until their operator is ready.
+        values = []
+        stack = [(expr, False)]
+        while stack:
+            node, ready = stack.pop()
+            match node:
+                case BinaryOperator() if node.operator != "in":
+                    if not ready:
+                        stack += [(node, True), (node.right, False), (node.left, False)]
+                        continue
+                    right = values.pop()
+                    left = values.pop()
+                    operator = _BINARY.get(node.operator)
+                    if operator is None:
+                        raise NotImplementedError(node.operator)
+                    values.append(operator(left, right))
+                case UnaryOperator():
+                    if not ready:
+                        stack += [(node, True), (node.operand, False)]
+                        continue
+                    operator = _UNARY.get(node.operator)
+                    if operator is None:
+                        raise NotImplementedError(node.operator)
+                    values.append(operator(values.pop()))
+                case CaseExpr():
+                    if not ready:
+                        stack.append((node, True))
+                        for item in reversed(node.case_body):
+                            stack += [(item.expr, False), (item.condition, False)]
+                        continue
+                    count = 2 * len(node.case_body)
+                    operands = values[-count:]
+                    del values[-count:]
+                    values.append(self._case(operands[0::2], operands[1::2]))
+                case _:
+                    values.append(self._leaf(node))
+        return values[0]
+
+    def _leaf(self, node):
+        match node:
+            case Identifier(name=name):
+                column = self.columns.get(name)
+                if column is not None:
+                    return column
+                if name in self.codes:
+                    return np.int64(self.codes[name])
+                raise ValueError(f"Unknown identifier {name!r}")
+            case Const(type="boolean"):
+                return np.bool_(node.value)
+            case Const(type="integer"):
+                return np.int64(node.value)
+            case Const(type="symbolic"):
+                return np.int64(self.codes[node.value])
+            case Const(type="range") | SetExpr():
+                return self._choice(self._elements(node))
+            case ComplexIdentifier():
+                return self._complex(node)
+            case BinaryOperator(operator="in"):
+                left = self.run(node.left)
+                return np.logical_or.reduce(
+                    [np.equal(left, v) for v in self._elements(node.right)]
+                )
+            case _:
+                raise NotImplementedError(type(node).__name__)
+
+    def _broadcast(self, value) -> np.ndarray:
+        return np.broadcast_to(value, (self.size,))
+
+    def _case(self, conditions, choices):
+        # A constant TRUE condition, usually the last one, covers all states.
+        if not any(np.ndim(c) == 0 and c for c in conditions):
+            covered = np.logical_or.reduce([self._broadcast(c) for c in conditions])
+            if not covered.all():
+                raise ValueError("No case condition holds in some states")
+        conditions = [self._broadcast(c) for c in conditions]
+        choices = [self._broadcast(c) for c in choices]
+        default = np.zeros((), np.result_type(*choices))
+        return np.select(conditions, choices, default)
+
+    def _elements(self, node) -> list:
+        # The possible values of a set or range, a range giving one value
+        # per integer.
+        if isinstance(node, Const) and node.type == "range":
+            low, high = node.value
+            return [np.int64(v) for v in range(low, high + 1)]
+        if not isinstance(node, SetExpr):
+            return [self.run(node)]
+        elements = []
+        for element in node.set_body:
+            elements += self._elements(element)
+        return elements
+
+    def _choice(self, elements):
+        if self.rng is None:
+            raise ValueError("A set or range expression needs an `rng` to choose from")
+        picks = self.rng.integers(len(elements), size=self.size)
+        if all(np.ndim(e) == 0 for e in elements):
+            return np.array(elements)[picks]
+        stacked = np.stack([self._broadcast(e) for e in elements])
+        return np.take_along_axis(stacked, picks[np.newaxis], 0)[0]
+
+    def _complex(self, node: ComplexIdentifier):
+        column = self.columns.get(node.unparse())
+        if column is not None:
+            return column
+        if node.type != "index":
+            raise ValueError(f"Unknown identifier {node.unparse()!r}")
+        # `a[i]` with a variable index picks among the `a[<k>]` columns.
+        prefix = node.target.unparse() + "["
+        cells = {}
+        for name, column in self.columns.items():
+            if name.startswith(prefix) and name.endswith("]"):
+                index = name[len(prefix) : -1]
+                if index.lstrip("-").isdigit():
+                    cells[int(index)] = column
+        if not cells:
+            raise ValueError(f"Unknown identifier {node.unparse()!r}")
+        index = self._broadcast(self.run(node.item))
+        conditions = [index == k for k in cells]
+        return self._case(conditions, list(cells.values()))
+
+
+def batch_size(columns: Mapping[str, np.ndarray]) -> int:
+    sizes = {len(column) for column in columns.values()}
+    if len(sizes) != 1:
+        raise ValueError(f"Columns of different lengths: {sorted(sizes)}")
+    return sizes.pop()
+
+
+def evaluate_batch(
+    expr: BasicSemantic,
+    columns: Mapping[str, np.ndarray],
+    codes: EnumCodes | Mapping[str, int] | None = None,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    Evaluate `expr` in every state of a batch and return one value per
+    state. `columns` maps variable names, `a.b` and `a[1]` included, to
+    their arrays. Symbolic constants are looked up in `codes`. Sets and
+    ranges choose one of their values per state with `rng`.
+
+    All branches of a `case` are evaluated for the whole batch. Arithmetic
+    errors in a branch that is not taken are ignored, but a state where no
+    condition holds is an error.
+    """
+    size = batch_size(columns)
+    evaluator = _Evaluator(columns, codes if codes is not None else {}, rng, size)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = evaluator.run(expr)
+    if np.shape(value) != (size,):
+        value = np.broadcast_to(value, (size,)).copy()
+    return value
@@ -0,0 +1,295 @@
+"""
+Generic traversal of model trees.
+
+`walk`, `iter_fields` and `iter_child_nodes` give plain access to a tree.
+`NodeVisitor` calls a `visit_<ClassName>` method for every node and
+`NodeTransformer` rebuilds a tree bottom-up from the values those methods
+return. Both walk the tree with an explicit stack, so deep operator chains
+are fine, and both resolve the method for a node class once per visitor
+class.
+"""
+
+from operator import is_
+from typing import Any, Callable, Iterator
+
+from .models import BasicSemantic, get_fields
+
+# Returned by a `NodeVisitor` method to leave the children of a node out.
+SKIP = object()
+
+# Counts the nodes transformers have changed in place. Indexes built over a
+# tree, such as `Module.symbols`, are rebuilt when it moves.
+_in_place_changes = 0
+
+
+def iter_fields(node: BasicSemantic) -> Iterator[tuple[str, Any]]:
+    """
+    Yield `(name, value)` for every field of `node`, in `to_dict()` order.
+    """
+    for field in get_fields(type(node)):
+        yield field, getattr(node, field)
+    if type(node).__dictoffset__:
+        yield from node.__dict__.items()
+
+
+_child_getters: dict[type, Callable] = {}
+
+
+def _make_child_getter(cls: type) -> Callable:
+    if cls.__dictoffset__:
+        # Extra attributes vary per instance.
+        def children(node):
+            found = []
+            for _, value in iter_fields(node):
+                if isinstance(value, BasicSemantic):
+                    found.append(value)
+                elif isinstance(value, list):
+                    found += [v for v in value if isinstance(v, BasicSemantic)]
+            return found
+
+        return children
+    lines = ["def children(node):", "    found = []"]
+    for field in get_fields(cls):
+        lines += [
+            f"    value = node.{field}",
+            "    if isinstance(value, Node):",
+            "        found.append(value)",
+            "    elif isinstance(value, list):",
+            "        found += [v for v in value if isinstance(v, Node)]",
+        ]
+    lines.append("    return found")
+    namespace = {"Node": BasicSemantic}
+    exec("\n".join(lines), namespace)
+    return namespace["children"]
+
+
+def _child_getter(cls: type) -> Callable:
+    getter = _child_getters.get(cls)
+    if getter is None:
+        getter = _child_getters[cls] = _make_child_getter(cls)
+    return getter
+
+
+def _children(node: BasicSemantic) -> list[BasicSemantic]:
+    return _child_getter(type(node))(node)
+
+
+def iter_child_nodes(node: BasicSemantic) -> Iterator[BasicSemantic]:
+    """
+    Yield the direct child nodes of `node`, including those held in list
+    fields, in field order.
+    """
+    return iter(_children(node))
+
+
+def walk(node: BasicSemantic) -> Iterator[BasicSemantic]:
+    """
+    Yield `node` and all its descendants in depth-first pre-order.
+    """
+    stack = [node]
+    pop, extend = stack.pop, stack.extend
+    getters = _child_getters
+    while stack:
+        node = pop()
+        yield node
+        children = (getters.get(type(node)) or _child_getter(type(node)))(node)
+        if children:
+            children.reverse()
+            extend(children)
+
+
+class NodeVisitor:
+    """
+    Calls `visit_<ClassName>(node)` for every node of a tree, in depth-first
+    pre-order. A class without a method of its own uses the method of its
+    nearest base class that has one (`visit_Expr` covers all expressions),
+    and falls back to `generic_visit`.
+
+    The children of a node are visited after its method returns, unless the
+    method returns `SKIP`. A `leave_<ClassName>` method, looked up the same
+    way, is called once all children of a node have been visited.
+    """
+
+    def _dispatch_table(self) -> dict[type, tuple[Callable, Callable | None]]:
+        # Per visitor class: node class -> (visit method, leave method).
+        cls = type(self)
+        table = cls.__dict__.get("_dispatch")
+        if table is None:
+            table = cls._dispatch = {}
+        return table
+
+    def _resolve(self, node_cls: type) -> tuple[Callable, Callable | None]:
+        cls = type(self)
+        visit = leave = None
+        for klass in node_cls.__mro__:
+            visit = visit or getattr(cls, f"visit_{klass.__name__}", None)
+            leave = leave or getattr(cls, f"leave_{klass.__name__}", None)
+        methods = self._dispatch_table()[node_cls] = (visit or cls.generic_visit, leave)
+        return methods
+
+    def generic_visit(self, node: BasicSemantic) -> Any:
+        return None
+
+    def visit(self, node: BasicSemantic) -> None:
+        # Entries are nodes to visit, or (node, leave method) pairs to call
+        # on the way back up.
+        stack: list = [node]
+        pop, append, extend = stack.pop, stack.append, stack.extend
+        dispatch, resolve = self._dispatch_table(), self._resolve
+        getters = _child_getters
+        while stack:
+            item = pop()
+            cls = type(item)
+            if cls is tuple:
+                item[1](self, item[0])
+                continue
+            visit, leave = dispatch.get(cls) or resolve(cls)
+            if visit(self, item) is SKIP:
+                if leave is not None:
+                    leave(self, item)
+                continue
+            if leave is not None:
+                append((item, leave))
+            children = (getters.get(cls) or _child_getter(cls))(item)
+            if children:
+                children.reverse()
+                extend(children)
+
+
+class NodeTransformer(NodeVisitor):
+    """
+    Rebuilds a tree bottom-up. `visit_<ClassName>(node)` is called once the
+    children of `node` have been transformed, and its return value replaces
+    the node: the node itself keeps it, another node swaps it, and in a
+    list field None removes it and a list splices its items in. The default
+    `generic_visit` keeps the node.
+
+    With `copy=False` the tree is changed in place, and the `symbols` index
+    of every module is checked again on its next use. With `copy=True` the input tree is left
+    untouched: a node is copied only when one of its children changed, and
+    unchanged subtrees are shared with the input.
+    Trees built with hash-consing share nodes and should be transformed
+    with `copy=True`.
+    """
+
+    def __init__(self, copy: bool = False) -> None:
+        self.copy = copy
+
+    def generic_visit(self, node: BasicSemantic) -> Any:
+        return node
+
+    def visit(self, node: BasicSemantic) -> Any:
+        # Entries are nodes to enter, or (node, children) pairs once their
+        # children are on the stack. Transformed values pile up in `results`.
+        root = node
+        results: list = []
+        stack: list = [node]
+        pop, append = stack.pop, stack.append
+        dispatch, resolve = self._dispatch_table(), self._resolve
+        while stack:
+            item = pop()
+            if type(item) is tuple:
+                node, children = item
+                if children:
+                    start = len(results) - len(children)
+                    new = results[start:]
+                    del results[start:]
+                    if not all(map(is_, new, children)):
+                        node = self._rebuild(node, new)
+                visit = (dispatch.get(type(node)) or resolve(type(node)))[0]
+                results.append(visit(self, node))
+                continue
+            children = _children(item)
+            append((item, children))
+            stack.extend(reversed(children))
+        return results[0]
+
+    def _rebuild(self, node: BasicSemantic, new: list) -> BasicSemantic:
+        updates = []
+        i = 0
+        for field, value in iter_fields(node):
+            if isinstance(value, BasicSemantic):
+                if new[i] is not value:
+                    updates.append((field, new[i]))
+                i += 1
+            elif isinstance(value, list):
+                items = []
+                changed = False
+                for v in value:
+                    if not isinstance(v, BasicSemantic):
+                        items.append(v)
+                        continue
+                    result = new[i]
+                    i += 1
+                    if result is v:
+                        items.append(v)
+                        continue
+                    changed = True
+                    if type(result) is list:
+                        items.extend(result)
+                    elif result is not None:
+                        items.append(result)
+                if changed:
+                    updates.append((field, items))
+        if not updates:
+            return node
+        if self.copy:
+            copied = type(node).__new__(type(node))
+            for field, value in iter_fields(node):
+                setattr(copied, field, value)
+            node = copied
+            for field, value in updates:
+                setattr(node, field, value)
+        else:
+            global _in_place_changes
+            _in_place_changes += 1
+            for field, value in updates:
+                current = getattr(node, field)
+                if type(value) is list and isinstance(current, list):
+                    current[:] = value
+                else:
+                    setattr(node, field, value)
+        return node
+
+
+class StructuralKeys:
+    """
+    Numbers subtrees so that structurally equal subtrees get the same
+    integer: `keys(a) == keys(b)` exactly when `a` and `b` have the same
+    classes, field values and children.
+
+    Keys are computed bottom-up with an explicit stack and remembered per
+    node, so a `StructuralKeys` instance must only be used while the nodes
+    it has seen are not modified.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[tuple, int] = {}
+        # id(node) -> (node, key); holding the node keeps its id unique.
+        self._memo: dict[int, tuple[BasicSemantic, int]] = {}
+
+    def _value_key(self, value):
+        if isinstance(value, BasicSemantic):
+            return self._memo[id(value)][1]
+        if isinstance(value, list):
+            return (list, *[self._value_key(v) for v in value])
+        # The type keeps `True` and `1` apart.
+        return (type(value), value)
+
+    def __call__(self, node: BasicSemantic) -> int:
+        memo = self._memo
+        found = memo.get(id(node))
+        if found is not None:
+            return found[1]
+        stack = [(node, False)]
+        while stack:
+            item, ready = stack.pop()
+            if id(item) in memo:
+                continue
+            if not ready:
+                stack.append((item, True))
+                stack.extend((c, False) for c in _children(item) if id(c) not in memo)
+                continue
+            key = (type(item), *[self._value_key(v) for _, v in iter_fields(item)])
+            memo[id(item)] = (item, self._ids.setdefault(key, len(self._ids)))
+        return memo[id(node)][1]
@@ -0,0 +1,35 @@
+from py_nusmv_parser import parse_many, parse_nusmv_string
+
+from .test_parser import make_model
+
+
+def write_models(tmp_path, sizes):
+    paths = []
+    for i, n in enumerate(sizes):
+        path = tmp_path / f"model_{i}.smv"
+        path.write_text(make_model(n))
+        paths.append(path)
+    return paths
+
+
+def test_parse_many_ordered(tmp_path):
+    sizes = [3, 10, 1, 25, 4]
+    paths = write_models(tmp_path, sizes)
+    results = list(parse_many(paths, workers=2))
+    assert [r.path for r in results] == [str(p) for p in paths]
+    assert [len(r.module.body[0].var_list) for r in results] == sizes
+    expected = parse_nusmv_string(make_model(25)).unparse()
+    assert results[3].module.unparse() == expected
+
+
+def test_parse_many_reports_errors(tmp_path):
+    paths = write_models(tmp_path, [2, 3])
+    broken = tmp_path / "broken.smv"
+    broken.write_text("MODULE main VAR a : ;")
+    paths.insert(1, broken)
+    paths.append(tmp_path / "missing.smv")
+    results = list(parse_many(paths, workers=2, ordered=False))
+    assert sorted(r.path for r in results) == sorted(str(p) for p in paths)
+    errors = {r.path: r.error for r in results if r.module is None}
+    assert set(errors) == {str(broken), str(tmp_path / "missing.smv")}
+    assert "FileNotFoundError" in errors[str(tmp_path / "missing.smv")]
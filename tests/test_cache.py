@@ -0,0 +1,72 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.cache import ASTCache
+
+from .test_parser import make_model
+
+
+def test_cache_hit_returns_equal_tree(tmp_path):
+    cache = ASTCache(tmp_path)
+    source = make_model(20)
+    assert cache.get(source) is None
+    first = cache.parse_string(source)
+    assert len(os.listdir(tmp_path)) == 1
+    second = cache.parse_string(source)
+    assert second is not first
+    assert second.to_dict() == parse_nusmv_string(source).to_dict()
+    assert second.unparse() == first.unparse()
+
+    path = tmp_path / "model.smv"
+    path.write_text(source)
+    assert cache.parse_file(path).to_dict() == first.to_dict()
+
+
+def test_range_constants_survive_the_cache(tmp_path):
+    cache = ASTCache(tmp_path)
+    source = "MODULE main ASSIGN x := 1..3;"
+    cache.parse_string(source)
+    module = cache.get(source)
+    assert module.body[0].assigns_list[0].expr.value == (1, 3)
+
+
+def test_lru_eviction(tmp_path):
+    sources = [make_model(n) for n in (30, 31, 32)]
+    cache = ASTCache(tmp_path, max_bytes=1 << 20)
+    for source in sources:
+        cache.parse_string(source)
+    paths = {s: cache._path(cache.key(s)) for s in sources}
+    for i, source in enumerate(sources):
+        os.utime(paths[source], (1000 + i, 1000 + i))
+    # Touch the oldest entry, then shrink the cache to two entries.
+    assert cache.get(sources[0]) is not None
+    sizes = [os.path.getsize(p) for p in paths.values()]
+    cache.max_bytes = sizes[0] + sizes[2]
+    cache.evict()
+    assert os.path.exists(paths[sources[0]])
+    assert not os.path.exists(paths[sources[1]])
+    assert os.path.exists(paths[sources[2]])
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ASTCache(tmp_path)
+    source = make_model(3)
+    cache.parse_string(source)
+    with open(cache._path(cache.key(source)), "wb") as f:
+        f.write(b"garbage")
+    assert cache.get(source) is None
+    assert cache.parse_string(source).to_dict() == parse_nusmv_string(source).to_dict()
+
+
+def _parse_through_cache(args):
+    directory, n = args
+    return len(ASTCache(directory, max_bytes=50_000).parse_string(make_model(n)).body[0].var_list)
+
+
+def test_concurrent_processes(tmp_path):
+    jobs = [(str(tmp_path), n % 7 + 1) for n in range(40)]
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_parse_through_cache, jobs))
+    assert results == [n % 7 + 1 for n in range(40)]
+    assert not [f for f in os.listdir(tmp_path) if f.endswith(".tmp")]
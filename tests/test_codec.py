@@ -0,0 +1,62 @@
+import io
+
+import pytest
+
+from py_nusmv_parser import codec, parse_nusmv_string
+from py_nusmv_parser.models import Const, Identifier
+
+from .test_models import DEMO
+from .test_parser import make_model
+
+
+def test_round_trip():
+    source = DEMO + "\nASSIGN n := 1..4;\nASSIGN m := -3;"
+    for module in (parse_nusmv_string(source), parse_nusmv_string(make_model(100))):
+        data = codec.dumps(module)
+        assert data.startswith(codec.MAGIC)
+        rebuilt = codec.loads(data)
+        assert rebuilt.to_dict() == module.to_dict()
+        assert rebuilt.unparse() == module.unparse()
+        assert codec.dumps(rebuilt) == data
+    assert rebuilt is not module
+
+
+def test_values():
+    class Annotated(Identifier):
+        pass
+
+    node = Annotated("x")
+    node.extra = [None, True, False, 0, -1, 2**70, -(2**70), 1.5, "é", (1, 2)]
+    values = [node, Const((1, 4), "range"), "x" * 300, list(range(200))]
+    rebuilt = codec.loads(codec.dumps(values))
+    assert type(rebuilt[0]) is Annotated and rebuilt[0].name == "x"
+    assert rebuilt[0].extra == node.extra
+    assert type(rebuilt[0].extra[-1]) is tuple
+    assert rebuilt[1].value == (1, 4)
+    assert rebuilt[2:] == values[2:]
+
+
+def test_file_round_trip_and_deep_chain(tmp_path):
+    n = 20_000
+    source = "MODULE main ASSIGN x := " + " & ".join(f"v{i}" for i in range(n)) + ";"
+    module = parse_nusmv_string(source)
+    path = tmp_path / "main.ast"
+    with open(path, "wb") as f:
+        codec.dump(module, f)
+    with open(path, "rb") as f:
+        assert codec.load(f).unparse() == module.unparse()
+
+
+def test_rejects_bad_input():
+    with pytest.raises(ValueError):
+        codec.loads(b"JSON{}")
+    data = bytearray(codec.dumps(Identifier("x")))
+    data[4] = codec.FORMAT_VERSION + 1
+    with pytest.raises(ValueError):
+        codec.load(io.BytesIO(bytes(data)))
+    data = codec.dumps(parse_nusmv_string(make_model(20)))
+    for size in (6, len(data) // 2, len(data) - 1):
+        with pytest.raises(ValueError):
+            codec.loads(data[:size])
+    with pytest.raises(TypeError):
+        codec.dumps({"a": 1})
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.compiled import compile_expr, symbolic_constants
+from py_nusmv_parser.models import BinaryOperator, Const, Identifier
+
+SOURCE = """
+MODULE main
+ASSIGN
+    next(state) := case
+                       state = busy & request : ready;
+                       request : busy;
+                       TRUE : state;
+                   esac;
+    next(n) := n + 1 + n = 3;
+    cell := grid[n];
+    field := sub.flag & request;
+    pick := {ready, busy};
+    size := 1..3;
+"""
+
+LAYOUT = ["state", "request", "n", "grid[0]", "grid[1]", "sub.flag"]
+
+NAMES = {"ready": "ready", "busy": "busy"}
+
+
+def compiled():
+    module = parse_nusmv_string(SOURCE)
+    return {
+        a.target.unparse(): compile_expr(a.expr, LAYOUT, NAMES)
+        for a in module.body[0].assigns_list
+    }
+
+
+def test_compile_expr():
+    fns = compiled()
+    state = ("busy", True, 1, 10, 20, False)
+    assert fns["state"](state) == "ready"
+    assert fns["state"](("ready", True, 1, 10, 20, False)) == "busy"
+    assert fns["n"](state) is True
+    assert fns["cell"](state) == 20
+    assert fns["field"](state) is False
+    rng = random.Random(0)
+    assert fns["pick"](state, rng) in ("ready", "busy")
+    assert fns["size"](state, rng) in (1, 2, 3)
+    with pytest.raises(ValueError):
+        fns["pick"](state)
+    no_case = parse_nusmv_string("MODULE m ASSIGN x := case FALSE : 1; esac;")
+    with pytest.raises(ValueError):
+        compile_expr(no_case.body[0].assigns_list[0].expr, LAYOUT)(state)
+
+
+def test_codes_and_cache():
+    expr = parse_nusmv_string(SOURCE).body[0].assigns_list[0].expr
+    fn = compile_expr(expr, {"state": 0, "request": 1}, codes={"ready": 0, "busy": 1})
+    assert fn((1, True)) == 0
+    again = parse_nusmv_string(SOURCE).body[0].assigns_list[0].expr
+    assert (
+        compile_expr(again, {"state": 0, "request": 1}, {"ready": 0, "busy": 1}) is fn
+    )
+    unknown = parse_nusmv_string("MODULE m ASSIGN x := other[n];")
+    with pytest.raises(ValueError):
+        compile_expr(unknown.body[0].assigns_list[0].expr, LAYOUT)
+
+
+def test_unknown_identifier():
+    module = parse_nusmv_string(
+        "MODULE m VAR state : {ready, busy}; ASSIGN x := state = redy;"
+    )
+    expr = module.body[1].assigns_list[0].expr
+    codes = symbolic_constants(module)
+    assert codes == NAMES
+    with pytest.raises(ValueError, match="'redy'"):
+        compile_expr(expr, LAYOUT, codes)
+    ok = parse_nusmv_string("MODULE m ASSIGN x := state = ready;")
+    fn = compile_expr(ok.body[0].assigns_list[0].expr, LAYOUT, codes)
+    assert fn(("ready", True, 0, 0, 0, False)) is True
+
+
+def test_deep_trees():
+    # A long `+` chain is flattened, a deep `=` nesting needs closures.
+    chain = Identifier("n")
+    for _ in range(5_000):
+        chain = BinaryOperator(Const(1, "integer"), "+", chain)
+    assert compile_expr(chain, LAYOUT)(("busy", True, 2, 0, 0, False)) == 5_002
+    nested = Identifier("request")
+    for _ in range(300):
+        nested = BinaryOperator(nested, "=", Const(True, "boolean"))
+    assert compile_expr(nested, LAYOUT)(("busy", True, 2, 0, 0, False)) is True
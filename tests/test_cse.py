@@ -0,0 +1,72 @@
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.cse import extract_common_subexpressions
+
+SOURCE = """
+MODULE main
+VAR
+    a : boolean;
+    b : boolean;
+    n : {x, y};
+ASSIGN
+    next(a) := case
+                   a & b & n = x : b;
+                   TRUE : a & b & n = x;
+               esac;
+    next(b) := (a & b & n = x) = (b & n = x);
+    init(n) := {x, y};
+    next(n) := case a : {x, y}; TRUE : {x, y}; esac;
+"""
+
+
+def test_extract():
+    module = parse_nusmv_string(SOURCE)
+    before = module.unparse()
+    result = extract_common_subexpressions(module)
+    assert module.unparse() == before
+    text = result.unparse()
+    assert "DEFINE\n    _cse_0 := a & _cse_1;\n    _cse_1 := b & n = x;\n" in text
+    assert text.index("DEFINE") < text.index("ASSIGN")
+    assert "next(b) := _cse_0 = _cse_1;" in text
+    # Nondeterministic choices stay where they are.
+    assert text.count("{x, y}") == 4
+    reparsed = parse_nusmv_string(text)
+    assert reparsed.unparse() == text
+    assert reparsed.symbols.define("_cse_1") is not None
+
+
+def test_thresholds_and_existing_defines():
+    module = parse_nusmv_string(SOURCE)
+    text = extract_common_subexpressions(module, min_count=3).unparse()
+    # `b & n = x` and `n = x` only repeat inside the extracted expression.
+    assert "_cse_0 := a & b & n = x;" in text and "_cse_1" not in text
+    assert "next(b) := _cse_0 = (b & n = x);" in text
+    assert extract_common_subexpressions(module, min_count=5) is module
+    assert extract_common_subexpressions(module, min_size=8) is module
+
+    source = SOURCE + "DEFINE\n    hot := a & b & n = x;\n    _cse_0 := TRUE;\n"
+    text = extract_common_subexpressions(parse_nusmv_string(source)).unparse()
+    assert "hot := a & _cse_1;" in text
+    assert "next(b) := hot = _cse_1;" in text
+    assert "_cse_0 := TRUE;" in text
+
+
+def test_whole_right_hand_side():
+    source = """
+MODULE main
+VAR
+    x : boolean;
+    y : boolean;
+ASSIGN
+    next(x) := (a & b) = c;
+    next(y) := (a & b) = c;
+"""
+    text = extract_common_subexpressions(parse_nusmv_string(source)).unparse()
+    assert "_cse_0 := (a & b) = c;" in text
+    assert "next(x) := _cse_0;" in text and "next(y) := _cse_0;" in text
+    assert text.count("(a & b) = c") == 1
+
+    # An existing define with that body is referenced, and keeps its body.
+    source += "DEFINE\n    d := (a & b) = c;\n"
+    text = extract_common_subexpressions(parse_nusmv_string(source)).unparse()
+    assert "next(x) := d;" in text and "next(y) := d;" in text
+    assert "d := (a & b) = c;" in text and "_cse_" not in text
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.incremental import _parse_modules, parse_incremental
+
+SOURCE = """
+MODULE helper
+VAR
+    x : boolean;
+ASSIGN
+    init(x) := TRUE;
+
+MODULE main
+VAR
+    request : boolean;
+    state : {ready, busy};
+VAR
+    flag : boolean;
+ASSIGN
+    init(state) := ready;
+    next(state) := case
+                        state = ready & request = TRUE : busy;
+                        TRUE : {ready, busy};
+                   esac;
+"""
+
+
+def dump(modules):
+    return [m.to_dict() for m in modules]
+
+
+def test_edit_inside_section_reuses_other_subtrees():
+    result = parse_incremental(SOURCE)
+    main = result.modules[1]
+    offset = SOURCE.index("flag : boolean")
+    edited = result.edit(offset, len("flag"), "flag2")
+
+    assert edited.text == SOURCE.replace("flag :", "flag2 :")
+    assert edited.modules[0] is result.modules[0]
+    new_main = edited.modules[1]
+    assert new_main is not main
+    assert new_main.body[0] is main.body[0]
+    assert new_main.body[2] is main.body[2]
+    assert new_main.body[1].var_list[0].identifier.name == "flag2"
+    # The previous result is left untouched.
+    assert main.body[1].var_list[0].identifier.name == "flag"
+    assert dump(edited.modules) == dump(_parse_modules(edited.text))
+
+
+def test_edits_that_move_section_boundaries():
+    result = parse_incremental(SOURCE)
+    offset = SOURCE.index("VAR\n    flag")
+    # Split a section, rename a module, then add a module.
+    result = result.edit(offset, 0, "ASSIGN init(request) := FALSE;\n")
+    result = result.edit(SOURCE.index("helper"), len("helper"), "util")
+    result = result.edit(len(result.text), 0, "MODULE extra VAR y : boolean;")
+    assert [m.name.name for m in result.modules] == ["util", "main", "extra"]
+    assert dump(result.modules) == dump(_parse_modules(result.text))
+
+
+def test_invalid_edit_raises_and_keeps_previous_result():
+    result = parse_incremental(SOURCE)
+    offset = SOURCE.index("boolean;\n    state")
+    with pytest.raises(SyntaxError):
+        result.edit(offset, len("boolean;"), "")
+    result = result.edit(offset, len("boolean"), "{a, b}")
+    assert dump(result.modules) == dump(_parse_modules(result.text))
+
+
+def test_sections_before_the_first_module():
+    with pytest.raises(SyntaxError):
+        parse_incremental("VAR x : boolean;\n" + SOURCE)
+    assert parse_nusmv_string("VAR x : boolean;\n" + SOURCE) is None
+    result = parse_incremental(SOURCE)
+    for new_text in ("VAR x : boolean;\n", "ASSIGN x := TRUE;"):
+        with pytest.raises(SyntaxError):
+            result.edit(0, 0, new_text)
+    # Whitespace is fine.
+    result = result.edit(0, 0, "\n  \n")
+    assert dump(result.modules) == dump(_parse_modules(SOURCE))
+
+
+def test_random_edits_match_full_parse():
+    rng = random.Random(7)
+    snippets = ["", " ", "VAR z : boolean;", "ASSIGN init(z) := TRUE;", "MODULE m"]
+    snippets += ["x", ";", "VAR", "MODULE", "boolean", "ready"]
+    result = parse_incremental(SOURCE)
+    for _ in range(300):
+        offset = rng.randrange(len(result.text) + 1)
+        length = rng.randrange(min(6, len(result.text) - offset) + 1)
+        new_text = rng.choice(snippets)
+        text = result.text[:offset] + new_text + result.text[offset + length :]
+        try:
+            expected = dump(_parse_modules(text))
+        except Exception:
+            with pytest.raises(Exception):
+                result.edit(offset, length, new_text)
+            continue
+        result = result.edit(offset, length, new_text)
+        assert result.text == text
+        assert dump(result.modules) == expected
+        assert dump(result.modules) == dump(parse_incremental(text).modules)
@@ -0,0 +1,49 @@
+import io
+import json
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.json_stream import to_json
+from py_nusmv_parser.models import Const, Identifier
+
+from .test_models import DEMO
+from .test_parser import make_model
+
+
+def dumps(node, indent=None):
+    stream = io.StringIO()
+    node.to_json(stream, indent=indent)
+    return stream.getvalue()
+
+
+def test_matches_json_dumps():
+    for module in (
+        parse_nusmv_string(DEMO + "\nASSIGN n := 1..4;"),
+        parse_nusmv_string(make_model(300)),
+    ):
+        for indent in (None, 0, 2, "\t"):
+            assert dumps(module, indent) == json.dumps(module.to_dict(), indent=indent)
+
+
+def test_values():
+    class Noted(Identifier):
+        pass
+
+    node = Noted('é\n"x"')
+    node.extra = [[], {}, {1: None, "k": [1.5, float("nan")]}, (True, False), {"s"}]
+    node.const = Const((1, 2), "range")
+    for indent in (None, 4):
+        stream = io.StringIO()
+        to_json([node, []], stream, indent=indent)
+        expected = json.dumps([node.to_dict(), []], indent=indent)
+        assert stream.getvalue() == expected
+
+
+def test_deep_chain():
+    n = 20_000
+    source = "MODULE main ASSIGN x := " + " & ".join(f"v{i}" for i in range(n)) + ";"
+    text = dumps(parse_nusmv_string(source))
+    assert text.count('"BinaryOperator"') == n - 1
+    assert '"left": {"_cls": "Identifier", "name": "v0"}' in text
+    assert text.endswith(
+        '"name": "v19999"}' + "}" * (n - 1) + ', "modifier": "none"}]}]}'
+    )
@@ -0,0 +1,198 @@
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.models import (
+    Assign,
+    BinaryOperator,
+    ComplexIdentifier,
+    Const,
+    Identifier,
+)
+
+DEMO = """
+MODULE main
+VAR
+    request : boolean;
+    state   : {ready, busy};
+ASSIGN
+    init(state) := ready;
+    next(state) := case
+                        state = ready & request = TRUE : busy;
+                        TRUE : {ready, busy};
+                   esac;
+"""
+
+
+def iter_nodes(node):
+    stack = [node]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, list):
+            stack.extend(obj)
+        elif hasattr(obj, "to_dict"):
+            yield obj
+            stack.extend(getattr(obj, f) for f in obj.__slots__)
+
+
+def test_nodes_are_slotted():
+    module = parse_nusmv_string(DEMO)
+    nodes = list(iter_nodes(module))
+    assert len(nodes) > 20
+    assert not any(hasattr(n, "__dict__") for n in nodes)
+
+
+def test_to_dict_field_order():
+    node = ComplexIdentifier(Identifier("a"), Identifier("b"), "field")
+    assert list(node.to_dict()) == ["_cls", "item", "type", "target"]
+    assign = Assign(Identifier("x"), BinaryOperator(Const(1, "integer"), "+", Identifier("y")))
+    assert assign.to_dict() == {
+        "_cls": "Assign",
+        "target": {"_cls": "Identifier", "name": "x"},
+        "expr": {
+            "_cls": "BinaryOperator",
+            "left": {"_cls": "Const", "value": 1, "type": "integer"},
+            "operator": "+",
+            "right": {"_cls": "Identifier", "name": "y"},
+        },
+        "modifier": "none",
+    }
+
+
+def test_operator_chains_nest_to_the_right():
+    module = parse_nusmv_string("MODULE main ASSIGN x := a & b = c + d + e & f;")
+    expr = module.body[0].assigns_list[0].expr
+    assert (
+        expr.to_dict()
+        == BinaryOperator(
+            Identifier("a"),
+            "&",
+            BinaryOperator(
+                BinaryOperator(
+                    Identifier("b"),
+                    "=",
+                    BinaryOperator(
+                        Identifier("c"),
+                        "+",
+                        BinaryOperator(Identifier("d"), "+", Identifier("e")),
+                    ),
+                ),
+                "&",
+                Identifier("f"),
+            ),
+        ).to_dict()
+    )
+    # Same-operator chains are written without parentheses and parse back to
+    # the same tree.
+    assert expr.unparse() == "a & b = c + d + e & f"
+    reparsed = parse_nusmv_string(f"MODULE main ASSIGN x := {expr.unparse()};")
+    assert reparsed.body[0].assigns_list[0].expr.to_dict() == expr.to_dict()
+    mixed = BinaryOperator(
+        Identifier("a"), "=", BinaryOperator(Identifier("b"), "=", Identifier("c"))
+    )
+    assert mixed.unparse() == "a = (b = c)"
+
+
+def test_case_and_set_operands_round_trip():
+    source = """
+MODULE main
+ASSIGN
+    next(a) := (case b : 1; TRUE : 2; esac) = a;
+    next(b) := case a = (case b : x; TRUE : y; esac) : ({x, y}) + 1; TRUE : b; esac;
+"""
+    module = parse_nusmv_string(source)
+    text = module.unparse()
+    assert "a = (\n" in text and "({x, y}) + 1" in text
+    assert "".join(module.iter_unparse()) == text
+    reparsed = parse_nusmv_string(text)
+    assert reparsed.to_dict() == module.to_dict()
+    assert reparsed.unparse() == text
+
+
+def test_deep_chains_do_not_recurse():
+    n = 20_000
+    source = "MODULE main ASSIGN x := " + " & ".join(f"v{i}" for i in range(n)) + ";"
+    module = parse_nusmv_string(source)
+    expr = module.body[0].assigns_list[0].expr
+    text = expr.unparse()
+    assert text == " & ".join(f"v{i}" for i in range(n))
+    d = module.to_dict()["body"][0]["assigns_list"][0]["expr"]
+    depth = 0
+    while d["_cls"] == "BinaryOperator":
+        depth += 1
+        d = d["right"]
+    assert depth == n - 1 and d == {"_cls": "Identifier", "name": f"v{n - 1}"}
+
+
+def test_iter_indent_4_matches_indent_4():
+    import random
+
+    from py_nusmv_parser.models import indent_4, iter_indent_4
+
+    rng = random.Random(3)
+    alphabet = ["a", "b", " ", "  ", "\n", "\n\n", "\t", "\r\n", ";", "\x0b", "\x85"]
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randrange(30)))
+        cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, 4)))
+        chunks = [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+        assert "".join(iter_indent_4(chunks)) == indent_4(text)
+
+
+def test_unparse_to_stream_matches_unparse():
+    import io
+
+    from .test_parser import make_model
+
+    module = parse_nusmv_string(DEMO + "\nVAR x : boolean;\nASSIGN x := {a, b = c};")
+    big = parse_nusmv_string(make_model(200))
+    nested = parse_nusmv_string(
+        "MODULE m DEFINE d := case a : case b : 1; TRUE : 2; esac; TRUE : 0; esac;"
+    )
+    for node in (module, big, nested):
+        stream = io.StringIO()
+        node.unparse_to(stream)
+        assert stream.getvalue() == node.unparse()
+        assert "".join(node.iter_unparse()) == node.unparse()
+    assert module.unparse().startswith("\nMODULE main\n\nVAR\n    request : boolean ;")
+
+
+def test_from_dict_round_trip():
+    import json
+
+    from py_nusmv_parser.models import from_dict
+
+    from .test_parser import make_model
+
+    source = DEMO + "\nASSIGN n := 1..4;"
+    for module in (parse_nusmv_string(source), parse_nusmv_string(make_model(50))):
+        data = module.to_dict()
+        rebuilt = from_dict(json.loads(json.dumps(data)))
+        assert rebuilt.unparse() == module.unparse()
+        assert rebuilt.to_dict() == data
+    range_const = parse_nusmv_string(source).body[-1].assigns_list[0].expr
+    assert from_dict(range_const.to_dict()).value == (1, 4)
+
+
+def test_from_dict_deep_chain():
+    from py_nusmv_parser.models import from_dict
+
+    n = 5_000
+    source = "MODULE main ASSIGN x := " + " + ".join(f"v{i}" for i in range(n)) + ";"
+    module = parse_nusmv_string(source)
+    rebuilt = from_dict(module.to_dict())
+    assert rebuilt.unparse() == module.unparse()
+
+
+def test_to_dict_unslotted_subclass():
+    from py_nusmv_parser.models import from_dict
+
+    class Tagged(Identifier):
+        pass
+
+    node = Tagged("x")
+    node.note = Const(1, "integer")
+    data = node.to_dict()
+    assert data == {
+        "_cls": "Tagged",
+        "name": "x",
+        "note": {"_cls": "Const", "value": 1, "type": "integer"},
+    }
+    rebuilt = from_dict(data)
+    assert type(rebuilt) is Tagged and rebuilt.note.value == 1
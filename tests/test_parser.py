@@ -0,0 +1,144 @@
+from py_nusmv_parser import parse_nusmv_string
+
+
+def make_model(n):
+    lines = ["MODULE main", "VAR"]
+    lines += [f"    v{i} : {{s{i}, t{i}}};" for i in range(n)]
+    lines.append("ASSIGN")
+    lines += [f"    init(v{i}) := s{i};" for i in range(n)]
+    lines.append("    next(v0) := case")
+    lines += [f"        v{i} = s{i} : {{s0, t0}};" for i in range(n)]
+    lines.append("    esac;")
+    return "\n".join(lines)
+
+
+def test_list_productions_keep_order():
+    module = parse_nusmv_string(make_model(50))
+    var_decl, assigns = module.body
+    assert [v.identifier.name for v in var_decl.var_list] == [
+        f"v{i}" for i in range(50)
+    ]
+    assert [a.target.name for a in assigns.assigns_list[:-1]] == [
+        f"v{i}" for i in range(50)
+    ]
+    case_body = assigns.assigns_list[-1].expr.case_body
+    assert [c.condition.left.name for c in case_body] == [f"v{i}" for i in range(50)]
+    assert len(var_decl.var_list[3].type_specifier.body) == 2
+
+
+def test_import_has_no_side_effects(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    import py_nusmv_parser
+
+    src = os.path.dirname(os.path.dirname(py_nusmv_parser.__file__))
+    out = subprocess.run(
+        [sys.executable, "-c", "import py_nusmv_parser.parser"],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": src},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout == ""
+    assert os.listdir(tmp_path) == []
+
+
+def test_concurrent_parsing_with_pool():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from py_nusmv_parser import ParserPool
+
+    pool = ParserPool(size=3)
+    sizes = [5, 40, 120, 7, 300, 60] * 4
+
+    def parse(n):
+        module = pool.parse(make_model(n))
+        return len(module.body[0].var_list)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(parse, sizes)) == sizes
+    assert pool._created <= 3
+
+
+def test_pool_acquire_timeout():
+    import pytest
+
+    from py_nusmv_parser import ParserPool
+
+    pool = ParserPool(size=1)
+    with pool.borrow():
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+    assert pool.parse("MODULE main VAR a : boolean;").name.name == "main"
+
+
+def test_iter_modules(tmp_path):
+    from py_nusmv_parser import iter_modules
+
+    source = (
+        "MODULE counter\nVAR x : boolean;\n"
+        "MODULE main VAR MODULEx : boolean; c : counter(MODULEx);\n"
+        "ASSIGN init(MODULEx) := TRUE;\n\n"
+    )
+    names = [m.name.name for m in iter_modules(source)]
+    assert names == ["counter", "main"]
+
+    path = tmp_path / "many.smv"
+    path.write_text(
+        "\n".join(make_model(i + 1).replace("main", f"m{i}") for i in range(5))
+    )
+    with open(path) as f:
+        modules = iter_modules(f)
+        first = next(modules)
+        assert first.name.name == "m0"
+        assert [len(m.body[0].var_list) for m in modules] == [2, 3, 4, 5]
+
+
+def test_interning_shares_leaves():
+    source = make_model(10) + "\nASSIGN v1 := v0 = s0 & v0 = s0;"
+    plain = parse_nusmv_string(source)
+    interned = parse_nusmv_string(source, intern=True)
+    assert interned.to_dict() == plain.to_dict()
+    assert interned.unparse() == plain.unparse()
+
+    case_body = interned.body[1].assigns_list[10].expr.case_body
+    v0_refs = [case_body[0].condition.left, interned.body[1].assigns_list[0].target]
+    assert v0_refs[0] is v0_refs[1]
+    conj = interned.body[2].assigns_list[0].expr
+    assert conj.left is not conj.right
+    assert conj.left.left is conj.right.left
+
+    consed = parse_nusmv_string(source, hash_cons=True)
+    conj = consed.body[2].assigns_list[0].expr
+    assert conj.left is conj.right
+    assert consed.to_dict() == plain.to_dict()
+
+    # Interning is per parse.
+    again = parse_nusmv_string(source, intern=True)
+    assert again.body[0].var_list[0].identifier is not v0_refs[0]
+    assert parse_nusmv_string(source).body[0].var_list[0].identifier is not (
+        plain.body[0].var_list[0].identifier
+    )
+
+
+def test_define_declaration():
+    source = """MODULE main
+VAR
+    a : boolean;
+DEFINE
+    b := a & TRUE;
+    c := b = a;
+ASSIGN
+    next(a) := c;
+"""
+    module = parse_nusmv_string(source)
+    define = module.body[1]
+    assert [d.identifier.name for d in define.define_list] == ["b", "c"]
+    assert define.define_list[1].expr.unparse() == "b = a"
+    text = module.unparse()
+    assert "DEFINE\n    b := a & TRUE;\n    c := b = a;" in text
+    assert parse_nusmv_string(text).unparse() == text
+    assert module.symbols.define("c") is define.define_list[1]
@@ -0,0 +1,83 @@
+import pytest
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser import reachability
+from py_nusmv_parser.reachability import StateSpace, reachable
+
+SOURCE = """
+MODULE main
+VAR
+    state : {ready, busy};
+    request : boolean;
+    n : {0, 1, 2, 3};
+DEFINE
+    idle := state = ready;
+ASSIGN
+    init(state) := ready;
+    init(n) := 0;
+    next(state) := case
+                       state = busy & request : ready;
+                       request : busy;
+                       TRUE : state;
+                   esac;
+    next(n) := case
+                   idle : {0, 1};
+                   n = 2 : 0;
+                   TRUE : n + 1;
+               esac;
+"""
+
+
+@pytest.fixture
+def module():
+    return parse_nusmv_string(SOURCE)
+
+
+def test_state_space_packing(module):
+    space = StateSpace(module)
+    assert space.bits == 1 + 1 + 2
+    assert space.size() == 16
+    for values in (("ready", False, 0), ("busy", True, 3)):
+        assert space.unpack(space.pack(values)) == values
+    with pytest.raises(ValueError, match="'n'"):
+        space.pack(("ready", False, 4))
+
+
+def test_reachable_states(module):
+    # `n` never reaches 3.
+    result = reachable(module)
+    assert (result.states, result.depth, result.complete) == (12, 2, True)
+    assert result.violations == []
+
+
+def test_invariant_violations(module):
+    never_three = "case n = 3 : FALSE; TRUE : TRUE; esac"
+    result = reachable(module, [never_three, "state = ready"])
+    assert len(result.violations) == 1
+    violation = result.violations[0]
+    assert violation.invariant == "state = ready"
+    assert violation.depth == 1
+    assert violation.state["state"] == "busy"
+
+
+def test_max_states(module):
+    result = reachable(module, max_states=3)
+    assert not result.complete
+    assert result.states < 12
+
+
+def test_hash_set_and_workers(module, monkeypatch):
+    expected = reachable(module, ["state = ready"])
+    monkeypatch.setattr(reachability, "_BITMAP_BITS", 0)
+    monkeypatch.setattr(reachability, "_MIN_PARALLEL_FRONTIER", 1)
+    result = reachable(module, ["state = ready"], workers=2)
+    assert (result.states, result.depth) == (expected.states, expected.depth)
+    assert result.violations[0].depth == expected.violations[0].depth
+
+
+def test_out_of_range():
+    module = parse_nusmv_string(
+        "MODULE main VAR n : {0, 1}; ASSIGN init(n) := 0; next(n) := n + 1;"
+    )
+    with pytest.raises(ValueError, match="'n'"):
+        reachable(module)
@@ -0,0 +1,62 @@
+import pytest
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.models import BinaryOperator, Identifier, SetExpr
+from py_nusmv_parser.simplify import simplify
+
+
+def simplified(expr: str) -> str:
+    module = parse_nusmv_string(f"MODULE main ASSIGN x := {expr};")
+    return simplify(module).body[0].assigns_list[0].expr.unparse()
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        ("TRUE & a", "a"),
+        ("a & TRUE & b", "a & b"),
+        ("a & FALSE & b", "FALSE"),
+        ("a & a", "a"),
+        ("a = b & a = b & c", "a = b & c"),
+        ("a = a", "TRUE"),
+        ("3 = 3 & 2 = 3", "FALSE"),
+        ("1 + 2 + 3", "6"),
+        ("1 + 2 + n + 3 + 4", "n + 10"),
+        ("n + 0", "n"),
+        ("(a & b) & c", "(a & b) & c"),
+        ("{a, b, a}", "{a, b}"),
+        ("{a, a}", "a"),
+        (
+            "case FALSE : a; b : c; TRUE : d; e : f; esac",
+            "case b : c ; TRUE : d ; esac",
+        ),
+        ("case a = a : b; TRUE : c; esac", "b"),
+    ],
+)
+def test_rules(expr, expected):
+    assert " ".join(simplified(expr).split()) == expected
+
+
+def test_nondeterministic_operands_are_kept():
+    choice = SetExpr([Identifier("a"), Identifier("b")])
+    expr = BinaryOperator(choice, "=", SetExpr([Identifier("a"), Identifier("b")]))
+    assert simplify(expr) is expr
+
+
+def test_copy_and_in_place():
+    source = "MODULE main ASSIGN x := TRUE & a; y := b;"
+    module = parse_nusmv_string(source)
+    before = module.unparse()
+    result = simplify(module)
+    assert module.unparse() == before
+    assert result.body[0].assigns_list[1] is module.body[0].assigns_list[1]
+    assert simplify(module, copy=False) is module
+    assert module.unparse() == result.unparse()
+    assert parse_nusmv_string(result.unparse()).unparse() == result.unparse()
+
+
+def test_long_chain():
+    n = 20_000
+    expr = " & ".join(["TRUE"] * n + ["a"])
+    assert simplified(expr) == "a"
+    assert simplified(" + ".join(["1"] * n)) == str(n)
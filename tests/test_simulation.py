@@ -0,0 +1,69 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.simulation import Simulator, load_trace
+
+SOURCE = """
+MODULE main
+VAR
+    state : {ready, busy};
+    request : boolean;
+    n : {0, 1, 2};
+DEFINE
+    idle := state = ready;
+ASSIGN
+    init(state) := ready;
+    next(state) := case
+                       idle & request : busy;
+                       TRUE : ready;
+                   esac;
+    init(n) := 0;
+    next(n) := case
+                   n = 2 : 0;
+                   TRUE : n + 1;
+               esac;
+"""
+
+
+def test_states():
+    sim = Simulator(parse_nusmv_string(SOURCE), runs=200, seed=7)
+    ready, busy = sim.codes["ready"], sim.codes["busy"]
+    states = list(sim.states(6))
+    assert len(states) == 7
+    assert (states[0]["state"] == ready).all() and (states[0]["n"] == 0).all()
+    for before, after in zip(states, states[1:]):
+        assert ((after["n"] == (before["n"] + 1) % 3)).all()
+        expected = np.where(before["idle"] & before["request"], busy, ready)
+        assert (after["state"] == expected).all()
+        assert (after["idle"] == (after["state"] == ready)).all()
+    # `request` is free: both values show up.
+    assert set(np.concatenate([s["request"] for s in states]).tolist()) == {0, 1}
+
+
+def test_trace_file(tmp_path):
+    module = parse_nusmv_string(SOURCE)
+    path = tmp_path / "trace.bin"
+    header = Simulator(module, runs=50, seed=3).write_trace(path, 20)
+    loaded, values = load_trace(path)
+    assert loaded == header
+    assert loaded["variables"] == ["state", "request", "n"]
+    assert values.shape == (21, 3, 50)
+    # The same seed gives the same runs.
+    states = list(Simulator(module, runs=50, seed=3).states(20))
+    assert (values[20, 2] == states[20]["n"]).all()
+    assert (values[:, 1] == np.stack([s["request"] for s in states])).all()
+
+
+def test_errors():
+    out_of_range = SOURCE.replace("TRUE : n + 1;", "TRUE : n + 3;")
+    sim = Simulator(parse_nusmv_string(out_of_range), runs=10, seed=0)
+    with pytest.raises(ValueError):
+        list(sim.states(3))
+    circular = SOURCE + "DEFINE\n    a := b;\n    b := a;\n"
+    with pytest.raises(ValueError):
+        Simulator(parse_nusmv_string(circular))
+    undeclared = SOURCE + "    next(other) := TRUE;\n"
+    with pytest.raises(ValueError):
+        Simulator(parse_nusmv_string(undeclared))
@@ -0,0 +1,89 @@
+import pytest
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.slicing import cone_of_influence, dependency_graph, slice_module
+
+SOURCE = """
+MODULE main
+VAR
+    request : boolean;
+    state : {ready, busy};
+    counter : {zero, one};
+    noise : boolean;
+    echo : boolean;
+ASSIGN
+    init(state) := ready;
+    next(state) := case
+                        request = TRUE : busy;
+                        TRUE : ready;
+                   esac;
+    next(counter) := case
+                        state = busy : one;
+                        TRUE : counter;
+                     esac;
+    next(noise) := {TRUE, FALSE};
+VAR
+    sub : boolean;
+ASSIGN
+    next(echo) := noise & sub.flag;
+"""
+
+
+def test_dependency_graph():
+    graph = dependency_graph(parse_nusmv_string(SOURCE))
+    assert graph == {
+        "request": set(),
+        "state": {"request"},
+        "counter": {"state", "counter"},
+        "noise": set(),
+        "echo": {"noise", "sub"},
+        "sub": set(),
+    }
+
+
+def test_slice():
+    module = parse_nusmv_string(SOURCE)
+    assert cone_of_influence(module, ["counter"]) == {"counter", "state", "request"}
+    sliced = slice_module(module, ["counter"])
+    text = sliced.unparse()
+    assert "noise" not in text and "echo" not in text and "sub" not in text
+    reparsed = parse_nusmv_string(text)
+    assert reparsed.unparse() == text
+    assert set(reparsed.symbols) == {"request", "state", "counter"}
+    # The input module is left alone.
+    assert "echo" in module.unparse()
+
+    assert set(slice_module(module, ["echo"]).symbols) == {"echo", "noise", "sub"}
+    with pytest.raises(ValueError):
+        slice_module(module, ["missing"])
+
+
+def test_slice_through_defines():
+    module = parse_nusmv_string(
+        SOURCE + "DEFINE\n    busy := state = busy;\n    quiet := noise;\n"
+        "ASSIGN\n    next(request) := busy;\n"
+    )
+    assert dependency_graph(module)["busy"] == {"state"}
+    assert cone_of_influence(module, ["request"]) == {"request", "busy", "state"}
+    text = slice_module(module, ["request"]).unparse()
+    assert "busy := state = busy;" in text and "quiet" not in text
+
+
+def test_slice_through_module_parameters():
+    module = parse_nusmv_string(
+        """
+MODULE main
+VAR
+    x : boolean;
+    y : boolean;
+    z : boolean;
+    c : counter(x);
+ASSIGN
+    next(y) := c.out;
+"""
+    )
+    assert dependency_graph(module)["c"] == {"x"}
+    text = slice_module(module, ["y"]).unparse()
+    reparsed = parse_nusmv_string(text)
+    assert set(reparsed.symbols) == {"x", "y", "c"}
+    assert reparsed.symbols["c"].declaration.type_specifier.unparse() == "counter(x)"
@@ -0,0 +1,85 @@
+from py_nusmv_parser import codec, parse_nusmv_string
+from py_nusmv_parser.models import Assign, Const, Identifier, VarDeclItem, from_dict
+from py_nusmv_parser.slicing import slice_module
+from py_nusmv_parser.visitor import NodeTransformer
+
+from .test_models import DEMO
+
+
+def test_lookup():
+    module = parse_nusmv_string(DEMO + "\nASSIGN other := TRUE;")
+    symbols = module.symbols
+    assert module.symbols is symbols
+    assert set(symbols) == {"request", "state", "other"}
+    state = symbols["state"]
+    assert state.declaration is module.body[0].var_list[1]
+    assert state.type.unparse() == "{ready, busy}"
+    assert [a.expr.unparse() for a in state.assigns["init"]] == ["ready"]
+    assert len(symbols.assigns("state", "next")) == 1
+    assert symbols.assigns("state", "none") == []
+    assert symbols.declaration("other") is None
+    assert symbols.assigns("other", "none")[0].expr.value is True
+    assert symbols.type_of("request").unparse() == "boolean"
+    assert symbols.get("missing") is None and "missing" not in symbols
+
+
+def test_invalidation():
+    module = parse_nusmv_string(DEMO)
+    symbols = module.symbols
+    # Building and changing other trees leaves the index alone.
+    parse_nusmv_string(DEMO).body[0].var_list.pop()
+    assert module.symbols is symbols
+
+    var_list = module.body[0].var_list
+    var_list.append(VarDeclItem(Identifier("extra"), Const(True, "boolean")))
+    assert "extra" in module.symbols
+    assert slice_module(module, ["extra"]).symbols.declaration("extra")
+    symbols = module.symbols
+    assert module.symbols is symbols
+
+    module.body[1].assigns_list = [Assign(Identifier("x"), Const(1, "integer"))]
+    assert set(module.symbols) == {"request", "state", "extra", "x"}
+    module.body.append(parse_nusmv_string("MODULE m VAR y : boolean;").body[0])
+    assert "y" in module.symbols
+    del module.body[-1]
+    assert "y" not in module.symbols
+
+    # Renaming in place keeps every list, so it needs an explicit call.
+    symbols = module.symbols
+    module.body[1].assigns_list[0].target.name = "request"
+    assert module.symbols is symbols
+    module.invalidate_symbols()
+    assert module.symbols.assigns("request", "none")
+    assert "x" not in module.symbols
+
+
+def test_transformer_invalidates():
+    class Rename(NodeTransformer):
+        def visit_Identifier(self, node):
+            return Identifier("renamed") if node.name == "state" else node
+
+    module = parse_nusmv_string(DEMO)
+    symbols = module.symbols
+    Rename(copy=True).visit(module)
+    assert module.symbols is symbols
+    Rename().visit(module)
+    assert "renamed" in module.symbols and "state" not in module.symbols
+
+    # Whatever the transform is rooted at.
+    module = parse_nusmv_string(DEMO)
+    assert module.symbols.declaration("state") is not None
+    Rename().visit(module.body[0])
+    assert module.symbols.declaration("renamed") is not None
+    assert module.symbols.declaration("state") is None
+    Rename().visit(module.body[1].assigns_list[1])
+    assert [a.expr.unparse() for a in module.symbols.assigns("renamed", "next")]
+    symbols = module.symbols
+    Rename().visit(module.body[0])
+    assert module.symbols is symbols
+
+
+def test_rebuilt_trees():
+    module = parse_nusmv_string(DEMO)
+    for rebuilt in (from_dict(module.to_dict()), codec.loads(codec.dumps(module))):
+        assert set(rebuilt.symbols) == {"request", "state"}
+        assert type(rebuilt.body[0].var_list) is list
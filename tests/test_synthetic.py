@@ -0,0 +1,30 @@
+import pytest
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.models import CaseExpr, VarDeclaration
+from py_nusmv_parser.synthetic import generate_model
+from py_nusmv_parser.visitor import walk
+
+
+@pytest.mark.parametrize(
+    "variables, enum_width, case_branches, depth",
+    [(1, 1, 1, 0), (8, 5, 4, 2), (20, 2, 1, 3)],
+)
+def test_generated_models_parse(variables, enum_width, case_branches, depth):
+    source = generate_model(variables, enum_width, case_branches, depth)
+    module = parse_nusmv_string(source)
+    nodes = list(walk(module))
+    assert sum(len(n.var_list) for n in nodes if isinstance(n, VarDeclaration)) == (
+        variables
+    )
+    cases = [n for n in nodes if isinstance(n, CaseExpr)]
+    assert len(cases) == variables - variables // 4
+    assert all(len(case.case_body) == case_branches for case in cases)
+    assert parse_nusmv_string(module.unparse()).to_dict() == module.to_dict()
+
+
+def test_generate_model_is_deterministic():
+    assert generate_model(30, seed=1) == generate_model(30, seed=1)
+    assert generate_model(30, seed=1) != generate_model(30, seed=2)
+    with pytest.raises(ValueError):
+        generate_model(0)
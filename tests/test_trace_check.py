@@ -0,0 +1,130 @@
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.trace_check import TraceChecker, check_trace
+
+SOURCE = """
+MODULE main
+VAR
+    state : {ready, busy};
+    request : boolean;
+    n : {0, 1, 2};
+DEFINE
+    idle := state = ready;
+ASSIGN
+    init(state) := ready;
+    next(state) := case
+                       state = busy & request : ready;
+                       request : busy;
+                       TRUE : state;
+                   esac;
+    next(n) := case
+                   idle : {0, 1};
+                   n = 2 : 0;
+                   TRUE : n + 1;
+               esac;
+"""
+
+TRACE = """*** This is NuSMV 2.6.0
+-- specification AG state = ready  is false
+-- as demonstrated by the following execution sequence
+Trace Description: CTL Counterexample
+Trace Type: Counterexample
+  -> State: 1.1 <-
+    state = ready
+    request = TRUE
+    n = 0
+    idle = TRUE
+  -> State: 1.2 <-
+    state = busy
+    request = FALSE
+    n = 1
+    idle = FALSE
+  -> State: 1.3 <-
+    n = 2
+  -- Loop starts here
+  -> State: 1.4 <-
+    n = 0
+"""
+
+
+def checker():
+    return TraceChecker(parse_nusmv_string(SOURCE))
+
+
+def test_valid_trace(tmp_path):
+    assert checker().check(TRACE.splitlines()) is None
+    path = tmp_path / "trace.txt"
+    path.write_text(TRACE)
+    assert check_trace(parse_nusmv_string(SOURCE), path) is None
+    # Defines left out of the trace are computed.
+    without_defines = [l for l in TRACE.splitlines() if "idle" not in l]
+    assert checker().check(without_defines) is None
+
+
+def test_violations():
+    violation = checker().check(TRACE.replace("n = 0\n", "n = 1\n", 2).splitlines())
+    assert (violation.state, violation.step, violation.kind) == ("1.4", 3, "next")
+    assert violation.name == "n" and violation.actual == 1
+    assert str(violation).startswith("State 1.4: next(n) is 1, not case idle")
+
+    violation = checker().check(
+        TRACE.replace("state = ready", "state = busy").splitlines()
+    )
+    assert (violation.state, violation.kind, violation.name) == (
+        "1.1",
+        "define",
+        "idle",
+    )
+    violation = checker().check(
+        TRACE.replace("state = ready", "state = busy")
+        .replace("idle = TRUE", "")
+        .splitlines()
+    )
+    assert (violation.state, violation.kind, violation.name) == ("1.1", "init", "state")
+
+    violation = checker().check(TRACE.replace("    n = 0\n", "", 1).splitlines())
+    assert (violation.kind, violation.name) == ("missing", "n")
+    # A set only has to contain the value: 0 is fine in 1.2, 2 is not.
+    other = TRACE.replace("n = 1\n", "n = 0\n", 1)
+    assert checker().check(other.splitlines()).state == "1.3"
+    other = TRACE.replace("n = 1\n", "n = 2\n", 1)
+    assert checker().check(other.splitlines()).state == "1.2"
+
+
+def test_no_case_condition():
+    source = """
+MODULE main
+VAR
+    n : {0, 1, 2};
+ASSIGN
+    init(n) := 0;
+    next(n) := case n = 0 : 1; n = 1 : 2; esac;
+"""
+    trace = ["-> State: 1.1 <-", "n = 0", "-> State: 1.2 <-", "n = 1"]
+    trace += ["-> State: 1.3 <-", "n = 2"]
+    assert TraceChecker(parse_nusmv_string(source)).check(trace) is None
+    violation = TraceChecker(parse_nusmv_string(source)).check(
+        trace + ["-> State: 1.4 <-", "n = 0"]
+    )
+    assert (violation.state, violation.kind, violation.name) == ("1.4", "no case", "n")
+    assert str(violation) == "State 1.4: no case condition holds for n"
+
+    define = "DEFINE low := case n = 0 : TRUE; n = 1 : FALSE; esac;"
+    module = parse_nusmv_string(source.replace("ASSIGN", define + "\nASSIGN"))
+    violation = TraceChecker(module).check(trace)
+    assert (violation.state, violation.kind, violation.name) == (
+        "1.3",
+        "no case",
+        "low",
+    )
+
+
+def test_long_trace_streams():
+    def lines():
+        yield "Trace Description: Simulation"
+        yield "-> State: 1.1 <-"
+        yield from ["state = ready", "request = FALSE", "n = 0"]
+        for i in range(2, 50_000):
+            yield f"-> State: 1.{i} <-"
+            yield "n = 0" if i % 2 else "n = 1"
+
+    assert checker().check(lines()) is None
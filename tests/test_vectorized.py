@@ -0,0 +1,81 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.vectorized import EnumCodes, evaluate_batch
+
+SOURCE = """
+MODULE main
+VAR
+    state : {ready, busy};
+    request : boolean;
+    n : {0, 1, 2};
+ASSIGN
+    next(state) := case
+                       state = busy & request : ready;
+                       request : busy;
+                       TRUE : state;
+                   esac;
+    next(n) := n + 1 = 2;
+    cell := grid[n];
+    pick := {ready, busy};
+    size := 1..3;
+"""
+
+
+def exprs():
+    module = parse_nusmv_string(SOURCE)
+    return module, {a.target.unparse(): a.expr for a in module.body[1].assigns_list}
+
+
+def test_enum_codes():
+    module, _ = exprs()
+    codes = EnumCodes.from_module(module)
+    # Symbolic codes stay clear of the integer values.
+    assert codes.codes == {"ready": 3, "busy": 4}
+    column = codes.encode(["busy", "ready", 2])
+    assert column.tolist() == [4, 3, 2]
+    assert codes.decode(column) == ["busy", "ready", 2]
+
+
+def test_evaluate_batch():
+    module, by_target = exprs()
+    codes = EnumCodes.from_module(module)
+    states = [
+        ("ready", True, 0),
+        ("busy", True, 1),
+        ("busy", False, 2),
+        ("ready", False, 1),
+    ]
+    columns = {
+        "state": codes.encode([s for s, _, _ in states]),
+        "request": np.array([r for _, r, _ in states]),
+        "n": np.array([n for _, _, n in states]),
+    }
+    columns.update({f"grid[{k}]": np.full(4, 10 * k) for k in range(3)})
+
+    state = evaluate_batch(by_target["state"], columns, codes)
+    assert codes.decode(state) == ["busy", "ready", "busy", "ready"]
+    assert evaluate_batch(by_target["n"], columns).tolist() == [0, 1, 0, 1]
+    assert evaluate_batch(by_target["cell"], columns).tolist() == [0, 10, 20, 10]
+
+    rng = np.random.default_rng(0)
+    picks = evaluate_batch(by_target["pick"], columns, codes, rng)
+    assert set(picks.tolist()) <= {3, 4}
+    sizes = evaluate_batch(by_target["size"], columns, codes, rng)
+    assert set(sizes.tolist()) <= {1, 2, 3}
+    with pytest.raises(ValueError):
+        evaluate_batch(by_target["pick"], columns, codes)
+
+
+def test_errors():
+    module, by_target = exprs()
+    columns = {"state": np.zeros(2, np.int64), "request": np.zeros(2, bool)}
+    with pytest.raises(ValueError):
+        evaluate_batch(by_target["state"], columns)
+    uncovered = parse_nusmv_string("MODULE m ASSIGN x := case request : 1; esac;")
+    with pytest.raises(ValueError):
+        evaluate_batch(uncovered.body[0].assigns_list[0].expr, columns)
+    with pytest.raises(ValueError):
+        evaluate_batch(by_target["n"], {"n": np.zeros(2), "m": np.zeros(3)})
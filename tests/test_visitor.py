@@ -0,0 +1,117 @@
+from py_nusmv_parser import parse_nusmv_string
+from py_nusmv_parser.models import BinaryOperator, Const, Expr, Identifier
+from py_nusmv_parser.visitor import (
+    SKIP,
+    NodeTransformer,
+    NodeVisitor,
+    iter_child_nodes,
+    iter_fields,
+    walk,
+)
+
+from .test_models import DEMO, iter_nodes
+
+
+def test_walk_and_fields():
+    module = parse_nusmv_string(DEMO)
+    nodes = list(walk(module))
+    assert nodes[0] is module
+    assert {id(n) for n in nodes} == {id(n) for n in iter_nodes(module)}
+    assert [n.name for n in nodes if type(n) is Identifier][:3] == [
+        "main",
+        "request",
+        "state",
+    ]
+    assert [name for name, _ in iter_fields(module)] == ["name", "body"]
+    assert list(iter_child_nodes(module)) == [module.name, *module.body]
+
+
+def test_visitor_dispatch():
+    class Collector(NodeVisitor):
+        def __init__(self):
+            self.events = []
+
+        def visit_Identifier(self, node):
+            self.events.append(node.name)
+
+        def visit_Expr(self, node):
+            self.events.append(type(node).__name__)
+
+        def visit_CaseExpr(self, node):
+            return SKIP
+
+        def leave_Module(self, node):
+            self.events.append("end")
+
+    collector = Collector()
+    collector.visit(parse_nusmv_string(DEMO))
+    assert collector.events == [
+        "main",
+        "request",
+        "state",
+        "Const",
+        "Const",
+        "state",
+        "ready",
+        "state",
+        "end",
+    ]
+
+
+class Rename(NodeTransformer):
+    def visit_Identifier(self, node):
+        return Identifier("mode") if node.name == "state" else node
+
+    def visit_BinaryOperator(self, node):
+        # Children are already transformed.
+        if node.operator == "=" and node.left.name == "mode":
+            return Const(True, "boolean")
+        return node
+
+
+def test_transformer_copy_on_write():
+    module = parse_nusmv_string(DEMO)
+    before = module.unparse()
+    result = Rename(copy=True).visit(module)
+    assert module.unparse() == before
+    assert "state" not in result.unparse()
+    assert "TRUE & request = TRUE : busy" in result.unparse()
+    # Untouched subtrees are shared.
+    assert result.body[0].var_list[0] is module.body[0].var_list[0]
+    assert result.body[0].var_list[1] is not module.body[0].var_list[1]
+
+
+def test_transformer_in_place_and_list_edits():
+    module = parse_nusmv_string(DEMO)
+    var_list = module.body[0].var_list
+
+    class DropRequest(NodeTransformer):
+        def visit_VarDeclItem(self, node):
+            if node.identifier.name == "request":
+                return None
+            return [node, node]
+
+    assert DropRequest().visit(module) is module
+    assert module.body[0].var_list is var_list
+    assert [v.identifier.name for v in var_list] == ["state", "state"]
+
+
+def test_deep_chain():
+    n = 20_000
+    source = "MODULE main ASSIGN x := " + " & ".join(f"v{i}" for i in range(n)) + ";"
+    module = parse_nusmv_string(source)
+    assert sum(isinstance(node, BinaryOperator) for node in walk(module)) == n - 1
+
+    class Count(NodeVisitor):
+        count = 0
+
+        def leave_Expr(self, node):
+            self.count += 1
+
+    counter = Count()
+    counter.visit(module)
+    # n operands, n - 1 operators, plus `main` and `x`.
+    assert counter.count == 2 * n + 1
+    result = Rename(copy=True).visit(module)
+    assert result is module
+    assert isinstance(result.body[0].assigns_list[0].expr, Expr)